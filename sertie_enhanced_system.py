@@ -1,23 +1,130 @@
-from flask import Flask, request, render_template_string, jsonify, send_file
+from flask import Flask, g, has_request_context, request, render_template, render_template_string, jsonify, send_file, send_from_directory, Response, stream_with_context, url_for, redirect
+from markupsafe import Markup, escape
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import func
+from sqlalchemy import and_, case, event, func, or_, table, column, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+from dataclasses import dataclass
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache, wraps
+from itertools import combinations
+from jinja2.utils import htmlsafe_json_dumps
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+import click
+import sqlite3
+import threading
+import time
+import timeit
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:  # Scoring falls back to plain Python loops
+    np = None
+try:
+    import brotli
+except ImportError:  # Responses are gzip-compressed only
+    brotli = None
+import base64
+import difflib
+import hashlib
 import json
+import math
+import mimetypes
 import os
 import io
 import csv
+import random
+import re
+import struct
+import urllib.request
+import zlib
 
 app = Flask(__name__)
 
 # Configuration
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:////home/Yankkk/mysite/mydatabase.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('SERTIE_DATABASE_URI', 'sqlite:////home/Yankkk/mysite/mydatabase.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# SQLite tuning for several judges writing at once
+app.config['SQLITE_BUSY_TIMEOUT_MS'] = 15000      # Wait this long for a lock instead of failing
+app.config['SQLITE_CACHE_SIZE_KB'] = 16384        # Page cache per connection
+app.config['SQLITE_MMAP_SIZE'] = 128 * 1024 * 1024
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 8,
+    'max_overflow': 4,
+    'pool_timeout': 30,
+    'pool_recycle': 3600,
+    'pool_pre_ping': True,
+    'connect_args': {
+        'timeout': app.config['SQLITE_BUSY_TIMEOUT_MS'] / 1000,
+        'check_same_thread': False,
+    },
+}
+app.config['PAGE_SIZE'] = 50       # Default rows per page on list pages
+app.config['MAX_PAGE_SIZE'] = 200  # Upper bound for the per_page parameter
+
 # Initialize extensions
 db = SQLAlchemy(app)
 
+@event.listens_for(Engine, 'connect')
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """Apply WAL journaling and the per-connection pragmas to every new SQLite connection"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    # Let SQLAlchemy emit BEGIN itself so write transactions can start as IMMEDIATE
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(app.config['SQLITE_BUSY_TIMEOUT_MS'])}")
+    cursor.execute(f"PRAGMA cache_size=-{int(app.config['SQLITE_CACHE_SIZE_KB'])}")
+    cursor.execute(f"PRAGMA mmap_size={int(app.config['SQLITE_MMAP_SIZE'])}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+@event.listens_for(Engine, 'begin')
+def begin_sqlite_transaction(conn):
+    """Start SQLite transactions explicitly; writers ask for BEGIN IMMEDIATE"""
+    if conn.dialect.name != 'sqlite':
+        return
+    mode = conn.get_execution_options().get('sqlite_begin', '')
+    conn.exec_driver_sql(f"BEGIN {mode}".strip())
+
+def begin_write_transaction():
+    """Take the SQLite write lock up front for the current request's session.
+
+    A deferred transaction that reads first and writes later cannot wait on the
+    busy timeout when another writer got in between, so it fails with
+    "database is locked". Starting with BEGIN IMMEDIATE makes writers queue instead.
+    Must be called before the session runs any query.
+    """
+    db.session.connection(execution_options={'sqlite_begin': 'IMMEDIATE'})
+
 # ========== Data Models ==========
+# Equality filters offered on /evaluations
+EVALUATION_FILTER_FIELDS = ('judge_role', 'decision', 'applicant_role')
+
+def evaluation_filter_indexes():
+    """One composite index per filter combination, ending with created_at so the
+    newest-first ordering is read straight off the index instead of sorted"""
+    indexes = []
+    for size in range(1, len(EVALUATION_FILTER_FIELDS) + 1):
+        for fields in combinations(EVALUATION_FILTER_FIELDS, size):
+            name = 'ix_evaluation_' + '_'.join(fields) + '_created_at'
+            indexes.append(db.Index(name, *fields, 'created_at'))
+    return tuple(indexes)
+
+# Judges resubmitting for an applicant update their evaluation in place
+EVALUATION_CURRENT_INDEX = 'uq_evaluation_applicant_judge_role'
+
 class Evaluation(db.Model):
+    __table_args__ = evaluation_filter_indexes() + (
+        db.Index(EVALUATION_CURRENT_INDEX, 'applicant_id', 'judge_role', unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     # Judge
@@ -32,16 +139,20 @@ class Evaluation(db.Model):
 
     # Scores
     resume_score = db.Column(db.Float, nullable=False)  # 0~5
-    resume_ratings = db.Column(db.Text, nullable=True)  # JSON string
-    video_ratings = db.Column(db.Text, nullable=True)   # JSON string
+    resume_ratings = db.Column(db.Text, nullable=True)  # Legacy JSON string, migrated to EvaluationRating
+    video_ratings = db.Column(db.Text, nullable=True)   # Legacy JSON string, migrated to EvaluationRating
     video_score = db.Column(db.Float, nullable=False)   # 0~5
     motivation_score = db.Column(db.Float, nullable=False, default=0.0)  # 0~5
     final_score = db.Column(db.Float, nullable=False)   # Final (0~5)
+    rubric_version = db.Column(db.Integer, nullable=True)  # Rubric the scores were computed under; NULL = client-scored
 
     # Decision & Notes
     decision = db.Column(db.String(50), nullable=False)
     notes = db.Column(db.Text, nullable=True)
 
+    # Client-supplied key that makes retried submissions return the first save
+    idempotency_key = db.Column(db.String(64), nullable=True, unique=True, index=True)
+
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
@@ -60,67 +171,467 @@ class Applicant(db.Model):
     status = db.Column(db.String(50), default='pending')  # pending, evaluated, advanced, waitlisted, rejected
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-# Initialize database
-with app.app_context():
-    # db.drop_all()  # Commented out to prevent data loss on restart
-    db.create_all()
+class EvaluationRevision(db.Model):
+    """A superseded version of an evaluation, archived when its judge resubmits"""
+    __tablename__ = 'evaluation_revision'
 
-# ========== Helper Functions ==========
-def get_video_criteria():
-    """Return the structure of video evaluation criteria"""
-    return [
-        {
-            "title": "Content Quality (25%)",
-            "items": [
-                {"id": "content_understanding", "label": "Understanding of Sertie Products and Value", "weight": 6.25},
-                {"id": "content_clarity", "label": "Clarity of Viewpoint", "weight": 6.25},
-                {"id": "content_problem_solving", "label": "Problem-Solving Approach", "weight": 6.25},
-                {"id": "content_originality", "label": "Originality and Creativity", "weight": 6.25}
-            ]
-        },
-        {
-            "title": "Presentation Skills (25%)",
-            "items": [
-                {"id": "presentation_clarity", "label": "Communication Clarity", "weight": 8.33},
-                {"id": "presentation_confidence", "label": "Confidence and Expressiveness", "weight": 8.33},
-                {"id": "presentation_structure", "label": "Structure and Organization", "weight": 8.33}
-            ]
-        }
-    ]
+    id = db.Column(db.Integer, primary_key=True)
+    evaluation_id = db.Column(db.Integer, db.ForeignKey('evaluation.id'), nullable=False, index=True)
 
-def get_resume_criteria(position):
-    """Return position-based resume evaluation criteria"""
-    base_criteria = [
-        {"id": "resume_relevance", "label": "Relevant modules or work experiences", "weight": 10},
-        {"id": "resume_extra", "label": "Additional work beyond studies or certifications", "weight": 10}
+    judge_name = db.Column(db.String(100), nullable=True)
+    evaluation_date = db.Column(db.DateTime, nullable=True)
+    applicant_name = db.Column(db.String(100), nullable=False)
+    applicant_role = db.Column(db.String(50), nullable=False)
+    resume_score = db.Column(db.Float, nullable=False)
+    video_score = db.Column(db.Float, nullable=False)
+    motivation_score = db.Column(db.Float, nullable=False, default=0.0)
+    final_score = db.Column(db.Float, nullable=False)
+    rubric_version = db.Column(db.Integer, nullable=True)
+    decision = db.Column(db.String(50), nullable=False)
+    notes = db.Column(db.Text, nullable=True)
+    ratings = db.Column(db.Text, nullable=True)  # Compact JSON {"resume": {id: score}, "video": {id: score}}
+    idempotency_key = db.Column(db.String(64), nullable=True, unique=True, index=True)
+
+    created_at = db.Column(db.DateTime, nullable=True)  # When this version was submitted
+    superseded_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class EvaluationRating(db.Model):
+    """One criterion score of an evaluation"""
+    __tablename__ = 'evaluation_rating'
+    __table_args__ = (
+        db.Index('ix_evaluation_rating_criterion', 'criterion_id', 'type', 'score'),
+    )
+
+    evaluation_id = db.Column(db.Integer, db.ForeignKey('evaluation.id', ondelete='CASCADE'), primary_key=True)
+    criterion_id = db.Column(db.String(50), primary_key=True)
+    score = db.Column(db.Float, nullable=False)
+    weight = db.Column(db.Float, nullable=False, default=0.0)
+    type = db.Column(db.String(20), nullable=False)  # resume/video/motivation
+
+# Judge roles that count towards the combined score
+JUDGE_ROLES = ('ceo', 'intern1', 'intern2')
+
+class ApplicantScoreSummary(db.Model):
+    """Per-applicant combined score, updated in the same transaction as each evaluation write"""
+    __tablename__ = 'applicant_score_summary'
+
+    applicant_id = db.Column(db.String(50), primary_key=True)
+
+    # Latest final score and evaluation record per judge role
+    ceo_score = db.Column(db.Float, nullable=True)
+    ceo_evaluation_id = db.Column(db.Integer, nullable=True)
+    intern1_score = db.Column(db.Float, nullable=True)
+    intern1_evaluation_id = db.Column(db.Integer, nullable=True)
+    intern2_score = db.Column(db.Float, nullable=True)
+    intern2_evaluation_id = db.Column(db.Integer, nullable=True)
+
+    # Weighted combined score, normalized by the weight of the roles present
+    combined_score = db.Column(db.Float, nullable=False, default=0.0, index=True)
+    weight_total = db.Column(db.Float, nullable=False, default=0.0)
+    evaluation_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def recompute(self):
+        """Recompute the combined score from the per-role scores"""
+        weighted_sum = 0
+        weight_total = 0
+        for role in JUDGE_ROLES:
+            score = getattr(self, f'{role}_score')
+            if score is not None:
+                weighted_sum += score * get_role_weight(role)
+                weight_total += get_role_weight(role)
+        self.weight_total = weight_total
+        self.combined_score = weighted_sum / weight_total if weight_total > 0 else 0
+        self.updated_at = datetime.utcnow()
+
+    def role_evaluations(self):
+        """Load the evaluation counted for each judge role, keyed by role"""
+        ids = {getattr(self, f'{role}_evaluation_id'): role for role in JUDGE_ROLES}
+        ids.pop(None, None)
+        if not ids:
+            return {}
+        return {ids[e.id]: e for e in Evaluation.query.filter(Evaluation.id.in_(ids))}
+
+# Decisions counted by the acceptance rate
+DASHBOARD_DECISIONS = ('advance', 'waitlist', 'reject')
+
+class DashboardStats(db.Model):
+    """Home page counters in a single row, kept exact by triggers on the evaluation table"""
+    __tablename__ = 'dashboard_stats'
+
+    id = db.Column(db.Integer, primary_key=True)  # Always 1
+    applicant_count = db.Column(db.Integer, nullable=False, default=0)   # Distinct evaluated applicants
+    evaluation_count = db.Column(db.Integer, nullable=False, default=0)
+    final_score_sum = db.Column(db.Float, nullable=False, default=0.0)
+    decision_count = db.Column(db.Integer, nullable=False, default=0)    # Decisions in DASHBOARD_DECISIONS
+    advance_count = db.Column(db.Integer, nullable=False, default=0)
+
+class EvaluationFilterValue(db.Model):
+    """Distinct values of each /evaluations filter field with their row counts, kept by triggers"""
+    __tablename__ = 'evaluation_filter_value'
+
+    field = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.String(50), primary_key=True)
+    row_count = db.Column(db.Integer, nullable=False, default=0)
+
+# Tables whose writes bump a data_change counter for cache invalidation
+DATA_CHANGE_TABLES = ('evaluation', 'applicant_info')
+
+class DataChange(db.Model):
+    """Per-table write counter, bumped by triggers on every insert, update and delete"""
+    __tablename__ = 'data_change'
+
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+# ========== Database Setup ==========
+def ensure_columns():
+    """Add nullable columns introduced after a table was first created"""
+    inspector = db.inspect(db.engine)
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            existing = {c['name'] for c in inspector.get_columns(table.name)}
+            for col in table.columns:
+                if col.name not in existing:
+                    col_type = col.type.compile(dialect=db.engine.dialect)
+                    conn.execute(db.text(f'ALTER TABLE {table.name} ADD COLUMN {col.name} {col_type}'))
+
+def ensure_indexes():
+    """Create indexes added after a table was first created (create_all skips existing tables)"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+# Full-text search index over the evaluation search box fields. It is an
+# external-content FTS5 table, so only the index is stored and triggers keep it
+# in sync with the evaluation table.
+EVALUATION_FTS_COLUMNS = ('applicant_name', 'applicant_id', 'judge_name', 'notes')
+evaluation_fts = table('evaluation_fts', column('rowid'), column('rank'), column('evaluation_fts'))
+FTS_ENABLED = False
+
+def ensure_fts_index(fts_table, content_table, columns, options=''):
+    """Create an external-content FTS5 index over a table and the triggers that keep it in sync.
+
+    Returns False if this SQLite build lacks FTS5 or the requested tokenizer.
+    """
+    cols = ', '.join(columns)
+    new_vals = ', '.join(f'new.{c}' for c in columns)
+    old_vals = ', '.join(f'old.{c}' for c in columns)
+    statements = [
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {content_table} BEGIN "
+        f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_vals}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {content_table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); END",
+        # Only updates of indexed columns re-index the row, not score or status changes
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {cols} ON {content_table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) VALUES ('delete', old.id, {old_vals}); "
+        f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_vals}); END",
     ]
+    options = f", {options}" if options else ''
+    try:
+        with db.engine.begin() as conn:
+            exists = conn.execute(db.text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {'name': fts_table}).first()
+            if not exists:
+                conn.execute(db.text(
+                    f"CREATE VIRTUAL TABLE {fts_table} USING fts5({cols}, "
+                    f"content='{content_table}', content_rowid='id'{options})"))
+                # Index the rows written before the search index existed
+                conn.execute(db.text(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"))
+            # Older databases have an update trigger that fires on every column
+            update_trigger = conn.execute(db.text(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+                {'name': f'{fts_table}_au'}).scalar()
+            if update_trigger and f'AFTER UPDATE OF {cols} ' not in update_trigger:
+                conn.execute(db.text(f"DROP TRIGGER {fts_table}_au"))
+            for statement in statements:
+                conn.execute(db.text(statement))
+        return True
+    except OperationalError:
+        return False
+
+def ensure_evaluation_fts():
+    """Create the evaluation search index; False means searches fall back to LIKE"""
+    return ensure_fts_index('evaluation_fts', 'evaluation', EVALUATION_FTS_COLUMNS, "prefix='2 3'")
+
+def ensure_dashboard_stats():
+    """Create the dashboard counter triggers and seed the counters once.
+
+    Every writer (saves, batch imports, status updates, re-scoring) goes
+    through SQLite, so the triggers keep the counters exact for all
+    processes, in the same transaction as the change.
+    """
+    decisions = ', '.join(f"'{d}'" for d in DASHBOARD_DECISIONS)
+
+    def delta(sign, row):
+        return (f"evaluation_count = evaluation_count {sign} 1, "
+                f"final_score_sum = final_score_sum {sign} {row}.final_score, "
+                f"decision_count = decision_count {sign} ({row}.decision IN ({decisions})), "
+                f"advance_count = advance_count {sign} ({row}.decision = 'advance')")
+
+    first_for_applicant = "(SELECT count(*) = 1 FROM evaluation WHERE applicant_id = new.applicant_id)"
+    last_for_applicant = "(NOT EXISTS (SELECT 1 FROM evaluation WHERE applicant_id = old.applicant_id))"
+    statements = [
+        "CREATE TRIGGER IF NOT EXISTS dashboard_stats_ai AFTER INSERT ON evaluation BEGIN "
+        f"UPDATE dashboard_stats SET {delta('+', 'new')}, "
+        f"applicant_count = applicant_count + {first_for_applicant} WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS dashboard_stats_ad AFTER DELETE ON evaluation BEGIN "
+        f"UPDATE dashboard_stats SET {delta('-', 'old')}, "
+        f"applicant_count = applicant_count - {last_for_applicant} WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS dashboard_stats_au "
+        "AFTER UPDATE OF applicant_id, final_score, decision ON evaluation BEGIN "
+        f"UPDATE dashboard_stats SET {delta('-', 'old')} WHERE id = 1; "
+        f"UPDATE dashboard_stats SET {delta('+', 'new')}, "
+        f"applicant_count = applicant_count "
+        f"- (old.applicant_id != new.applicant_id AND {last_for_applicant}) "
+        f"+ (old.applicant_id != new.applicant_id AND {first_for_applicant}) WHERE id = 1; END",
+    ]
+    with db.engine.begin() as conn:
+        for statement in statements:
+            conn.execute(db.text(statement))
+        # Seed in the same transaction, so no write slips between the count and the triggers
+        if conn.execute(db.text("SELECT 1 FROM dashboard_stats WHERE id = 1")).first() is None:
+            conn.execute(db.text(
+                "INSERT INTO dashboard_stats (id, applicant_count, evaluation_count, final_score_sum, "
+                "decision_count, advance_count) "
+                "SELECT 1, count(DISTINCT applicant_id), count(*), coalesce(sum(final_score), 0), "
+                f"coalesce(sum(decision IN ({decisions})), 0), coalesce(sum(decision = 'advance'), 0) "
+                "FROM evaluation"))
+
+def ensure_evaluation_filter_values():
+    """Create the triggers that maintain evaluation_filter_value and seed it once"""
+    def add(row):
+        # INSERT ... SELECT inside a trigger needs a WHERE clause before ON CONFLICT
+        return ''.join(
+            f"INSERT INTO evaluation_filter_value (field, value, row_count) "
+            f"SELECT '{field}', {row}.{field}, 1 WHERE {row}.{field} IS NOT NULL "
+            f"ON CONFLICT (field, value) DO UPDATE SET row_count = row_count + 1; "
+            for field in EVALUATION_FILTER_FIELDS)
+
+    def remove(row):
+        return ''.join(
+            f"UPDATE evaluation_filter_value SET row_count = row_count - 1 "
+            f"WHERE field = '{field}' AND value = {row}.{field}; "
+            for field in EVALUATION_FILTER_FIELDS) + "DELETE FROM evaluation_filter_value WHERE row_count <= 0; "
+
+    fields = ', '.join(EVALUATION_FILTER_FIELDS)
+    statements = [
+        f"CREATE TRIGGER IF NOT EXISTS evaluation_filter_value_ai AFTER INSERT ON evaluation BEGIN {add('new')}END",
+        f"CREATE TRIGGER IF NOT EXISTS evaluation_filter_value_ad AFTER DELETE ON evaluation BEGIN {remove('old')}END",
+        f"CREATE TRIGGER IF NOT EXISTS evaluation_filter_value_au AFTER UPDATE OF {fields} ON evaluation "
+        f"BEGIN {remove('old')}{add('new')}END",
+    ]
+    with db.engine.begin() as conn:
+        for statement in statements:
+            conn.execute(db.text(statement))
+        if conn.execute(db.text("SELECT 1 FROM evaluation_filter_value LIMIT 1")).first() is None:
+            for field in EVALUATION_FILTER_FIELDS:
+                conn.execute(db.text(
+                    f"INSERT INTO evaluation_filter_value (field, value, row_count) "
+                    f"SELECT '{field}', {field}, count(*) FROM evaluation WHERE {field} IS NOT NULL GROUP BY {field}"))
+
+def ensure_data_change_triggers():
+    """Create the data_change counter rows and the triggers that bump them"""
+    with db.engine.begin() as conn:
+        for name in DATA_CHANGE_TABLES:
+            conn.execute(db.text("INSERT OR IGNORE INTO data_change (table_name, version) VALUES (:name, 0)"),
+                         {'name': name})
+            for suffix, event in (('ai', 'INSERT'), ('au', 'UPDATE'), ('ad', 'DELETE')):
+                conn.execute(db.text(
+                    f"CREATE TRIGGER IF NOT EXISTS {name}_data_change_{suffix} AFTER {event} ON {name} BEGIN "
+                    f"UPDATE data_change SET version = version + 1 WHERE table_name = '{name}'; END"))
+
+def bump_data_version(name):
+    """Bump a data_change counter in the session's transaction, for writes that fire no trigger"""
+    db.session.execute(db.text("UPDATE data_change SET version = version + 1 WHERE table_name = :name"),
+                       {'name': name})
+
+# Trigram index over applicant ids and names for typo-tolerant lookups. The
+# fts5vocab table exposes how many applicants share each trigram.
+APPLICANT_TRIGRAM_COLUMNS = ('applicant_id', 'name')
+applicant_trigram = table('applicant_trigram', column('rowid'), column('rank'), column('applicant_trigram'))
+applicant_trigram_vocab = table('applicant_trigram_vocab', column('term'), column('doc'))
+TRIGRAM_ENABLED = False
+
+def ensure_applicant_trigram_index():
+    """Create the applicant trigram index; False means lookups fall back to index range scans"""
+    if not ensure_fts_index('applicant_trigram', 'applicant_info', APPLICANT_TRIGRAM_COLUMNS, "tokenize='trigram'"):
+        return False
+    with db.engine.begin() as conn:
+        conn.execute(db.text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS applicant_trigram_vocab USING fts5vocab(applicant_trigram, 'row')"))
+    return True
+
+def apply_evaluation_to_summary(evaluation, is_new=True):
+    """Fold a new or resubmitted evaluation into its applicant's score summary.
+
+    The evaluation must already be flushed so it has an id; the caller commits.
+    """
+    summary = db.session.get(ApplicantScoreSummary, evaluation.applicant_id)
+    if summary is None:
+        summary = ApplicantScoreSummary(applicant_id=evaluation.applicant_id, evaluation_count=0)
+        db.session.add(summary)
+
+    role = evaluation.judge_role.lower() if evaluation.judge_role else ''
+    if role in JUDGE_ROLES:
+        setattr(summary, f'{role}_score', evaluation.final_score)
+        setattr(summary, f'{role}_evaluation_id', evaluation.id)
+    if is_new:
+        summary.evaluation_count = (summary.evaluation_count or 0) + 1
+    summary.recompute()
+    return summary
+
+def rating_rows(evaluation_id, ratings, section):
+    """Turn a {criterion_id: {score, weight}} ratings payload into EvaluationRating rows"""
+    rows = []
+    for criterion_id, value in (ratings or {}).items():
+        if isinstance(value, dict):
+            score, weight = value.get('score'), value.get('weight')
+        else:
+            score, weight = value, None
+        try:
+            score = float(score or 0)
+            weight = float(weight or 0)
+        except (TypeError, ValueError):
+            continue
+        # The rating page submits the motivation criterion together with the video ratings
+        rating_type = 'motivation' if criterion_id.startswith('motivation_') else section
+        rows.append(EvaluationRating(evaluation_id=evaluation_id, criterion_id=criterion_id,
+                                     score=score, weight=weight, type=rating_type))
+    return rows
+
+def get_evaluation_ratings(evaluation_id):
+    """Load an evaluation's criterion scores as (resume_ratings, video_ratings) dicts"""
+    resume_ratings = {}
+    video_ratings = {}
+    rows = EvaluationRating.query.filter_by(evaluation_id=evaluation_id).order_by(EvaluationRating.criterion_id)
+    for r in rows:
+        target = resume_ratings if r.type == 'resume' else video_ratings
+        target[r.criterion_id] = {"score": r.score, "weight": r.weight}
+    return resume_ratings, video_ratings
+
+# Evaluation fields copied into evaluation_revision when a version is superseded
+EVALUATION_REVISION_FIELDS = (
+    'judge_name', 'evaluation_date', 'applicant_name', 'applicant_role',
+    'resume_score', 'video_score', 'motivation_score', 'final_score', 'rubric_version',
+    'decision', 'notes', 'idempotency_key', 'created_at',
+)
+
+def archive_evaluation(evaluation, evaluation_id=None):
+    """Move the current version of an evaluation into evaluation_revision.
+
+    Its criterion rows are folded into the revision's compact ratings JSON and
+    deleted. evaluation_id names the evaluation the revision belongs to when
+    it differs from the archived row (merging duplicates).
+    """
+    ratings = {'resume': {}, 'video': {}}
+    rows = (db.session.query(EvaluationRating.criterion_id, EvaluationRating.score, EvaluationRating.type)
+            .filter(EvaluationRating.evaluation_id == evaluation.id)
+            .order_by(EvaluationRating.criterion_id))
+    for criterion_id, score, rating_type in rows:
+        ratings['resume' if rating_type == 'resume' else 'video'][criterion_id] = score
+    revision = EvaluationRevision(
+        evaluation_id=evaluation_id or evaluation.id,
+        ratings=json.dumps(ratings, separators=(',', ':')),
+        **{field: getattr(evaluation, field) for field in EVALUATION_REVISION_FIELDS})
+    EvaluationRating.query.filter_by(evaluation_id=evaluation.id).delete(synchronize_session=False)
+    db.session.add(revision)
+    return revision
+
+def merge_duplicate_evaluations():
+    """Keep one current evaluation per (applicant, judge role) before the unique index exists.
+
+    The newest row of each group stays current, the older ones become its
+    revisions. Returns the number of rows archived.
+    """
+    exists = db.session.execute(db.text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"),
+        {'name': EVALUATION_CURRENT_INDEX}).first()
+    if exists:
+        return 0
+
+    # Role lookups compare lowercase role names
+    Evaluation.query.filter(Evaluation.judge_role != func.lower(Evaluation.judge_role)).update(
+        {Evaluation.judge_role: func.lower(Evaluation.judge_role)}, synchronize_session=False)
+
+    groups = (db.session.query(Evaluation.applicant_id, Evaluation.judge_role, func.max(Evaluation.id))
+              .group_by(Evaluation.applicant_id, Evaluation.judge_role)
+              .having(func.count(Evaluation.id) > 1)
+              .all())
+    archived = 0
+    for applicant_id, judge_role, current_id in groups:
+        older = (Evaluation.query
+                 .filter_by(applicant_id=applicant_id, judge_role=judge_role)
+                 .filter(Evaluation.id != current_id)
+                 .order_by(Evaluation.id))
+        for e in older:
+            archive_evaluation(e, evaluation_id=current_id)
+            db.session.delete(e)
+            archived += 1
+    db.session.commit()
+    return archived
+
+def migrate_rating_blobs(batch_size=500):
+    """Move legacy JSON rating blobs into evaluation_rating rows, one batch per transaction"""
+    migrated = 0
+    last_id = 0
+    while True:
+        batch = (Evaluation.query
+                 .filter(Evaluation.id > last_id)
+                 .filter((Evaluation.resume_ratings.isnot(None)) | (Evaluation.video_ratings.isnot(None)))
+                 .order_by(Evaluation.id)
+                 .limit(batch_size)
+                 .all())
+        if not batch:
+            break
+
+        for e in batch:
+            try:
+                resume_ratings = json.loads(e.resume_ratings) if e.resume_ratings else {}
+                video_ratings = json.loads(e.video_ratings) if e.video_ratings else {}
+            except ValueError:
+                # Leave unreadable blobs in place
+                continue
+            EvaluationRating.query.filter_by(evaluation_id=e.id).delete()
+            db.session.add_all(rating_rows(e.id, resume_ratings, 'resume') +
+                               rating_rows(e.id, video_ratings, 'video'))
+            e.resume_ratings = None
+            e.video_ratings = None
+            migrated += 1
+
+        last_id = batch[-1].id
+        db.session.commit()
+    return migrated
+
+def rebuild_applicant_score_summaries():
+    """Recompute every applicant score summary from the evaluation table"""
+    counts = db.session.query(Evaluation.applicant_id, func.count(Evaluation.id)).group_by(Evaluation.applicant_id)
+
+    summaries = {}
+    for applicant_id, count in counts:
+        summaries[applicant_id] = ApplicantScoreSummary(applicant_id=applicant_id, evaluation_count=count)
+    # Each judge role has a single current evaluation per applicant
+    for e in Evaluation.query.filter(Evaluation.judge_role.in_(JUDGE_ROLES)):
+        role = e.judge_role
+        setattr(summaries[e.applicant_id], f'{role}_score', e.final_score)
+        setattr(summaries[e.applicant_id], f'{role}_evaluation_id', e.id)
+
+    ApplicantScoreSummary.query.delete()
+    for summary in summaries.values():
+        summary.recompute()
+        db.session.add(summary)
+    # The summary has no triggers of its own; pages validated against the
+    # evaluation version must not keep answering 304 with the old scores
+    bump_data_version('evaluation')
+    db.session.commit()
+    return len(summaries)
+
+@app.cli.command('rebuild-score-summary')
+def rebuild_score_summary_command():
+    """Recompute the applicant_score_summary table from all evaluations"""
+    click.echo(f"Rebuilt score summaries for {rebuild_applicant_score_summaries()} applicants")
 
-    if position == "financial-analyst":
-        return [
-            {"id": "resume_skills", "label": "Hard vs Soft Skills (70/30 split)", "weight": 15},
-        ] + base_criteria
-    elif position == "research-analyst":
-        return [
-            {"id": "resume_skills", "label": "Hard vs Soft Skills (40/60 split)", "weight": 15},
-        ] + base_criteria
-    elif position == "operations-analyst":
-        return [
-            {"id": "resume_skills", "label": "Hard vs Soft Skills (20/80 split)", "weight": 15},
-        ] + base_criteria
-    else:
-        return [
-            {"id": "resume_skills", "label": "Hard vs Soft Skills", "weight": 15},
-        ] + base_criteria
-
-def get_motivation_criteria():
-    """Return the structure of motivation evaluation criteria"""
-    return {
-        "title": "Motivation (10%)",
-        "items": [
-            {"id": "motivation_enthusiasm", "label": "Enthusiasm for the Position", "weight": 10}
-        ]
-    }
-
+# ========== Helper Functions ==========
 def get_role_weight(role):
     """Return the weight factor for each judge role"""
     weights = {
@@ -132,23 +643,10 @@ def get_role_weight(role):
 
 def get_position_name_english(position):
     """Return position name in English"""
-    positions = {
-        'financial-analyst': 'Financial Analyst',
-        'research-analyst': 'Research Analyst',
-        'operations-analyst': 'Operations Analyst'
-    }
-    return positions.get(position, position.replace('-', ' ').title())
-
-def get_role_weights_for_export(position):
-    """Return weight factors for each position"""
-    if position == "financial-analyst":
-        return {"hard": 0.7, "soft": 0.3}
-    elif position == "research-analyst":
-        return {"hard": 0.4, "soft": 0.6}
-    elif position == "operations-analyst":
-        return {"hard": 0.2, "soft": 0.8}
-    else:
-        return {"hard": 0.5, "soft": 0.5}  # Default to average weights
+    positions = get_rubric().positions
+    if position in positions:
+        return positions[position].name
+    return position.replace('-', ' ').title()
 
 def format_float(value):
     """Format float value with consistent precision"""
@@ -157,17 +655,6 @@ def format_float(value):
     except:
         return "0.0"
 
-def escape_csv_field(value):
-    """Properly escape a value for CSV inclusion"""
-    if value is None:
-        return '""'
-    
-    value = str(value)
-    if ',' in value or '"' in value or '\n' in value or '\r' in value:
-        # Escape quotes by doubling them and wrap in quotes
-        return '"' + value.replace('"', '""') + '"'
-    return value
-
 def get_rating_score(ratings_dict, key):
     """Safely extract score from ratings dictionary"""
     if not ratings_dict:
@@ -181,75 +668,991 @@ def get_rating_score(ratings_dict, key):
     # Try old format (direct value)
     return ratings_dict.get(key, "")
 
+# ========== Rubric Registry ==========
+# Evaluation criteria, weights and per-position wording, compiled once into
+# immutable structures shared by scoring, the rating page, exports and the
+# browser (/api/rubric).
+#
+# Rubrics are versioned: never edit a published version, add a new one, bump
+# CURRENT_RUBRIC_VERSION and run `flask rescore` so stored scores follow.
+# Criteria are (id, base weight, skill type, label, description).
+RUBRIC_VERSIONS = {
+    1: {
+        'resume': (
+            ('Hard Skills Assessment', (
+                ('resume_technical', 15, 'hard', 'Technical Proficiency',
+                 'Relevant courses, technical training, and professional knowledge'),
+                ('resume_experience', 10, 'hard', 'Relevant Experience',
+                 'Relevant internships and project experience'),
+            )),
+            ('Soft Skills Assessment', (
+                ('resume_leadership', 10, 'soft', 'Extracurricular & Leadership',
+                 'Team collaboration, activity participation, and leadership experience'),
+                ('resume_presentation', 5, 'soft', 'Resume Presentation',
+                 'Resume format, organization, and professional presentation'),
+            )),
+        ),
+        'video': (
+            ('Content Quality Assessment (25%)', (
+                ('content_understanding', 12.5, 'hard', 'Product & Market Understanding',
+                 "Analysis of Sertie's value proposition and market opportunities"),
+                ('content_marketing', 12.5, 'hard', 'Marketing Strategy Analysis',
+                 'Evaluation of current marketing and Premium Service promotion plan'),
+            )),
+            ('Presentation Skills Assessment (25%)', (
+                ('presentation_creativity', 8.33, 'soft', 'Creative Expression',
+                 'Uniqueness of video format and personal style presentation'),
+                ('presentation_clarity', 8.33, 'soft', 'Communication Clarity',
+                 'Accuracy and fluency of information delivery'),
+                ('presentation_structure', 8.33, 'soft', 'Structure & Time Management',
+                 'Completeness of content organization and reasonable time allocation within 3 minutes'),
+            )),
+        ),
+        'motivation': ('motivation_enthusiasm', 10, 'soft', 'Career Plan Alignment',
+                       'Position understanding, career development plan alignment, and learning motivation'),
+        # Final score blend: Resume 40%, Video 50%, Motivation 10%
+        'sections': {'resume': 0.4, 'video': 0.5, 'motivation': 0.1},
+        # Hard/soft skill split and criterion wording per position
+        'positions': {
+            'financial-analyst': {
+                'name': 'Financial Analyst',
+                'split': {'hard': 0.7, 'soft': 0.3},
+                'labels': {
+                    'resume_technical': ('Financial Modeling & Valuation',
+                                         'Financial modeling, valuation analysis, and investment return calculation'),
+                    'resume_experience': ('Financial Analysis & Investment Experience',
+                                          'Financial analysis, due diligence, and investment justification'),
+                    'resume_leadership': ('Networking & Relationship Building',
+                                          'Industry network building and investor relations management'),
+                    'content_understanding': (None, "Analysis of Sertie's value proposition and market opportunities, "
+                                                    "with focus on business model and profitability analysis"),
+                    'content_marketing': (None, 'Evaluation of current marketing and Premium Service promotion plan, '
+                                                'with focus on ROI and budget allocation analysis'),
+                    'presentation_clarity': ('Investment Proposal Presentation',
+                                             'Clarity and persuasiveness of investment logic presentation'),
+                },
+            },
+            'research-analyst': {
+                'name': 'Research Analyst',
+                'split': {'hard': 0.4, 'soft': 0.6},
+                'labels': {
+                    'resume_technical': ('Market & Industry Trend Analysis',
+                                         'Market intelligence gathering and industry trend analysis'),
+                    'resume_experience': ('Data Analysis & Research Methods',
+                                          'Data analysis tools and research methodology application'),
+                    'resume_leadership': ('Learning Agility for Emerging Trends',
+                                          'Adaptability and acuity in identifying emerging trends'),
+                    'content_understanding': (None, "Analysis of Sertie's value proposition and market opportunities, "
+                                                    "with focus on market opportunity assessment and data support"),
+                    'content_marketing': (None, 'Evaluation of current marketing and Premium Service promotion plan, '
+                                                'with focus on target user insights and effect prediction'),
+                    'presentation_clarity': ('Research Findings Presentation',
+                                             'Clarity of research conclusions and insights presentation'),
+                },
+            },
+            'operations-analyst': {
+                'name': 'Operations Analyst',
+                'split': {'hard': 0.2, 'soft': 0.8},
+                'labels': {
+                    'resume_technical': ('Business Process Optimization',
+                                         'Business process analysis and optimization design'),
+                    'resume_experience': ('Project Management & Operations',
+                                          'Project management and business operations support'),
+                    'resume_leadership': ('Adaptability & Problem Solving',
+                                          'Adaptability to challenges and innovative solution development'),
+                    'content_understanding': (None, "Analysis of Sertie's value proposition and market opportunities, "
+                                                    "with focus on service improvement and user experience optimization"),
+                    'content_marketing': (None, 'Evaluation of current marketing and Premium Service promotion plan, '
+                                                'with focus on execution planning and operability'),
+                    'presentation_clarity': ('Stakeholder Management',
+                                             'Clarity and effectiveness of communication with various parties'),
+                },
+            },
+        },
+        # Used for positions not listed above
+        'default': {'name': 'Applicant', 'split': {'hard': 0.5, 'soft': 0.5}, 'labels': {}},
+    },
+}
+CURRENT_RUBRIC_VERSION = 1
+
+@dataclass(frozen=True, slots=True)
+class Criterion:
+    id: str
+    weight: float       # Base weight before the position's hard/soft split
+    skill_type: str     # hard/soft
+    label: str
+    description: str
+
+    def to_json(self):
+        return {"id": self.id, "weight": self.weight, "type": self.skill_type,
+                "label": self.label, "description": self.description}
+
+@dataclass(frozen=True, slots=True)
+class CriteriaGroup:
+    title: str
+    criteria: tuple
+
+    def to_json(self):
+        return {"title": self.title, "items": [c.to_json() for c in self.criteria]}
+
+@dataclass(frozen=True, slots=True)
+class PositionRubric:
+    """Criteria for one position with its precomputed scoring weights"""
+    position: str
+    name: str
+    split: MappingProxyType     # {'hard': ..., 'soft': ...}
+    resume: tuple               # CriteriaGroup
+    video: tuple                # CriteriaGroup
+    motivation: Criterion
+    weights: tuple              # Adjusted weights in Rubric.criteria_ids order
+    labels: MappingProxyType    # criterion id -> label, motivation included
+
+    def criteria(self):
+        """Resume then video criteria, in Rubric.criteria_ids order"""
+        return tuple(c for group in self.resume + self.video for c in group.criteria)
+
+    def to_json(self):
+        return {"name": self.name, "split": dict(self.split),
+                "resume": [g.to_json() for g in self.resume],
+                "video": [g.to_json() for g in self.video],
+                "motivation": self.motivation.to_json()}
+
+@dataclass(frozen=True, slots=True)
+class Rubric:
+    version: int
+    sections: MappingProxyType  # Final score blend per section
+    criteria_ids: tuple         # Column order of score matrices: resume then video
+    index: MappingProxyType     # criterion id -> column
+    resume_count: int           # Resume criteria come first in criteria_ids
+    motivation_id: str
+    positions: MappingProxyType
+    default: PositionRubric
+
+    def for_position(self, position):
+        return self.positions.get(position, self.default)
+
+    def label(self, criterion_id):
+        """Position-neutral label of a criterion, or the id if the rubric does not know it"""
+        return self.default.labels.get(criterion_id, criterion_id)
+
+    def to_json(self):
+        return {"version": self.version, "sections": dict(self.sections),
+                "positions": {p: r.to_json() for p, r in self.positions.items()},
+                "default": self.default.to_json()}
+
+def to_fixed(value, digits=1):
+    """Round like JavaScript's Number.prototype.toFixed.
+
+    toFixed rounds the exact binary value of the number half away from zero,
+    so 0.25 becomes 0.3 and 1.005 (stored as 1.00499...) becomes 1.0, unlike
+    Python's round() and numpy's round-half-to-even.
+    """
+    return float(Decimal(value).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+def adjusted_weights(criteria, section_weight, split):
+    """Scale base weights so hard and soft skills get the position's split, as applyWeightsToType() does"""
+    totals = {'hard': 0, 'soft': 0}
+    for c in criteria:
+        totals[c.skill_type] += c.weight
+    # Same operation order as the page, which keeps two decimals (toFixed(2))
+    # and scores with the rounded weights
+    multipliers = {t: section_weight * split[t] / totals[t] for t in totals if totals[t] > 0}
+    return [to_fixed(c.weight * multipliers[c.skill_type], 2) for c in criteria]
+
+def compile_rubric(version, spec):
+    """Build the immutable Rubric for one RUBRIC_VERSIONS entry"""
+    sections = MappingProxyType(dict(spec['sections']))
+
+    def build_position(position, position_spec):
+        labels = position_spec['labels']
+
+        def criterion(entry):
+            criterion_id, weight, skill_type, label, description = entry
+            label_override, description_override = labels.get(criterion_id, (None, None))
+            return Criterion(criterion_id, weight, skill_type,
+                             label_override or label, description_override or description)
+
+        def groups(section):
+            return tuple(CriteriaGroup(title, tuple(criterion(e) for e in entries))
+                         for title, entries in spec[section])
+
+        split = MappingProxyType(dict(position_spec['split']))
+        resume, video = groups('resume'), groups('video')
+        resume_criteria = [c for g in resume for c in g.criteria]
+        video_criteria = [c for g in video for c in g.criteria]
+        weights = tuple(adjusted_weights(resume_criteria, sections['resume'], split) +
+                        adjusted_weights(video_criteria, sections['video'], split))
+        motivation = criterion(spec['motivation'])
+        labels = MappingProxyType({c.id: c.label for c in resume_criteria + video_criteria + [motivation]})
+        return PositionRubric(position, position_spec['name'], split, resume, video,
+                              motivation, weights, labels)
+
+    default = build_position('', spec['default'])
+    criteria_ids = tuple(c.id for c in default.criteria())
+    return Rubric(
+        version=version,
+        sections=sections,
+        criteria_ids=criteria_ids,
+        index=MappingProxyType({criterion_id: i for i, criterion_id in enumerate(criteria_ids)}),
+        resume_count=sum(len(g.criteria) for g in default.resume),
+        motivation_id=spec['motivation'][0],
+        positions=MappingProxyType({p: build_position(p, ps) for p, ps in spec['positions'].items()}),
+        default=default,
+    )
+
+RUBRICS = MappingProxyType({v: compile_rubric(v, spec) for v, spec in RUBRIC_VERSIONS.items()})
+
+def get_rubric(version=CURRENT_RUBRIC_VERSION):
+    """Compiled rubric for a version; raises KeyError for unknown versions"""
+    return RUBRICS[version]
+
+@lru_cache(maxsize=None)
+def rubric_json(version=CURRENT_RUBRIC_VERSION):
+    """Serialized rubric and its ETag"""
+    body = json.dumps(get_rubric(version).to_json(), separators=(',', ':'))
+    return body, hashlib.sha256(body.encode('utf-8')).hexdigest()[:16]
+
+@app.route('/api/rubric')
+def api_rubric():
+    """The rubric as JSON for the rating page; immutable per version, so cached hard"""
+    version = request.args.get('v', CURRENT_RUBRIC_VERSION, type=int)
+    if version not in RUBRICS:
+        return jsonify({"error": f"Unknown rubric version {version}"}), 404
+    body, etag = rubric_json(version)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response.make_conditional(request)
+
+# ========== Scoring Engine ==========
+# Server-side mirror of the rating page's updateScores(), working from the
+# weight vectors precompiled in the rubric registry.
+def rating_value(ratings, criterion_id):
+    """Score of one criterion from a ratings payload; unrated criteria count as 0"""
+    value = (ratings or {}).get(criterion_id, 0)
+    if isinstance(value, dict):
+        value = value.get('score', 0)
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+def has_scoring_ratings(resume_ratings, video_ratings, version=CURRENT_RUBRIC_VERSION):
+    """True if a payload rates any criterion the rubric knows"""
+    rubric = get_rubric(version)
+    rated = set(resume_ratings or {}) | set(video_ratings or {})
+    return any(c in rubric.index or c == rubric.motivation_id for c in rated)
+
+def section_columns(rubric):
+    """Criterion columns of each section by skill type, in page (criteria_ids) order"""
+    types = [c.skill_type for c in rubric.default.criteria()]
+    split = rubric.resume_count
+    return {section: {skill_type: [j for j in range(lo, hi) if types[j] == skill_type]
+                      for skill_type in ('hard', 'soft')}
+            for section, (lo, hi) in (('resume', (0, split)), ('video', (split, len(types))))}
+
+def section_sums(columns, score, weight):
+    """A section's weighted score sum and total weight.
+
+    score(j) and weight(j) give column j as floats or numpy vectors. Sums run
+    in updateScores() order: hard and soft skills are each added left to right
+    from zero and then combined, so both code paths do the same float operations.
+    """
+    sums = {}
+    for skill_type in ('hard', 'soft'):
+        weighted_sum = total_weight = 0.0
+        for j in columns[skill_type]:
+            weighted_sum = weighted_sum + score(j) * weight(j)
+            total_weight = total_weight + weight(j)
+        sums[skill_type] = (weighted_sum, total_weight)
+    return (sums['hard'][0] + sums['soft'][0], sums['hard'][1] + sums['soft'][1])
+
+def round_scores(resume_avg, video_avg, motivation, sections):
+    """Display values of one evaluation, computed and rounded as updateScores() does"""
+    final = ((resume_avg * sections['resume']) + (video_avg * sections['video']) +
+             (motivation * 10 * sections['motivation'])) / 10
+    return (to_fixed(resume_avg / 10), to_fixed(video_avg / 10), to_fixed(motivation), to_fixed(final))
+
+def score_batch(positions, criteria_scores, motivation_scores, version=CURRENT_RUBRIC_VERSION):
+    """Score many evaluations at once.
+
+    positions: applied position per evaluation
+    criteria_scores: rows of criterion scores in Rubric.criteria_ids order
+    motivation_scores: motivation score per evaluation
+    Returns (resume, video, motivation, final) float tuples rounded to one
+    decimal exactly as the rating page shows them. The numpy path vectorizes
+    across evaluations only, so it matches the plain Python path bit for bit.
+    """
+    if not positions:
+        return []
+
+    rubric = get_rubric(version)
+    sections = rubric.sections
+    columns = section_columns(rubric)
+
+    if np is None:
+        results = []
+        for position, row, motivation in zip(positions, criteria_scores, motivation_scores):
+            weights = rubric.for_position(position).weights
+            averages = []
+            for section in ('resume', 'video'):
+                weighted_sum, total_weight = section_sums(
+                    columns[section], lambda j: float(row[j]), lambda j: weights[j])
+                averages.append(weighted_sum / total_weight * 10 if total_weight > 0 else 0.0)
+            results.append(round_scores(*averages, float(motivation), sections))
+        return results
+
+    # One weight row per distinct position, gathered into an (evaluations x criteria) matrix
+    distinct = sorted(set(positions))
+    weight_table = np.array([rubric.for_position(p).weights for p in distinct], dtype=float)
+    row_of = {p: i for i, p in enumerate(distinct)}
+    weights = weight_table[[row_of[p] for p in positions]]
+    scores = np.asarray(criteria_scores, dtype=float).reshape(len(positions), weights.shape[1])
+    motivation = np.asarray(motivation_scores, dtype=float)
+
+    averages = []
+    for section in ('resume', 'video'):
+        weighted_sum, total_weight = section_sums(
+            columns[section], lambda j: scores[:, j], lambda j: weights[:, j])
+        weighted_sum = np.broadcast_to(weighted_sum, len(positions))
+        total_weight = np.broadcast_to(total_weight, len(positions))
+        averages.append(np.divide(weighted_sum, total_weight, out=np.zeros(len(positions)),
+                                  where=total_weight > 0) * 10)
+    return [round_scores(float(r), float(v), float(m), sections)
+            for r, v, m in zip(*averages, motivation)]
+
+def score_evaluation(position, resume_ratings, video_ratings, version=CURRENT_RUBRIC_VERSION):
+    """Score one evaluation from its ratings payload: (resume, video, motivation, final)"""
+    rubric = get_rubric(version)
+    ratings = dict(video_ratings or {}, **(resume_ratings or {}))
+    row = [rating_value(ratings, criterion_id) for criterion_id in rubric.criteria_ids]
+    motivation = rating_value(ratings, rubric.motivation_id)
+    return score_batch([position], [row], [motivation], version)[0]
+
+# ========== Re-scoring ==========
+RESCORE_CHUNK_SIZE = 1000
+
+def rescore_evaluations(version=CURRENT_RUBRIC_VERSION, chunk_size=RESCORE_CHUNK_SIZE,
+                        stale_only=False, progress=None):
+    """Recompute stored evaluation scores under a rubric version.
+
+    Works through the evaluation table in id order, one chunk per write
+    transaction, so the write lock is only held for a single executemany UPDATE.
+    Evaluations without criterion ratings keep their submitted scores.
+    Calls progress(done, total) after each chunk and returns (rescored, skipped).
+    """
+    rubric = get_rubric(version)
+    column_of = rubric.index
+    motivation_id = rubric.motivation_id
+
+    query = db.session.query(Evaluation.id, Evaluation.applicant_role)
+    if stale_only:
+        query = query.filter(or_(Evaluation.rubric_version.is_(None), Evaluation.rubric_version != version))
+    total = query.count()
+
+    update = db.text("UPDATE evaluation SET resume_score = :resume, video_score = :video, "
+                     "motivation_score = :motivation, final_score = :final, rubric_version = :version "
+                     "WHERE id = :id")
+    rescored = skipped = done = 0
+    last_id = 0
+    while True:
+        chunk = query.filter(Evaluation.id > last_id).order_by(Evaluation.id).limit(chunk_size).all()
+        if not chunk:
+            break
+        last_id = chunk[-1].id
+
+        rows = {e.id: [0.0] * len(rubric.criteria_ids) for e in chunk}
+        motivation = dict.fromkeys(rows, 0.0)
+        rated = set()
+        ratings = (db.session.query(EvaluationRating.evaluation_id, EvaluationRating.criterion_id,
+                                    EvaluationRating.score)
+                   .filter(EvaluationRating.evaluation_id.in_(rows)))
+        for evaluation_id, criterion_id, score in ratings:
+            if criterion_id in column_of:
+                rows[evaluation_id][column_of[criterion_id]] = score or 0.0
+            elif criterion_id == motivation_id:
+                motivation[evaluation_id] = score or 0.0
+            else:
+                continue
+            rated.add(evaluation_id)
+
+        scored = [e for e in chunk if e.id in rated]
+        results = score_batch([e.applicant_role for e in scored], [rows[e.id] for e in scored],
+                              [motivation[e.id] for e in scored], version)
+        params = [{'id': e.id, 'resume': r, 'video': v, 'motivation': m, 'final': f, 'version': version}
+                  for e, (r, v, m, f) in zip(scored, results)]
+
+        # End the read transaction, then hold the write lock only for the UPDATE
+        db.session.rollback()
+        if params:
+            begin_write_transaction()
+            db.session.execute(update, params)
+            db.session.commit()
+
+        rescored += len(params)
+        skipped += len(chunk) - len(params)
+        done += len(chunk)
+        if progress:
+            progress(done, total)
+    return rescored, skipped
+
+@app.cli.command('rescore')
+@click.option('--rubric-version', 'version', default=CURRENT_RUBRIC_VERSION, type=int,
+              help='Rubric version to score under')
+@click.option('--chunk-size', default=RESCORE_CHUNK_SIZE, help='Evaluations per write transaction')
+@click.option('--stale-only', is_flag=True, help='Only evaluations not yet scored under this version')
+def rescore_command(version, chunk_size, stale_only):
+    """Recompute stored evaluation scores under a rubric version"""
+    if version not in RUBRICS:
+        raise click.BadParameter(f"unknown rubric version {version}", param_hint='--rubric-version')
+    started = time.perf_counter()
+
+    def progress(done, total):
+        click.echo(f"  {done}/{total} evaluations")
+
+    rescored, skipped = rescore_evaluations(version, chunk_size, stale_only, progress)
+    applicants = rebuild_applicant_score_summaries()
+    click.echo(f"Rescored {rescored} evaluations under rubric v{version} "
+               f"({skipped} without criterion ratings kept), "
+               f"rebuilt {applicants} score summaries in {time.perf_counter() - started:.2f}s")
+
+# ========== Caching ==========
+# Every cache registers the tables it is computed from. Each request reads the
+# data_change counters once; a worker drops only the caches whose tables were
+# written since its last check, whichever worker or process made the write.
+DATA_CACHES = []
+data_versions = {}
+data_versions_lock = threading.Lock()
+
+class DataCache:
+    """In-process cache of values computed from the given tables.
+
+    Each entry keeps the versions of its tables read before it was built. An
+    entry built by a request that started before a write is only served to
+    requests that saw the same versions, even if it is stored after another
+    thread already invalidated the cache for that write.
+    """
+
+    def __init__(self, *tables):
+        unknown = set(tables) - set(DATA_CHANGE_TABLES)
+        if unknown:
+            raise ValueError(f"No data_change counter for {', '.join(sorted(unknown))}")
+        self.tables = frozenset(tables)
+        self._entries = {}
+        DATA_CACHES.append(self)
+
+    def versions(self):
+        """Versions of this cache's tables as seen by the current request"""
+        versions = getattr(g, 'data_versions', None) if has_request_context() else None
+        if versions is None:
+            versions = current_data_versions()
+        return tuple(versions.get(name) for name in sorted(self.tables))
+
+    def get(self, key, build):
+        versions = self.versions()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == versions:
+            return entry[1]
+        value = build()
+        self._entries[key] = (versions, value)
+        return value
+
+    def invalidate(self):
+        self._entries.clear()
+
+def current_data_versions():
+    """Read the per-table write counters on a connection outside the request session"""
+    # Kept off db.session so write routes can still open with BEGIN IMMEDIATE
+    with db.engine.connect() as conn:
+        return dict(conn.execute(db.text("SELECT table_name, version FROM data_change")).all())
+
+def refresh_data_caches(versions=None):
+    """Invalidate the caches that depend on tables changed since the last check"""
+    versions = current_data_versions() if versions is None else versions
+    with data_versions_lock:
+        changed = {name for name, version in versions.items() if data_versions.get(name) != version}
+        if not changed:
+            return changed
+        data_versions.update(versions)
+        for cache in DATA_CACHES:
+            if cache.tables & changed:
+                cache.invalidate()
+    return changed
+
+@app.before_request
+def check_data_versions():
+    if request.endpoint != 'static':
+        g.data_versions = current_data_versions()
+        refresh_data_caches(g.data_versions)
+
+# ========== Conditional Responses ==========
+# Read-only pages are tagged with the data versions they were rendered from, the
+# page code and the full request path (so each filter, page and applicant has
+# its own tag). A matching If-None-Match is answered with 304 straight from the
+# counters read in check_data_versions, before the view runs any query.
+TEMPLATE_DIGESTS = {}
+
+@lru_cache(maxsize=1)
+def page_build_digest():
+    """Digest of every registered template, static file and the current rubric"""
+    digest = hashlib.sha256(rubric_json(CURRENT_RUBRIC_VERSION)[1].encode('ascii'))
+    for name in sorted(TEMPLATE_DIGESTS):
+        digest.update(TEMPLATE_DIGESTS[name].encode('ascii'))
+    # Pages link assets by content hash, so an edited asset changes the page
+    for filename in sorted(static_files()):
+        digest.update(f"{filename}:{asset_digest(filename)}".encode('utf-8'))
+    return digest.hexdigest()
+
+def data_etag(tables):
+    """ETag for the current request path under the given tables' data versions"""
+    versions = getattr(g, 'data_versions', None) or current_data_versions()
+    key = json.dumps([page_build_digest(), request.full_path, [versions.get(t) for t in tables]])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+def conditional_on_data(*tables):
+    """Serve a view with an ETag from the tables it reads and answer revalidations with 304"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if debug_requested():
+                return view(*args, **kwargs)
+            etag = data_etag(tables)
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+            else:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.cache_control.private = True
+            response.cache_control.no_cache = True  # Always revalidate; unchanged data costs a 304
+            return response
+        return wrapper
+    return decorator
+
+# ========== Compression ==========
+# Text responses above a size threshold are compressed with the best encoding
+# the client accepts: Brotli when the optional brotli package is installed,
+# otherwise gzip. Streamed responses (the CSV export) are compressed chunk by
+# chunk, flushing after each chunk so the download keeps making progress.
+COMPRESS_MIN_SIZE = 1024  # Bytes; smaller bodies are not worth the CPU and headers
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+COMPRESSIBLE_MIMETYPES = frozenset({
+    'text/html', 'text/csv', 'text/plain', 'text/css', 'application/json', 'application/javascript',
+    'text/javascript',
+})
+
+def accepted_encoding():
+    """The preferred content coding this server supports for the request, or None"""
+    return request.accept_encodings.best_match(['br', 'gzip'] if brotli else ['gzip'])
+
+def compress_body(body, encoding):
+    """Compress a whole response body"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip_member(deflate_segment(body), zlib.crc32(body), len(body))
+
+def compress_stream(chunks, encoding):
+    """Compress an iterable of byte chunks, flushing after every chunk"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+def deflate_segment(data):
+    """Raw deflate blocks for data, byte-aligned and not final.
+
+    Segments compressed independently can be concatenated into one deflate
+    stream, which lets cached page fragments be compressed ahead of time.
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+# Header with no file name or timestamp, and an empty final deflate block
+GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+DEFLATE_END = b'\x03\x00'
+
+def gzip_member(deflated, crc, size):
+    """Wrap deflate segments into a gzip body"""
+    return GZIP_HEADER + deflated + DEFLATE_END + struct.pack('<II', crc & 0xffffffff, size & 0xffffffff)
+
+@app.after_request
+def compress_response(response):
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES or response.direct_passthrough:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = accepted_encoding()
+    if encoding is None or request.method == 'HEAD':
+        return response
+    if 'Content-Encoding' in response.headers:
+        pass  # Encoded by the view, e.g. the pre-compressed rating page
+    elif response.status_code == 200:
+        if response.is_streamed:
+            response.response = compress_stream(response.iter_encoded(), encoding)
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < COMPRESS_MIN_SIZE:
+                return response
+            response.set_data(compress_body(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+    elif response.status_code != 304:
+        return response
+    # The compressed bytes differ from the identity ones, so validators become weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+# ========== Static Assets ==========
+# Pages link static files through asset_url(), which adds a hash of the file's
+# content. A versioned URL never changes meaning, so it is cached for a year as
+# immutable; an edited file gets a new URL.
+#
+# Third-party bundles load from jsDelivr at the exact versions below. Entries
+# with a pinned hash can be mirrored under static/vendor with `flask
+# vendor-assets`; a mirrored file that matches its pin is then served locally
+# like any other asset. The mirror is not committed, so the pages still need
+# the CDN until it is, and unpinned entries always come from the CDN.
+STATIC_MAX_AGE = 365 * 24 * 3600
+BOOTSTRAP_VERSION = '5.3.0'
+BOOTSTRAP_ICONS_VERSION = '1.11.0'
+BOOTSTRAP_CDN = f'https://cdn.jsdelivr.net/npm/bootstrap@{BOOTSTRAP_VERSION}/dist'
+BOOTSTRAP_ICONS_CDN = f'https://cdn.jsdelivr.net/npm/bootstrap-icons@{BOOTSTRAP_ICONS_VERSION}/font'
+# Vendored path -> (source URL, pinned SHA-384 in SRI form, or None if not yet
+# pinned). `flask vendor-assets` prints the hash of unpinned entries so they
+# can be checked against the upstream release and pinned here.
+VENDOR_ASSETS = {
+    'vendor/bootstrap/bootstrap.min.css': (
+        f'{BOOTSTRAP_CDN}/css/bootstrap.min.css',
+        'sha384-9ndCyUaIbzAi2FUVXJi0CjmCapSmO7SnpJef0486qhLnuZ2cdeRhO02iuK6FUUVM'),
+    'vendor/bootstrap/bootstrap.bundle.min.js': (
+        f'{BOOTSTRAP_CDN}/js/bootstrap.bundle.min.js',
+        'sha384-geWF76RCwLtnZ8qwWowPQNguL3RmwHVBC9FhGdlKrxdiJJigb/j/68SIy3Te4Bkz'),
+    'vendor/bootstrap-icons/bootstrap-icons.css': (f'{BOOTSTRAP_ICONS_CDN}/bootstrap-icons.css', None),
+    # Referenced by bootstrap-icons.css relative to itself
+    'vendor/bootstrap-icons/fonts/bootstrap-icons.woff2': (f'{BOOTSTRAP_ICONS_CDN}/fonts/bootstrap-icons.woff2', None),
+    'vendor/bootstrap-icons/fonts/bootstrap-icons.woff': (f'{BOOTSTRAP_ICONS_CDN}/fonts/bootstrap-icons.woff', None),
+}
+
+def sri_sha384(data):
+    """SHA-384 digest of data in Subresource Integrity form"""
+    return 'sha384-' + base64.b64encode(hashlib.sha384(data).digest()).decode('ascii')
+
+@lru_cache(maxsize=1)
+def unverified_vendor_assets():
+    """Vendored files served from the CDN instead of static/vendor, with the reason"""
+    problems = {}
+    for filename, (_, pinned) in VENDOR_ASSETS.items():
+        path = static_path(filename)
+        if not pinned:
+            problems[filename] = 'not pinned'
+        elif path is None:
+            problems[filename] = 'not mirrored'
+        else:
+            with open(path, 'rb') as f:
+                if sri_sha384(f.read()) != pinned:
+                    problems[filename] = 'hash mismatch'
+    return problems
+
+def static_path(filename):
+    """Absolute path of a file in the static folder, or None if it is missing"""
+    path = safe_join(app.static_folder, filename)
+    return path if path and os.path.isfile(path) else None
+
+@lru_cache(maxsize=None)
+def asset_digest(filename):
+    """Short content hash of a static file, or None if it is missing"""
+    path = static_path(filename)
+    if path is None:
+        return None
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+def static_files():
+    """Every file in the static folder, relative to it"""
+    for root, _, names in os.walk(app.static_folder):
+        for name in names:
+            yield os.path.relpath(os.path.join(root, name), app.static_folder).replace(os.sep, '/')
+
+@app.template_global()
+def asset_url(filename):
+    """Content-versioned URL of a static file"""
+    if filename in unverified_vendor_assets():
+        return VENDOR_ASSETS[filename][0]  # Not mirrored or not verified; see `flask vendor-assets`
+    digest = asset_digest(filename)
+    if digest is None:
+        raise FileNotFoundError(f"No static file {filename}")
+    return url_for('static', filename=filename, v=digest)
+
+@lru_cache(maxsize=64)
+def encoded_static_file(filename, encoding):
+    """Body of a text asset, compressed once per encoding"""
+    with open(static_path(filename), 'rb') as f:
+        body = f.read()
+    return compress_body(body, encoding) if encoding else body
+
+def serve_static(filename):
+    """Static files, pre-compressed when textual and cached immutably when versioned"""
+    if static_path(filename) is None:
+        raise NotFound()
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    digest = asset_digest(filename)
+    if mimetype in COMPRESSIBLE_MIMETYPES:
+        encoding = accepted_encoding()
+        response = Response(encoded_static_file(filename, encoding), mimetype=mimetype)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.set_etag(digest)
+        response = response.make_conditional(request)
+    else:
+        response = send_from_directory(app.static_folder, filename)
+    if request.args.get('v') == digest:
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+app.view_functions['static'] = serve_static
+
+@app.cli.command('vendor-assets')
+def vendor_assets_command():
+    """Mirror the pinned third-party CSS, JS and fonts into static/vendor.
+
+    Unpinned entries are only downloaded to print their hash; they are never
+    written, so nothing unverified is served as a local immutable asset.
+    """
+    failures = 0
+    for filename, (url, pinned) in VENDOR_ASSETS.items():
+        with urllib.request.urlopen(url, timeout=30) as source:
+            data = source.read()
+        digest = sri_sha384(data)
+        if not pinned:
+            click.echo(f"HASH {filename} {digest}: verify against the release and pin it to mirror this file")
+            continue
+        if digest != pinned:
+            click.echo(f"FAIL {filename}: {url} has {digest}, expected {pinned}")
+            failures += 1
+            continue
+        path = os.path.join(app.static_folder, *filename.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as target:
+            target.write(data)
+        click.echo(f"OK   {filename} {digest}")
+    if failures:
+        raise SystemExit(1)
+
+# ========== Evaluation Filters ==========
+def filter_evaluations(query, filters):
+    """Apply the /evaluations equality filters and the newest-first ordering"""
+    for field in EVALUATION_FILTER_FIELDS:
+        value = filters.get(field)
+        if value:
+            query = query.filter(getattr(Evaluation, field) == value)
+    return query.order_by(Evaluation.created_at.desc(), Evaluation.id.desc())
+
+def explain_query_plan(query):
+    """Return the SQLite query plan details for a query"""
+    sql = str(query.statement.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return [row[-1] for row in rows]
+
+def check_evaluation_query_plans():
+    """Check that every filter combination avoids a full scan and a sort step"""
+    results = []
+    for size in range(len(EVALUATION_FILTER_FIELDS) + 1):
+        for fields in combinations(EVALUATION_FILTER_FIELDS, size):
+            query = filter_evaluations(Evaluation.query, {field: 'x' for field in fields})
+            plan = explain_query_plan(query)
+            full_scan = any(line.startswith('SCAN') and 'USING' not in line for line in plan)
+            sorted_in_temp = any('TEMP B-TREE' in line for line in plan)
+            if fields:
+                # With equality filters the index must be searched, not walked end to end
+                full_scan = full_scan or not any(line.startswith('SEARCH') for line in plan)
+            results.append((fields, plan, not (full_scan or sorted_in_temp)))
+    return results
+
+@app.cli.command('check-query-plans')
+def check_query_plans_command():
+    """Print the query plan of every /evaluations filter combination"""
+    failures = 0
+    for fields, plan, ok in check_evaluation_query_plans():
+        label = ', '.join(fields) or '(no filters)'
+        click.echo(f"{'OK  ' if ok else 'FAIL'} {label}: {' | '.join(plan)}")
+        failures += 0 if ok else 1
+    if failures:
+        raise SystemExit(1)
+
+filter_values_cache = DataCache('evaluation')
+
+def load_filter_values():
+    """Dropdown options per filter field, read from the trigger-maintained lookup table"""
+    options = {field: [] for field in EVALUATION_FILTER_FIELDS}
+    rows = db.session.query(EvaluationFilterValue.field, EvaluationFilterValue.value).order_by(
+        EvaluationFilterValue.field, EvaluationFilterValue.value)
+    for field, value in rows:
+        if field in options:
+            options[field].append((value,))
+    return options
+
+def get_filter_values():
+    """Cached dropdown options for the /evaluations filters"""
+    return filter_values_cache.get('options', load_filter_values)
+
+# ========== Pagination ==========
+def encode_cursor(*values):
+    """Encode keyset values into an opaque, URL-safe page cursor"""
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """Decode a page cursor back into its keyset values, or None if it is missing or invalid"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw.decode('utf-8'))
+        return values if isinstance(values, list) else None
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+def get_page_size():
+    """Read the per_page parameter, clamped to the configured bounds"""
+    page_size = request.args.get('per_page', app.config['PAGE_SIZE'], type=int)
+    return max(1, min(page_size, app.config['MAX_PAGE_SIZE']))
+
+def fetch_page(query, page_size, cursor_values):
+    """Fetch one page of a keyset-ordered query and the cursor of the page after it"""
+    rows = query.limit(page_size + 1).all()
+    next_cursor = encode_cursor(*cursor_values(rows[page_size - 1])) if len(rows) > page_size else None
+    return rows[:page_size], next_cursor
+
+def page_url(cursor):
+    """URL of the current list page with the same filters and another cursor"""
+    args = request.args.to_dict()
+    args.pop('cursor', None)
+    if cursor:
+        args['cursor'] = cursor
+    return url_for(request.endpoint, **args)
+
+# ========== Evaluation Search ==========
+def fts_match_expression(search_query):
+    """Turn free text into an FTS5 query where every word matches a token prefix"""
+    terms = re.findall(r'\w+', search_query)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+def search_evaluations(query, search_query):
+    """Restrict an evaluation query to records matching the search box text"""
+    if FTS_ENABLED:
+        match = fts_match_expression(search_query)
+        if not match:
+            return query
+        matching_ids = db.select(evaluation_fts.c.rowid).where(evaluation_fts.c.evaluation_fts.op('MATCH')(match))
+        return query.filter(Evaluation.id.in_(matching_ids))
+
+    return query.filter(
+        (Evaluation.applicant_name.ilike(f'%{search_query}%')) |
+        (Evaluation.applicant_id.ilike(f'%{search_query}%')) |
+        (Evaluation.judge_name.ilike(f'%{search_query}%'))
+    )
+
+def ranked_evaluation_search(search_query, limit=20):
+    """Return evaluations matching the search text, best match first"""
+    if not FTS_ENABLED:
+        return search_evaluations(Evaluation.query, search_query).order_by(
+            Evaluation.created_at.desc()).limit(limit).all()
+
+    match = fts_match_expression(search_query)
+    if not match:
+        return []
+    ranked = (db.select(evaluation_fts.c.rowid.label('id'), evaluation_fts.c.rank.label('rank'))
+              .where(evaluation_fts.c.evaluation_fts.op('MATCH')(match))
+              .order_by(evaluation_fts.c.rank)
+              .limit(limit)
+              .subquery())
+    return (Evaluation.query.join(ranked, Evaluation.id == ranked.c.id)
+            .order_by(ranked.c.rank).all())
+
+@app.route('/api/search-evaluations')
+def api_search_evaluations():
+    search_query = request.args.get('q', '')
+    limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+
+    results = ranked_evaluation_search(search_query, limit)
+    return jsonify([{
+        "id": e.id,
+        "applicant_name": e.applicant_name,
+        "applicant_id": e.applicant_id,
+        "applicant_role": e.applicant_role,
+        "judge_name": e.judge_name,
+        "judge_role": e.judge_role,
+        "final_score": e.final_score,
+        "decision": e.decision
+    } for e in results])
+
+# ========== Template Registry ==========
+# Page templates are compiled once when the module loads and rendered from the
+# compiled objects, instead of being parsed again by render_template_string on
+# every request.
+TEMPLATES = {}
+
+@app.template_filter('nl2br')
+def nl2br(value):
+    """Escape text and turn its line breaks into <br> tags"""
+    return Markup('<br>\n').join(escape(value).split('\n'))
+
+@app.template_filter('percent')
+def percent(value):
+    """Format a fraction such as a rubric section weight as a whole percentage"""
+    return f"{round(value * 100)}%"
+
+def register_template(name, source):
+    """Compile a page template and add it to the registry"""
+    TEMPLATES[name] = app.jinja_env.from_string(source)
+    TEMPLATE_DIGESTS[name] = hashlib.sha256(source.encode('utf-8')).hexdigest()
+    TEMPLATES[name].name = name
+    return TEMPLATES[name]
+
+def render_page(name, **context):
+    """Render a registered page template with Flask's usual template context"""
+    return render_template(TEMPLATES[name], **context)
+
 # ========== Home Page ==========
-@app.route('/')
-def index():
-    html = """
+dashboard_stats_cache = DataCache('evaluation')
+
+def load_dashboard_stats():
+    """Home page figures from the trigger-maintained counter row"""
+    stats = db.session.get(DashboardStats, 1)
+    if stats is None:
+        return {'applicant_count': 0, 'evaluation_count': 0, 'avg_score': 0, 'acceptance_rate': 0}
+    return {
+        'applicant_count': stats.applicant_count,
+        'evaluation_count': stats.evaluation_count,
+        'avg_score': stats.final_score_sum / stats.evaluation_count if stats.evaluation_count else 0,
+        'acceptance_rate': round(stats.advance_count / stats.decision_count * 100) if stats.decision_count else 0,
+    }
+
+INDEX_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>Sertie Evaluation System</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
-  <style>
-    body {
-      background-color: #B3FFFA;
-      min-height: 100vh;
-    }
-    .container {
-      padding-top: 30px;
-      padding-bottom: 30px;
-    }
-    .card {
-      transition: transform 0.3s, box-shadow 0.3s;
-      border: none;
-      border-radius: 10px;
-      box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-      margin-bottom: 25px;
-    }
-    .card:hover {
-      transform: translateY(-5px);
-      box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-    }
-    .card-header {
-      border-radius: 10px 10px 0 0 !important;
-      font-weight: bold;
-    }
-    .footer {
-      text-align: center;
-      padding: 20px;
-      margin-top: 30px;
-      color: #6c757d;
-    }
-    .stats-box {
-      background: white;
-      border-radius: 10px;
-      padding: 15px;
-      margin-bottom: 20px;
-      box-shadow: 0 4px 10px rgba(0,0,0,0.05);
-      text-align: center;
-    }
-    .stats-number {
-      font-size: 2rem;
-      font-weight: bold;
-      color: #198754;
-    }
-    /* Mobile responsiveness improvements */
-    @media (max-width: 768px) {
-      .container {
-        padding: 15px;
-      }
-      .stats-box {
-        padding: 10px;
-        margin-bottom: 15px;
-      }
-      .stats-number {
-        font-size: 1.5rem;
-      }
-    }
-  </style>
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap/bootstrap.min.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap-icons/bootstrap-icons.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/base.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/index.css') }}">
 </head>
 <body>
   <div class="container">
@@ -358,212 +1761,60 @@ def index():
     </div>
   </div>
 
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
+  <script src="{{ asset_url('vendor/bootstrap/bootstrap.bundle.min.js') }}"></script>
 </body>
 </html>
 """
-    # Calculate statistics
-    applicant_count = db.session.query(func.count(db.distinct(Evaluation.applicant_id))).scalar()
-    evaluation_count = Evaluation.query.count()
-    avg_score = db.session.query(func.avg(Evaluation.final_score)).scalar() or 0
-
-    # Calculate acceptance rate
-    total_decisions = Evaluation.query.filter(Evaluation.decision.in_(['advance', 'waitlist', 'reject'])).count()
-    advances = Evaluation.query.filter_by(decision='advance').count()
-    acceptance_rate = 0 if total_decisions == 0 else round((advances / total_decisions) * 100)
-
-    return render_template_string(html,
-                                  applicant_count=applicant_count,
-                                  evaluation_count=evaluation_count,
-                                  avg_score=f"{avg_score:.1f}",
-                                  acceptance_rate=acceptance_rate)
-
-# ========== Rating Page ==========
-@app.route('/rating')
-def rating_page():
-    # Get role
-    judge_role = request.args.get('role', 'intern').lower()
-
-    if judge_role == 'ceo':
-        judge_name = "Irene Veng"
-    elif judge_role == 'intern1':
-        judge_name = "Wei Wu"
-    else:
-        judge_name = "Yanwen Wang"
+register_template('index.html', INDEX_TEMPLATE)
 
-    # Get applicant ID (if provided)
-    applicant_id = request.args.get('applicant_id', '')
-    applicant = None
+@app.route('/')
+def index():
+    # Counters are maintained at write time; no aggregate queries here
+    stats = dashboard_stats_cache.get('stats', load_dashboard_stats)
 
-    if applicant_id:
-        try:
-            applicant = Applicant.query.filter_by(applicant_id=applicant_id).first()
-        except:
-            # Ignore errors if Applicant table doesn't exist
-            pass
+    return render_page('index.html',
+                       applicant_count=stats['applicant_count'],
+                       evaluation_count=stats['evaluation_count'],
+                       avg_score=f"{stats['avg_score']:.1f}",
+                       acceptance_rate=stats['acceptance_rate'])
 
-    # Define hardcoded video evaluation criteria (avoiding potential function call issues)
-    video_criteria_list = [
-        {
-            "title": "Content Quality (25%)",
-            "items": [
-                {"id": "content_understanding", "label": "Understanding of Sertie Products and Value", "weight": 6.25},
-                {"id": "content_clarity", "label": "Clarity of Viewpoint", "weight": 6.25},
-                {"id": "content_problem_solving", "label": "Problem-Solving Approach", "weight": 6.25},
-                {"id": "content_originality", "label": "Originality and Creativity", "weight": 6.25}
-            ]
-        },
-        {
-            "title": "Presentation Skills (25%)",
-            "items": [
-                {"id": "presentation_clarity", "label": "Communication Clarity", "weight": 8.33},
-                {"id": "presentation_confidence", "label": "Confidence and Expressiveness", "weight": 8.33},
-                {"id": "presentation_structure", "label": "Structure and Organization", "weight": 8.33}
-            ]
-        }
-    ]
+# ========== Rating Page ==========
+def build_rating_video_html(video_groups):
+    """Build the static star-rating markup for the video criteria shown before a position is chosen"""
+    video_html = ""
+    for group in video_groups:
+        video_html += f'<div class="criteria-section"><div class="criteria-title">{group.title}</div>'
+        for item in group.criteria:
+            video_html += f'''
+            <div class="sub-criteria">
+              <div>
+                <label>{item.label} <span class="weight">{item.weight}%</span></label>
+              </div>
+              <div class="star-rating" data-target="{item.id}">
+                <span data-value="1">&#9733;</span>
+                <span data-value="2">&#9733;</span>
+                <span data-value="3">&#9733;</span>
+                <span data-value="4">&#9733;</span>
+                <span data-value="5">&#9733;</span>
+              </div>
+              <input type="hidden" class="video-score" data-weight="{item.weight}" data-type="{item.skill_type}" id="{item.id}" value="0">
+            </div>
+            '''
+        video_html += '</div>'
+    return video_html
 
-    # HTML part of the template
-    head_html = """
+# HTML part of the template
+RATING_HEAD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
   <title>Evaluation - {{ judge_role|capitalize }}</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
-  <style>
-    body {
-      background-color: #B3FFFA;
-      font-family: Arial, sans-serif;
-      margin: 0; padding: 0;
-    }
-    .container {
-      max-width: 900px;
-      margin: 30px auto;
-      background-color: #fff;
-      border-radius: 8px;
-      box-shadow: 0 0 20px rgba(0,0,0,0.1);
-      padding: 20px;
-    }
-    h1 {
-      color: #009688;
-      margin-bottom: 1rem;
-    }
-    .star-rating {
-      display: inline-flex;
-      font-size: 2rem;
-      cursor: pointer;
-    }
-    .star-rating span {
-      color: #ccc;
-      margin: 0 4px;
-      transition: color 0.2s;
-    }
-    .star-rating span.selected {
-      color: #FFC107;
-    }
-    .criteria-section {
-      margin-bottom: 20px;
-      border: 1px solid #eee;
-      border-radius: 8px;
-      padding: 15px;
-      background-color: #fdfdfd;
-    }
-    .criteria-title {
-      font-weight: bold;
-      background-color: #f5f5f5;
-      padding: 10px;
-      border-radius: 6px;
-      margin-bottom: 15px;
-    }
-    .sub-criteria {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-bottom: 15px;
-      padding: 10px;
-      border-bottom: 1px dashed #eee;
-    }
-    .sub-criteria:last-child {
-      border-bottom: none;
-    }
-    .weight {
-      font-size: 0.85rem;
-      color: #666;
-      margin-left: 5px;
-      background-color: #f0f0f0;
-      padding: 2px 6px;
-      border-radius: 4px;
-    }
-    .form-section {
-      background-color: #fff;
-      border-radius: 8px;
-      padding: 20px;
-      margin-bottom: 20px;
-      box-shadow: 0 0 10px rgba(0,0,0,0.05);
-    }
-    .score-display {
-      text-align: center;
-      font-size: 1.2rem;
-      margin: 15px 0;
-      padding: 10px;
-      background-color: #f8f9fa;
-      border-radius: 8px;
-    }
-    .btn-group {
-      display: flex;
-      justify-content: space-between;
-      margin-top: 30px;
-    }
-    .btn-group button {
-      min-width: 120px;
-      padding: 10px 20px;
-    }
-    .result-section {
-      margin-top: 30px;
-      border: 1px solid #dee2e6;
-      border-radius: 8px;
-      padding: 20px;
-      background-color: #f8f9fa;
-    }
-    .final-score {
-      font-size: 2.5rem;
-      font-weight: bold;
-      color: #009688;
-      text-align: center;
-      margin: 20px 0;
-    }
-    .progress {
-      height: 8px;
-      margin-bottom: 10px;
-    }
-    .nav-pills .nav-link.active {
-      background-color: #009688;
-    }
-    /* Mobile responsiveness improvements */
-    @media (max-width: 768px) {
-      .container {
-        padding: 10px;
-        margin: 10px auto;
-      }
-      .sub-criteria {
-        flex-direction: column;
-        align-items: flex-start;
-      }
-      .star-rating {
-        margin-top: 10px;
-      }
-      .btn-group {
-        flex-direction: column;
-      }
-      .btn-group button {
-        margin-bottom: 10px;
-        width: 100%;
-      }
-    }
-  </style>
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap/bootstrap.min.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap-icons/bootstrap-icons.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/base.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/rating.css') }}">
 </head>
 <body>
   <div class="container">
@@ -642,28 +1893,28 @@ def rating_page():
               <div class="mb-3">
                 <label for="applicant-name" class="form-label">Applicant Name:</label>
                 <input type="text" class="form-control" id="applicant-name"
-                       placeholder="Enter name" value="{{ applicant.name if applicant else '' }}">
+                       placeholder="Enter name">
               </div>
             </div>
               <div class="col-md-6">
                 <div class="mb-3">
                   <label for="applicant-university" class="form-label">University:</label>
                   <input type="text" class="form-control" id="applicant-university"
-                         placeholder="Enter university" value="{{ applicant.university if applicant else '' }}">
+                         placeholder="Enter university">
                 </div>
               </div>
               <div class="col-md-6">
                 <div class="mb-3">
                   <label for="applicant-email" class="form-label">Email:</label>
                   <input type="email" class="form-control" id="applicant-email"
-                         placeholder="Enter email" value="{{ applicant.email if applicant else '' }}">
+                         placeholder="Enter email">
                 </div>
               </div>
              <div class="col-md-4">
                <div class="mb-3">
                  <label for="applicant-id" class="form-label">Applicant ID:</label>
                  <input type="text" class="form-control" id="applicant-id"
-                        placeholder="Enter ID" value="{{ applicant.applicant_id if applicant else '' }}">
+                        placeholder="Enter ID">
                </div>
               </div>
              <div class="col-md-4">
@@ -733,30 +1984,8 @@ def rating_page():
           </p>
 """
 
-    # Manually build video evaluation section
-    video_html = ""
-    for group in video_criteria_list:
-        video_html += f'<div class="criteria-section"><div class="criteria-title">{group["title"]}</div>'
-        for item in group['items']:
-            video_html += f'''
-            <div class="sub-criteria">
-              <div>
-                <label>{item['label']} <span class="weight">{item['weight']}%</span></label>
-              </div>
-              <div class="star-rating" data-target="{item['id']}">
-                <span data-value="1">&#9733;</span>
-                <span data-value="2">&#9733;</span>
-                <span data-value="3">&#9733;</span>
-                <span data-value="4">&#9733;</span>
-                <span data-value="5">&#9733;</span>
-              </div>
-              <input type="hidden" class="video-score" data-weight="{item['weight']}" id="{item['id']}" value="0">
-            </div>
-            '''
-        video_html += '</div>'
-
-    # Remaining HTML part
-    tail_html = """
+# Remaining HTML part
+RATING_TAIL_HTML = """
         </div>
 
         <div class="row mb-4">
@@ -804,19 +2033,19 @@ def rating_page():
         <div class="row mb-4">
           <div class="col-md-4">
             <div class="score-display">
-              <div class="fw-bold">Resume (40%)</div>
+              <div class="fw-bold">Resume ({{ sections.resume|percent }})</div>
               <div id="resume-display" class="fs-4">0.0</div>
             </div>
           </div>
           <div class="col-md-4">
             <div class="score-display">
-              <div class="fw-bold">Video (50%)</div>
+              <div class="fw-bold">Video ({{ sections.video|percent }})</div>
               <div id="video-display" class="fs-4">0.0</div>
             </div>
           </div>
           <div class="col-md-4">
             <div class="score-display">
-              <div class="fw-bold">Motivation (10%)</div>
+              <div class="fw-bold">Motivation ({{ sections.motivation|percent }})</div>
               <div id="motivation-display" class="fs-4">0.0</div>
             </div>
           </div>
@@ -902,1336 +2131,345 @@ def rating_page():
     </div>
   </div>
 
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-  <script>
-    document.addEventListener('DOMContentLoaded', () => {
-      // Set default date
-      document.getElementById('evaluation-date').valueAsDate = new Date();
-      
-      // Check if a position is already selected, apply scoring framework immediately if so
-      setTimeout(() => {
-        const position = document.getElementById('applying-role').value;
-        if (position) {
-          buildResumeCriteria();
-          buildVideoCriteria();
-          applyRoleWeights();
-          updateScores();
-        }
-      }, 300);      
-      
-      // Update assessment criteria when position changes
-      document.getElementById('applying-role').addEventListener('change', function() {
-        updateResumeCriteria();      // Update resume criteria
-        rebuildVideoCriteria();      // Rebuild video criteria
-        applyRoleWeights();          // Apply position-specific weights
-        updateScores();              // Update scores
-      });
-    
-      // Initialize star ratings
-      initializeStarRatings();
-    
-      // Initialize progress saving
-      initProgressSaving();
-    
-      // Reset button
-      document.getElementById('resetBtn').addEventListener('click', () => {
-        if(!confirm('Are you sure you want to reset all evaluation data?')) return;
-    
-        document.getElementById('applicant-name').value = '';
-        document.getElementById('applicant-id').value = '';
-        document.getElementById('applying-role').selectedIndex = 0;
-        document.getElementById('resume-score').value = '';
-        document.getElementById('applicant-university').value = '';
-        document.getElementById('applicant-email').value = '';
-    
-        document.querySelectorAll('.video-score, .resume-score, .motivation-score').forEach(inp => {
-          inp.value = '0';
-        });
-    
-        document.querySelectorAll('.star-rating span').forEach(star => {
-          star.classList.remove('selected');
-          star.style.color = '#ccc';
-        });
-    
-        document.getElementById('decision').selectedIndex = 0;
-        document.getElementById('notes').value = '';
-    
-        updateScores();
-      });
-    
-      // Save evaluation
-      document.getElementById('saveBtn').addEventListener('click', () => {
-        // Input validation
-        const requiredFields = [
-          { id: 'applicant-name', name: 'Applicant Name' },
-          { id: 'applicant-id', name: 'Applicant ID' },
-          { id: 'applying-role', name: 'Position Applied' },
-          { id: 'resume-score', name: 'Resume Score' },
-          { id: 'decision', name: 'Decision' }
-        ];
-    
-        let missingFields = [];
-        requiredFields.forEach(field => {
-          const value = document.getElementById(field.id).value;
-          if (!value) missingFields.push(field.name);
-        });
-    
-        if (missingFields.length > 0) {
-          alert('Please complete the following required fields: ' + missingFields.join(', '));
-          return;
-        }
-    
-        // Collect data
-        const judgeName = document.getElementById('judge-name').value || '';
-        const judgeRole = document.getElementById('judge-role').value || '';
-        const dateVal = document.getElementById('evaluation-date').value;
-        const applicantName = document.getElementById('applicant-name').value || '';
-        const applicantId = document.getElementById('applicant-id').value || '';
-        const applicantRole = document.getElementById('applying-role').value || '';
-        const applicantUniversity = document.getElementById('applicant-university').value || '';
-        const applicantEmail = document.getElementById('applicant-email').value || '';
-        const resumeScore = parseFloat(document.getElementById('resume-score').value) || 0;
-        const videoScore = parseFloat(document.getElementById('video-display').textContent) || 0;
-        const motivationScore = parseFloat(document.getElementById('motivation-display').textContent) || 0;
-        const finalScore = parseFloat(document.getElementById('final-score').textContent) || 0;
-        const decision = document.getElementById('decision').value || '';
-        const notes = document.getElementById('notes').value || '';
-    
-        if (applicantEmail && !applicantEmail.includes('@')) {
-        　alert('Please enter a valid email address');
-        　return;
-        }
-    
-        // Collect video ratings
-        const videoRatings = {};
-        document.querySelectorAll('.video-score').forEach(inp => {
-          if(inp.id){
-            videoRatings[inp.id] = {
-              score: parseFloat(inp.value) || 0,
-              weight: parseFloat(inp.dataset.weight) || 0
-            };
-          }
-        });
-    
-        // Collect resume ratings
-        const resumeRatings = {};
-        document.querySelectorAll('.resume-score').forEach(inp => {
-          if(inp.id){
-            resumeRatings[inp.id] = {
-              score: parseFloat(inp.value) || 0,
-              weight: parseFloat(inp.dataset.weight) || 0
-            };
-          }
-        });
-    
-        // Collect motivation rating (ensure it's only collected once)
-        const motivationInput = document.getElementById('motivation_enthusiasm');
-        if (motivationInput) {
-          videoRatings['motivation_enthusiasm'] = {
-            score: parseFloat(motivationInput.value) || 0,
-            weight: 10
-          };
-        }
-    
-        const payload = {
-          judge_name: judgeName,
-          judge_role: judgeRole,
-          evaluation_date: dateVal,
-          applicant_name: applicantName,
-          applicant_id: applicantId,
-          applicant_role: applicantRole,
-          applicant_university: applicantUniversity,
-          applicant_email: applicantEmail,
-          resume_score: resumeScore.toFixed(1),
-          resume_ratings: resumeRatings,
-          video_score: videoScore.toFixed(1),
-          video_ratings: videoRatings,
-          motivation_score: motivationScore.toFixed(1),
-          final_score: finalScore.toFixed(1),
-          decision: decision,
-          notes: notes
-        };
-    
-        // Submit data
-        fetch('/api/save-rating', {
-          method: 'POST',
-          headers: {'Content-Type':'application/json'},
-          body: JSON.stringify(payload)
-        })
-        .then(res => res.json())
-        .then(data => {
-          if(data.error){
-            alert('Save failed: ' + data.error);
-          } else {
-            alert('Evaluation saved successfully! Record ID: ' + data.evaluation_id);
-    
-            // Redirect or clear form
-            if (confirm('Would you like to evaluate another applicant?')) {
-              // Reset form data directly without additional confirmation
-              document.getElementById('applicant-name').value = '';
-              document.getElementById('applicant-id').value = '';
-              document.getElementById('applicant-university').value = '';
-              document.getElementById('applicant-email').value = '';
-              document.getElementById('applying-role').selectedIndex = 0;
-              document.getElementById('resume-score').value = '';
-    
-              document.querySelectorAll('.video-score, .resume-score, .motivation-score').forEach(inp => {
-                inp.value = '0';
-              });
-    
-              document.querySelectorAll('.star-rating span').forEach(star => {
-                star.classList.remove('selected');
-                star.style.color = '#ccc';
-              });
-    
-              document.getElementById('decision').selectedIndex = 0;
-              document.getElementById('notes').value = '';
-    
-              // Clear saved progress
-              sessionStorage.removeItem('evaluation-progress');
-    
-              // Redirect to home page
-              window.location.href = '/';
-            } else {
-              window.location.href = '/evaluations';
-            }
-          }
-        })
-        .catch(error => {
-          alert('An error occurred during save: ' + error);
-        });
-      });
-    
-      // Set default weights
-      setTimeout(() => {
-        document.querySelectorAll('.video-score').forEach(input => {
-          if (!input.hasAttribute('data-base-weight')) {
-            input.setAttribute('data-base-weight', input.dataset.weight);
-          }
-        });
-    
-        // If position is selected, create video evaluation section
-        const position = document.getElementById('applying-role').value;
-        if (position) {
-          buildResumeCriteria();
-          buildVideoCriteria();
-          applyRoleWeights();
-        }
-      }, 500);
-    
-      // Add skill type explanations
-      setTimeout(addSkillTypeHelp, 1000);
-    });    
-    
-    
-    
-    
-    // --- Helper Functions ---
-  // If more complex logic is needed later, expand these functions
-  function updateResumeCriteria() {
-    buildResumeCriteria();
-  }
-  function buildResumeCriteria() {
-    applyRoleWeights();
-  }
-  
-  
-  
-  
-
-    // Star rating functionality
-    function initializeStarRatings() {
-      const starGroups = document.querySelectorAll('.star-rating');
-      starGroups.forEach(group => {
-        let currentScore = 0;
-        const stars = group.querySelectorAll('span');
-        const targetId = group.dataset.target;
-        const hiddenInput = document.getElementById(targetId);
-
-        group.addEventListener('mouseover', e => {
-          if(e.target.dataset.value){
-            highlightStars(stars, e.target.dataset.value);
-          }
-        });
-
-        group.addEventListener('mouseout', () => {
-          highlightStars(stars, currentScore);
-        });
-
-        group.addEventListener('click', e => {
-          if(e.target.dataset.value){
-            currentScore = parseInt(e.target.dataset.value);
-            hiddenInput.value = currentScore;
-            highlightStars(stars, currentScore);
-            updateScores();
-          }
-        });
-      });
-    }
+  <!-- applicant-prefill -->
+  <script src="{{ asset_url('vendor/bootstrap/bootstrap.bundle.min.js') }}"></script>
+  <script src="{{ asset_url('js/rating.js') }}" data-rubric-url="{{ rubric_url }}"></script>
+</body>
+</html>
+"""
 
-    function highlightStars(stars, score){
-      stars.forEach(star => {
-        const val = parseInt(star.dataset.value);
-        star.style.color = (val <= score) ? '#FFC107' : '#ccc';
-        if(val <= score){
-          star.classList.add('selected');
-        } else {
-          star.classList.remove('selected');
-        }
-      });
-    }
+RATING_TEMPLATE = RATING_HEAD_HTML + build_rating_video_html(get_rubric().default.video) + RATING_TAIL_HTML
+register_template('rating.html', RATING_TEMPLATE)
 
-    // Get resume evaluation criteria
-    function getResumeVCCriteria(position) {
-      const criteria = [
-        {
-          title: "Hard Skills Assessment",
-          items: [
-            {id: "resume_technical", weight: 15, label: "Technical Proficiency", type: "hard",
-             description: "Relevant courses, technical training, and professional knowledge"},
-            {id: "resume_experience", weight: 10, label: "Relevant Experience", type: "hard",
-             description: "Relevant internships and project experience"}
-          ]
-        },
-        {
-          title: "Soft Skills Assessment",
-          items: [
-            {id: "resume_leadership", weight: 10, label: "Extracurricular & Leadership", type: "soft",
-             description: "Team collaboration, activity participation, and leadership experience"},
-            {id: "resume_presentation", weight: 5, label: "Resume Presentation", type: "soft",
-             description: "Resume format, organization, and professional presentation"}
-          ]
-        }
-      ];
+RATING_PREFILL_MARKER = '<!-- applicant-prefill -->'
 
-      
-    // Adjust labels based on position
-      if (position === "financial-analyst") {
-        criteria[0].items[0].label = "Financial Modeling & Valuation";
-        criteria[0].items[0].description = "Financial modeling, valuation analysis, and investment return calculation";
-        criteria[0].items[1].label = "Financial Analysis & Investment Experience";
-        criteria[0].items[1].description = "Financial analysis, due diligence, and investment justification";
-        criteria[1].items[0].label = "Networking & Relationship Building";
-        criteria[1].items[0].description = "Industry network building and investor relations management";
-      }
-      else if (position === "research-analyst") {
-        criteria[0].items[0].label = "Market & Industry Trend Analysis";
-        criteria[0].items[0].description = "Market intelligence gathering and industry trend analysis";
-        criteria[0].items[1].label = "Data Analysis & Research Methods";
-        criteria[0].items[1].description = "Data analysis tools and research methodology application";
-        criteria[1].items[0].label = "Learning Agility for Emerging Trends";
-        criteria[1].items[0].description = "Adaptability and acuity in identifying emerging trends";
-      }
-      else if (position === "operations-analyst") {
-        criteria[0].items[0].label = "Business Process Optimization";
-        criteria[0].items[0].description = "Business process analysis and optimization design";
-        criteria[0].items[1].label = "Project Management & Operations";
-        criteria[0].items[1].description = "Project management and business operations support";
-        criteria[1].items[0].label = "Adaptability & Problem Solving";
-        criteria[1].items[0].description = "Adaptability to challenges and innovative solution development";
-      }
-      return criteria;
-    }
+def get_judge_name(judge_role):
+    """Return the evaluator name for a judge role"""
+    if judge_role == 'ceo':
+        return "Irene Veng"
+    elif judge_role == 'intern1':
+        return "Wei Wu"
+    return "Yanwen Wang"
 
-    // Get video evaluation criteria
-    function getVideoVCCriteria(position) {
-      const criteria = [
-        {
-          title: "Content Quality Assessment (25%)",
-          items: [
-            {id: "content_understanding", weight: 12.5, label: "Product & Market Understanding", type: "hard",
-             description: "Analysis of Sertie's value proposition and market opportunities"},
-            {id: "content_marketing", weight: 12.5, label: "Marketing Strategy Analysis", type: "hard",
-             description: "Evaluation of current marketing and Premium Service promotion plan"}
-          ]
-        },
-        {
-          title: "Presentation Skills Assessment (25%)",
-          items: [
-            {id: "presentation_creativity", weight: 8.33, label: "Creative Expression", type: "soft",
-             description: "Uniqueness of video format and personal style presentation"},
-            {id: "presentation_clarity", weight: 8.33, label: "Communication Clarity", type: "soft",
-             description: "Accuracy and fluency of information delivery"},
-            {id: "presentation_structure", weight: 8.33, label: "Structure & Time Management", type: "soft",
-             description: "Completeness of content organization and reasonable time allocation within 3 minutes"}
-          ]
-        }
-      ];
+@lru_cache(maxsize=32)
+def rating_page_shell(judge_role):
+    """Render the rating page for a judge role once.
 
-      
-// Adjust assessment focus based on position
-      if (position === "financial-analyst") {
-        criteria[0].items[0].description += ", with focus on business model and profitability analysis";
-        criteria[0].items[1].description += ", with focus on ROI and budget allocation analysis";
-        criteria[1].items[1].label = "Investment Proposal Presentation";
-        criteria[1].items[1].description = "Clarity and persuasiveness of investment logic presentation";
-      }
-      else if (position === "research-analyst") {
-        criteria[0].items[0].description += ", with focus on market opportunity assessment and data support";
-        criteria[0].items[1].description += ", with focus on target user insights and effect prediction";
-        criteria[1].items[1].label = "Research Findings Presentation";
-        criteria[1].items[1].description = "Clarity of research conclusions and insights presentation";
-      }
-      else if (position === "operations-analyst") {
-        criteria[0].items[0].description += ", with focus on service improvement and user experience optimization";
-        criteria[0].items[1].description += ", with focus on execution planning and operability";
-        criteria[1].items[1].label = "Stakeholder Management";
-        criteria[1].items[1].description = "Clarity and effectiveness of communication with various parties";
-      }
-    
-      return criteria;
-    }
+    Returns the markup before and after the applicant prefill island and a
+    digest of the whole shell for building ETags.
+    """
+    html = render_page('rating.html', judge_role=judge_role, judge_name=get_judge_name(judge_role),
+                       sections=get_rubric().sections,
+                       rubric_url=url_for('api_rubric', v=CURRENT_RUBRIC_VERSION))
+    head, _, tail = html.partition(RATING_PREFILL_MARKER)
+    return head, tail, hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+@lru_cache(maxsize=32)
+def compressed_rating_shell(judge_role):
+    """The rating page shell as pre-compressed deflate segments.
+
+    Returns the encoded head, its deflate segment and CRC-32, and the encoded
+    tail and its deflate segment. Only the prefill island is compressed per
+    request, then the three segments are joined into a gzip body.
+    """
+    head, tail, _ = rating_page_shell(judge_role)
+    head, tail = head.encode('utf-8'), tail.encode('utf-8')
+    return head, deflate_segment(head), zlib.crc32(head), tail, deflate_segment(tail)
+
+def gzip_rating_page(judge_role, island):
+    """Gzip body of the rating page from the pre-compressed shell"""
+    head, head_deflated, head_crc, tail, tail_deflated = compressed_rating_shell(judge_role)
+    island = island.encode('utf-8')
+    crc = zlib.crc32(tail, zlib.crc32(island, head_crc))
+    return gzip_member(head_deflated + deflate_segment(island) + tail_deflated,
+                       crc, len(head) + len(island) + len(tail))
+
+@lru_cache(maxsize=256)
+def brotli_rating_page(judge_role, island):
+    """Brotli body of the rating page; Brotli cannot join segments, so whole pages are cached"""
+    head, tail, _ = rating_page_shell(judge_role)
+    return compress_body((head + island + tail).encode('utf-8'), 'br')
 
+@app.route('/rating')
+def rating_page():
+    # Get role
+    judge_role = request.args.get('role', 'intern').lower()
 
-    // Get weight factors for each position
-    function getRoleWeights(position) {
-      if (position === "financial-analyst") {
-        return { hard: 0.7, soft: 0.3 };
-      }
-      else if (position === "research-analyst") {
-        return { hard: 0.4, soft: 0.6 };
-      }
-      else if (position === "operations-analyst") {
-        return { hard: 0.2, soft: 0.8 };
-      }
-
-      // Default to balanced weights
-      return { hard: 0.5, soft: 0.5 };
-    }
+    # Get applicant ID (if provided)
+    applicant_id = request.args.get('applicant_id', '')
+    applicant = None
 
-    // Build resume evaluation section
-    function buildResumeCriteria() {
-      const position = document.getElementById('applying-role').value;
-      const container = document.getElementById('resume-criteria-container');
-
-      if (!position) {
-        container.innerHTML = '<p class="text-muted">Please select a position first to display relevant criteria</p>';
-        return;
-      }
-
-      // Get position weights
-      const weights = getRoleWeights(position);
-      const hardWeight = weights.hard * 100;
-      const softWeight = weights.soft * 100;
-
-      // Get evaluation criteria
-      const criteria = getResumeVCCriteria(position);
-
-      // Build HTML
-      let html = `
-        <div class="alert alert-info">
-          <i class="bi bi-info-circle"></i> <strong>${getPositionName(position)}</strong>
-          Weight Distribution: Hard Skills ${hardWeight}% / Soft Skills ${softWeight}%
-        </div>
-      `;
-
-      // Scoring reference
-      html += `
-        <div class="mb-3 small text-muted">
-          <strong>Scoring Reference:</strong>
-          <span class="badge bg-danger">1★</span> Does not meet requirements
-          <span class="badge bg-warning text-dark">2★</span> Meets basic requirements
-          <span class="badge bg-primary">3★</span> Meets expectations
-          <span class="badge bg-info">4★</span> Exceeds expectations
-          <span class="badge bg-success">5★</span> Outstanding performance
-        </div>
-      `;
+    if applicant_id:
+        try:
+            applicant = Applicant.query.filter_by(applicant_id=applicant_id).first()
+        except:
+            # Ignore errors if Applicant table doesn't exist
+            pass
 
-      // Build each evaluation item
-      criteria.forEach(group => {
-        html += `<div class="criteria-section"><div class="criteria-title">${group.title}</div>`;
+    # Applicant-specific values go into a small JSON island; the rest is the cached shell
+    prefill = {}
+    if applicant:
+        prefill = {
+            "name": applicant.name,
+            "university": applicant.university,
+            "email": applicant.email,
+            "applicant_id": applicant.applicant_id
+        }
+    island = f'<script id="applicant-prefill" type="application/json">{htmlsafe_json_dumps(prefill)}</script>'
+
+    head, tail, shell_digest = rating_page_shell(judge_role)
+    encoding = accepted_encoding()
+    if encoding == 'gzip':
+        response = Response(gzip_rating_page(judge_role, island), content_type='text/html; charset=utf-8')
+        response.headers['Content-Encoding'] = 'gzip'
+    elif encoding == 'br':
+        response = Response(brotli_rating_page(judge_role, island), content_type='text/html; charset=utf-8')
+        response.headers['Content-Encoding'] = 'br'
+    else:
+        response = Response(head + island + tail, content_type='text/html; charset=utf-8')
+    response.set_etag(hashlib.sha256((shell_digest + island).encode('utf-8')).hexdigest()[:32])
+    response.cache_control.no_cache = True  # Always revalidate; unchanged pages cost a 304
+    return response.make_conditional(request)
 
-        group.items.forEach(item => {
-          const itemType = item.type === "hard" ? "Hard Skill" : "Soft Skill";
-          const typeClass = item.type === "hard" ? "badge bg-danger" : "badge bg-success";
+# ========== Save Rating API ==========
+IDEMPOTENCY_KEY_MAX_LENGTH = 64
+BATCH_SAVE_MAX_ITEMS = 500
 
-          html += `
-            <div class="sub-criteria">
-              <div>
-                <label>${item.label} <span class="weight">${item.weight}%</span></label>
-                <span class="${typeClass} ms-2">${itemType}</span>
-                <div class="small text-muted">${item.description}</div>
-              </div>
-              <div class="star-rating" data-target="${item.id}">
-                <span data-value="1" title="Does not meet requirements">&#9733;</span>
-                <span data-value="2" title="Meets basic requirements">&#9733;</span>
-                <span data-value="3" title="Meets expectations">&#9733;</span>
-                <span data-value="4" title="Exceeds expectations">&#9733;</span>
-                <span data-value="5" title="Outstanding performance">&#9733;</span>
-              </div>
-              <input type="hidden" class="resume-score"
-                     data-weight="${item.weight}"
-                     data-type="${item.type}"
-                     id="${item.id}" value="0">
-            </div>
-          `;
-        });
+def get_idempotency_key(data, use_header=True):
+    """Idempotency key from the Idempotency-Key header or the payload, or None"""
+    key = (request.headers.get('Idempotency-Key') if use_header else None) or data.get('idempotency_key') or None
+    if key is not None and len(str(key)) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise ValueError(f"idempotency key longer than {IDEMPOTENCY_KEY_MAX_LENGTH} characters")
+    return str(key) if key is not None else None
 
-        html += '</div>';
-      });
+def find_idempotent_evaluation(key):
+    """Id of the evaluation already saved under an idempotency key, or None.
 
-      container.innerHTML = html;
-      initializeStarRatings();
-    }
+    The key may belong to a version that has since been superseded.
+    """
+    if not key:
+        return None
+    evaluation_id = db.session.query(Evaluation.id).filter_by(idempotency_key=key).scalar()
+    if evaluation_id is None:
+        evaluation_id = db.session.query(EvaluationRevision.evaluation_id).filter_by(idempotency_key=key).scalar()
+    return evaluation_id
+
+def find_idempotent_evaluations(keys):
+    """Map each already-used idempotency key to its evaluation id, in two indexed lookups"""
+    keys = [k for k in set(keys) if k]
+    if not keys:
+        return {}
+    found = dict(db.session.query(EvaluationRevision.idempotency_key, EvaluationRevision.evaluation_id)
+                 .filter(EvaluationRevision.idempotency_key.in_(keys)))
+    found.update(db.session.query(Evaluation.idempotency_key, Evaluation.id)
+                 .filter(Evaluation.idempotency_key.in_(keys)))
+    return found
+
+def upsert_applicants(rows):
+    """Insert applicants, or only update the status of existing ones, as one executemany upsert"""
+    if not rows:
+        return
+    stmt = sqlite_insert(Applicant)
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=[Applicant.applicant_id],
+        set_={'status': stmt.excluded.status}), rows)
+
+def payload_value(data, field, default):
+    """Raw payload field; required without a default, otherwise missing or null means the default"""
+    if default is None:
+        return data[field]
+    value = data.get(field)
+    return default if value is None else value
+
+def payload_text(data, field, default=None):
+    """A string field of a payload; KeyError if required and missing, ValueError if not a string"""
+    value = payload_value(data, field, default)
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be a string")
+    return value
 
-    // Build video evaluation section
-    function buildVideoCriteria() {
-      const position = document.getElementById('applying-role').value;
-      if (!position) return;
-    
-      // Get video evaluation section container
-      const videoSection = document.querySelector('#step3 .form-section');
-      if (!videoSection) return;
-    
-      // Get position weights
-      const weights = getRoleWeights(position);
-      const hardWeight = weights.hard * 100;
-      const softWeight = weights.soft * 100;
-    
-      // Video evaluation criteria
-      const criteria = getVideoVCCriteria(position);
-    
-      // Build HTML
-      let html = `
-        <h4><i class="bi bi-camera-video"></i> Video Evaluation</h4>
-        <p class="text-muted mb-3">Rate the applicant's video performance on the following criteria (1-5 stars).</p>
-    
-        <div class="alert alert-info">
-          <i class="bi bi-info-circle"></i> <strong>${getPositionName(position)}</strong>
-          Weight Distribution: Hard Skills ${hardWeight}% / Soft Skills ${softWeight}%
-        </div>
-    
-        <div class="mb-3 small text-muted">
-          <strong>Scoring Reference:</strong>
-          <span class="badge bg-danger">1★</span> Does not meet requirements
-          <span class="badge bg-warning text-dark">2★</span> Meets basic requirements
-          <span class="badge bg-primary">3★</span> Meets expectations
-          <span class="badge bg-info">4★</span> Exceeds expectations
-          <span class="badge bg-success">5★</span> Outstanding performance
-        </div>
-      `;
-    
-      // Build evaluation items
-      criteria.forEach(group => {
-        html += `<div class="criteria-section"><div class="criteria-title">${group.title}</div>`;
-    
-        group.items.forEach(item => {
-          const itemType = item.type === "hard" ? "Hard Skill" : "Soft Skill";
-          const typeClass = item.type === "hard" ? "badge bg-danger" : "badge bg-success";
-    
-          html += `
-            <div class="sub-criteria">
-              <div>
-                <label>${item.label} <span class="weight">${item.weight}%</span></label>
-                <span class="${typeClass} ms-2">${itemType}</span>
-                <div class="small text-muted">${item.description}</div>
-              </div>
-              <div class="star-rating" data-target="${item.id}">
-                <span data-value="1" title="Does not meet requirements">&#9733;</span>
-                <span data-value="2" title="Meets basic requirements">&#9733;</span>
-                <span data-value="3" title="Meets expectations">&#9733;</span>
-                <span data-value="4" title="Exceeds expectations">&#9733;</span>
-                <span data-value="5" title="Outstanding performance">&#9733;</span>
-              </div>
-              <input type="hidden" class="video-score"
-                     data-weight="${item.weight}"
-                     data-type="${item.type}"
-                     id="${item.id}" value="0">
-            </div>
-          `;
-        });
-    
-        html += '</div>';
-      });
-    
-      // Add detailed score display section
-      html += `
-        <div class="row mb-4">
-          <div class="col-md-4">
-            <div class="score-display">
-              <div class="fw-bold">Hard Skills Score</div>
-              <div id="hard-skills-display" class="fs-4">0.0</div>
-            </div>
-          </div>
-          <div class="col-md-4">
-            <div class="score-display">
-              <div class="fw-bold">Soft Skills Score</div>
-              <div id="soft-skills-display" class="fs-4">0.0</div>
-            </div>
-          </div>
-          <div class="col-md-4">
-            <div class="score-display">
-              <div class="fw-bold">Video Total</div>
-              <div id="video-total-display" class="fs-4">0.0</div>
-            </div>
-          </div>
-        </div>
-      `;
-    
-      // Set container content
-      videoSection.innerHTML = html;
-    
-      // Remove existing motivation section (if any)
-      const existingMotivationSection = document.getElementById('motivation-section');
-      if (existingMotivationSection) {
-        existingMotivationSection.remove();
-      }
-    
-      // Add motivation assessment section
-      const motivationHtml = `
-        <div class="form-section" id="motivation-section">
-          <h4><i class="bi bi-heart"></i> Motivation Assessment (10%)</h4>
-          <p class="text-muted mb-3">
-            Please assess the applicant's enthusiasm and fit for the position (1-5 stars).
-          </p>
-    
-          <div class="sub-criteria">
-            <div>
-              <label>Career Plan Alignment <span class="weight">10%</span></label>
-              <div class="small text-muted">Position understanding, career development plan alignment, and learning motivation</div>
-            </div>
-            <div class="star-rating" data-target="motivation_enthusiasm">
-              <span data-value="1" title="Does not meet requirements">&#9733;</span>
-              <span data-value="2" title="Meets basic requirements">&#9733;</span>
-              <span data-value="3" title="Meets expectations">&#9733;</span>
-              <span data-value="4" title="Exceeds expectations">&#9733;</span>
-              <span data-value="5" title="Outstanding performance">&#9733;</span>
-            </div>
-            <input type="hidden" id="motivation_enthusiasm" class="motivation-score" data-weight="10" value="0">
-          </div>
-          
-          <!-- Add motivation score display -->
-          <div class="row mt-4">
-            <div class="col-md-6 mx-auto">
-              <div class="score-display text-center">
-                <div class="fw-bold">Motivation Score</div>
-                <div id="motivation-total-display" class="fs-4">0.0</div>
-              </div>
-            </div>
-          </div>
-        </div>
-      `;
-    
-      // Add motivation assessment section
-      videoSection.insertAdjacentHTML('afterend', motivationHtml);
-    
-      // Initialize star ratings
-      initializeStarRatings();
-    }
+def payload_number(data, field, default=None):
+    """A finite number field of a payload, given as a number or numeric string"""
+    value = payload_value(data, field, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{field} must be a number")
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"{field} must be a number") from None
+    if not math.isfinite(number):
+        raise ValueError(f"{field} must be a finite number")
+    return number
+
+def payload_ratings(data, field):
+    """A {criterion_id: score or {score, weight}} ratings object of a payload"""
+    ratings = data.get(field) or {}
+    if not isinstance(ratings, dict):
+        raise ValueError(f"{field} must be an object")
+    return ratings
+
+def parse_evaluation_payload(data):
+    """Validate one save-rating payload.
+
+    Returns a dict with the evaluation column values ('fields'), the criterion
+    ratings and the applicant row to upsert. Raises KeyError for missing and
+    ValueError for malformed fields.
+    """
+    judge_role = payload_text(data, 'judge_role', '').lower()
+    applicant_name = payload_text(data, 'applicant_name')
+    applicant_id = payload_text(data, 'applicant_id')
+    applicant_role = payload_text(data, 'applicant_role')
+    resume_score = payload_number(data, 'resume_score')
+    video_score = payload_number(data, 'video_score')
+    final_score = payload_number(data, 'final_score')
+    decision = payload_text(data, 'decision')
+    video_ratings = payload_ratings(data, 'video_ratings')
+    resume_ratings = payload_ratings(data, 'resume_ratings')
+    motivation_score = payload_number(data, 'motivation_score', 0)
+
+    # Score from the criteria ratings rather than trusting the submitted totals
+    if has_scoring_ratings(resume_ratings, video_ratings):
+        resume_score, video_score, motivation_score, final_score = score_evaluation(
+            applicant_role, resume_ratings, video_ratings)
+        rubric_version = CURRENT_RUBRIC_VERSION
+    else:
+        rubric_version = None
 
+    # Parse date
+    evaluation_date_str = payload_text(data, 'evaluation_date', '')
+    if evaluation_date_str:
+        eval_date = datetime.strptime(evaluation_date_str, '%Y-%m-%d')
+    else:
+        eval_date = datetime.now()
 
-    
-    // New function: Rebuild video evaluation section when position changes
-    function rebuildVideoCriteria() {
-      // Clear current video evaluation section
-      const videoSection = document.querySelector('#step3 .form-section');
-      if (videoSection) {
-        videoSection.innerHTML = '';
-      }
-      
-      // Remove current motivation assessment section (if exists)
-      const motivationSection = document.getElementById('motivation-section');
-      if (motivationSection) {
-        motivationSection.remove();
-      }
-      
-      // Rebuild video evaluation section
-      buildVideoCriteria();
-      
-      // Reinitialize star ratings
-      initializeStarRatings();
+    return {
+        'fields': {
+            'judge_name': payload_text(data, 'judge_name', ''),
+            'judge_role': judge_role,
+            'evaluation_date': eval_date,
+            'applicant_name': applicant_name,
+            'applicant_id': applicant_id,
+            'applicant_role': applicant_role,
+            'resume_score': resume_score,
+            'motivation_score': motivation_score,
+            'video_score': video_score,
+            'final_score': final_score,
+            'rubric_version': rubric_version,
+            'decision': decision,
+            'notes': payload_text(data, 'notes', ''),
+        },
+        'resume_ratings': resume_ratings,
+        'video_ratings': video_ratings,
+        # Created with these values, or only the status updated if the applicant exists
+        'applicant': {
+            'applicant_id': applicant_id,
+            'name': applicant_name,
+            'role': applicant_role,
+            'university': payload_text(data, 'applicant_university', ''),
+            'email': payload_text(data, 'applicant_email', ''),
+            'status': decision.lower(),
+        },
     }
 
-    // Apply position-specific weights
-    function applyRoleWeights() {
-      const position = document.getElementById('applying-role').value;
-      if (!position) return;
+def write_evaluation(item, idempotency_key, evaluation=None):
+    """Save a parsed payload as the current evaluation of its judge role.
 
-      // Get position-specific weights
-      const weights = getRoleWeights(position);
+    evaluation is the existing current evaluation, if any: it is archived as a
+    revision and updated in place. Runs inside the caller's write transaction;
+    returns (evaluation, is_new).
+    """
+    fields = item['fields']
+    is_new = evaluation is None
+    if is_new:
+        evaluation = Evaluation(applicant_id=fields['applicant_id'], judge_role=fields['judge_role'])
+        db.session.add(evaluation)
+    else:
+        archive_evaluation(evaluation)
 
-      // Apply to resume evaluation
-      applyWeightsToType('.resume-score', weights);
+    for field, value in fields.items():
+        setattr(evaluation, field, value)
+    evaluation.idempotency_key = idempotency_key
+    evaluation.created_at = datetime.utcnow()
+    db.session.flush()
 
-      // Apply to video evaluation
-      applyWeightsToType('.video-score', weights);
-    }
+    # Store each criterion score as its own row
+    db.session.add_all(rating_rows(evaluation.id, item['resume_ratings'], 'resume') +
+                       rating_rows(evaluation.id, item['video_ratings'], 'video'))
 
-    // Apply weights by type
-    function applyWeightsToType(selector, weights) {
-      // Store original weights (if not already stored)
-      document.querySelectorAll(selector).forEach(input => {
-        if (!input.hasAttribute('data-base-weight')) {
-          input.setAttribute('data-base-weight', input.dataset.weight);
-        }
-      });
-
-      // Calculate hard skills original total weight
-      let hardTotalBaseWeight = 0;
-      document.querySelectorAll(`${selector}[data-type="hard"]`).forEach(input => {
-        hardTotalBaseWeight += parseFloat(input.getAttribute('data-base-weight') || 0);
-      });
-
-      // Calculate soft skills original total weight
-      let softTotalBaseWeight = 0;
-      document.querySelectorAll(`${selector}[data-type="soft"]`).forEach(input => {
-        softTotalBaseWeight += parseFloat(input.getAttribute('data-base-weight') || 0);
-      });
-
-      // Apply hard skills weight
-      if (hardTotalBaseWeight > 0) {
-        const hardMultiplier = (selector.includes('resume') ? 0.4 : 0.5) * weights.hard / hardTotalBaseWeight;
-        document.querySelectorAll(`${selector}[data-type="hard"]`).forEach(input => {
-          const baseWeight = parseFloat(input.getAttribute('data-base-weight') || 0);
-          const adjustedWeight = baseWeight * hardMultiplier;
-          input.dataset.weight = adjustedWeight.toFixed(2);
-
-          // Update UI display
-          const weightSpan = input.closest('.sub-criteria')?.querySelector('.weight');
-          if (weightSpan) {
-            weightSpan.textContent = `${adjustedWeight.toFixed(2)}%`;
-          }
-        });
-      }
-
-      // Apply soft skills weight
-      if (softTotalBaseWeight > 0) {
-        const softMultiplier = (selector.includes('resume') ? 0.4 : 0.5) * weights.soft / softTotalBaseWeight;
-        document.querySelectorAll(`${selector}[data-type="soft"]`).forEach(input => {
-          const baseWeight = parseFloat(input.getAttribute('data-base-weight') || 0);
-          const adjustedWeight = baseWeight * softMultiplier;
-          input.dataset.weight = adjustedWeight.toFixed(2);
-
-          // Update UI display
-          const weightSpan = input.closest('.sub-criteria')?.querySelector('.weight');
-          if (weightSpan) {
-            weightSpan.textContent = `${adjustedWeight.toFixed(2)}%`;
-          }
-        });
-      }
-    }
-
-    // Calculate scores
-    function updateScores() {
-      // Calculate resume hard skills score
-      let resumeHardWeightedSum = 0;
-      let resumeHardTotalWeight = 0;
-      document.querySelectorAll('.resume-score[data-type="hard"]').forEach(input => {
-        const score = parseFloat(input.value) || 0;
-        const weight = parseFloat(input.dataset.weight) || 0;
-        resumeHardWeightedSum += score * weight;
-        resumeHardTotalWeight += weight;
-      });
-    
-      // Calculate resume soft skills score
-      let resumeSoftWeightedSum = 0;
-      let resumeSoftTotalWeight = 0;
-      document.querySelectorAll('.resume-score[data-type="soft"]').forEach(input => {
-        const score = parseFloat(input.value) || 0;
-        const weight = parseFloat(input.dataset.weight) || 0;
-        resumeSoftWeightedSum += score * weight;
-        resumeSoftTotalWeight += weight;
-      });
-    
-      // Calculate video hard skills score
-      let videoHardWeightedSum = 0;
-      let videoHardTotalWeight = 0;
-      document.querySelectorAll('.video-score[data-type="hard"]').forEach(input => {
-        const score = parseFloat(input.value) || 0;
-        const weight = parseFloat(input.dataset.weight) || 0;
-        videoHardWeightedSum += score * weight;
-        videoHardTotalWeight += weight;
-      });
-    
-      // Calculate video soft skills score
-      let videoSoftWeightedSum = 0;
-      let videoSoftTotalWeight = 0;
-      document.querySelectorAll('.video-score[data-type="soft"]').forEach(input => {
-        const score = parseFloat(input.value) || 0;
-        const weight = parseFloat(input.dataset.weight) || 0;
-        videoSoftWeightedSum += score * weight;
-        videoSoftTotalWeight += weight;
-      });
-    
-      // Calculate totals
-      const resumeTotalWeight = resumeHardTotalWeight + resumeSoftTotalWeight;
-      const resumeAvg = resumeTotalWeight > 0 ?
-        (resumeHardWeightedSum + resumeSoftWeightedSum) / resumeTotalWeight * 10 : 0;
-    
-      const videoTotalWeight = videoHardTotalWeight + videoSoftTotalWeight;
-      const videoAvg = videoTotalWeight > 0 ?
-        (videoHardWeightedSum + videoSoftWeightedSum) / videoTotalWeight * 10 : 0;
-    
-      // Calculate hard and soft skills averages
-      const hardSkillsAvg = (videoHardTotalWeight > 0) ?
-        (videoHardWeightedSum / videoHardTotalWeight * 5) : 0; // 0-5 scale
-      const softSkillsAvg = (videoSoftTotalWeight > 0) ?
-        (videoSoftWeightedSum / videoSoftTotalWeight * 5) : 0; // 0-5 scale
-    
-      // Calculate content quality and presentation skills
-      // Find all content quality related ratings
-      let contentQualitySum = 0;
-      let contentQualityCount = 0;
-      document.querySelectorAll('.video-score[id^="content_"]').forEach(input => {
-        const score = parseFloat(input.value) || 0;
-        if (score > 0) {
-          contentQualitySum += score;
-          contentQualityCount++;
-        }
-      });
-      
-      // Find all presentation skills related ratings
-      let presentationSkillsSum = 0;
-      let presentationSkillsCount = 0;
-      document.querySelectorAll('.video-score[id^="presentation_"]').forEach(input => {
-        const score = parseFloat(input.value) || 0;
-        if (score > 0) {
-          presentationSkillsSum += score;
-          presentationSkillsCount++;
-        }
-      });
-      
-      // Calculate averages
-      const contentQualityAvg = contentQualityCount > 0 ? contentQualitySum / contentQualityCount : 0;
-      const presentationSkillsAvg = presentationSkillsCount > 0 ? presentationSkillsSum / presentationSkillsCount : 0;
-    
-      // Update resume score display
-      document.getElementById('resume-display').textContent = (resumeAvg / 10).toFixed(1);
-      document.getElementById('resume-score').value = (resumeAvg / 10).toFixed(1);
-      
-      // Update hard/soft skills score display
-      const hardSkillsDisplay = document.getElementById('hard-skills-display');
-      const softSkillsDisplay = document.getElementById('soft-skills-display');
-      const videoTotalDisplay = document.getElementById('video-total-display');
-      
-      if (hardSkillsDisplay) {
-        hardSkillsDisplay.textContent = hardSkillsAvg.toFixed(1);
-      }
-      
-      if (softSkillsDisplay) {
-        softSkillsDisplay.textContent = softSkillsAvg.toFixed(1);
-      }
-      
-      if (videoTotalDisplay) {
-        videoTotalDisplay.textContent = (videoAvg / 10).toFixed(1);
-      }
-      
-      // Update content quality and presentation skills display
-      const contentScoreDisplay = document.getElementById('content-score-display');
-      const presentationScoreDisplay = document.getElementById('presentation-score-display');
-      
-      if (contentScoreDisplay) {
-        contentScoreDisplay.textContent = contentQualityAvg.toFixed(1);
-      }
-      
-      if (presentationScoreDisplay) {
-        presentationScoreDisplay.textContent = presentationSkillsAvg.toFixed(1);
-      }
-      
-      // Update video score in final page display
-      document.getElementById('video-display').textContent = (videoAvg / 10).toFixed(1);
-    
-      // Calculate motivation score - ensure it's only collected once
-      const motivationInput = document.getElementById('motivation_enthusiasm');
-      const motivationScore = motivationInput ? (parseFloat(motivationInput.value) || 0) : 0;
-      
-      // Update motivation score display
-      document.getElementById('motivation-display').textContent = motivationScore.toFixed(1);
-      
-      // Update motivation total display (if exists)
-      const motivationTotalDisplay = document.getElementById('motivation-total-display');
-      if (motivationTotalDisplay) {
-        motivationTotalDisplay.textContent = motivationScore.toFixed(1);
-      }
-    
-      // Calculate final weighted score - maintain 4:5:1 ratio
-      const finalScore = ((resumeAvg * 0.4) + (videoAvg * 0.5) + (motivationScore * 10 * 0.1)) / 10;
-    
-      // Update final score
-      const fsElem = document.getElementById('final-score');
-      fsElem.textContent = finalScore.toFixed(1);
-      
-      // Update weight description
-      const position = document.getElementById('applying-role').value;
-      if (position) {
-        const weights = getRoleWeights(position);
-        
-        // Remove old weight info
-        const oldWeightInfo = document.querySelector('.weight-info');
-        if (oldWeightInfo) {
-          oldWeightInfo.remove();
-        }
-        
-        // Add new weight info
-        const weightInfo = document.createElement('div');
-        weightInfo.className = 'text-center text-muted mt-2 mb-3 weight-info';
-        weightInfo.innerHTML = `Based on ${getPositionName(position)} role weights: Hard Skills ${weights.hard*100}% / Soft Skills ${weights.soft*100}%, with Resume(40%), Video(50%), Motivation(10%)`;
-        
-        if (fsElem.parentNode) {
-          fsElem.parentNode.after(weightInfo);
-        }
-      } 
-    
-      // Set color based on score
-      const fsVal = parseFloat(finalScore.toFixed(1));
-      if (fsVal >= 4.5) fsElem.style.color = '#1E8449';
-      else if (fsVal >= 4.0) fsElem.style.color = '#27AE60';
-      else if (fsVal >= 3.5) fsElem.style.color = '#2E86C1';
-      else if (fsVal >= 3.0) fsElem.style.color = '#F39C12';
-      else fsElem.style.color = '#E74C3C';
-    
-      // Suggest decision based on score
-      suggestDecision(fsVal);
-    }
+    # Keep the applicant's combined score in step, in the same transaction
+    apply_evaluation_to_summary(evaluation, is_new=is_new)
+    return evaluation, is_new
 
-    
-    // Add scoring guide
-    function addScoringGuide() {
-      const guideContent = `
-        <div class="modal fade" id="scoringGuideModal" tabindex="-1">
-          <div class="modal-dialog modal-lg">
-            <div class="modal-content">
-              <div class="modal-header bg-primary text-white">
-                <h5 class="modal-title">Scoring Guide</h5>
-                <button type="button" class="btn-close" data-bs-dismiss="modal"></button>
-              </div>
-              <div class="modal-body">
-                <h6>Scoring Criteria Explanation</h6>
-                <div class="table-responsive">
-                  <table class="table table-bordered">
-                    <thead>
-                      <tr>
-                        <th>Score</th>
-                        <th>Resume Evaluation</th>
-                        <th>Video Evaluation</th>
-                        <th>Motivation Evaluation</th>
-                      </tr>
-                    </thead>
-                    <tbody>
-                      <tr>
-                        <td><span class="badge bg-danger">1★</span> Does not meet requirements</td>
-                        <td>Almost no relevant skills or experience</td>
-                        <td>Shallow product understanding, inadequate analysis</td>
-                        <td>Unclear motivation, lacks position understanding</td>
-                      </tr>
-                      <tr>
-                        <td><span class="badge bg-warning text-dark">2★</span> Meets basic requirements</td>
-                        <td>Basic relevant experience, limited responsibilities</td>
-                        <td>Basic product understanding, somewhat limited analysis</td>
-                        <td>Basic interest, limited position understanding</td>
-                      </tr>
-                      <tr>
-                        <td><span class="badge bg-primary">3★</span> Meets expectations</td>
-                        <td>Relevant academic background, team role experience</td>
-                        <td>Understands core value, offers effective suggestions</td>
-                        <td>Shows clear interest, reasonable position understanding</td>
-                      </tr>
-                      <tr>
-                        <td><span class="badge bg-info">4★</span> Exceeds expectations</td>
-                        <td>Multiple high-quality relevant experiences, clear achievements</td>
-                        <td>Deep product understanding, creative and viable proposals</td>
-                        <td>High alignment, clearly articulates personal fit</td>
-                      </tr>
-                      <tr>
-                        <td><span class="badge bg-success">5★</span> Outstanding performance</td>
-                        <td>Exceptional technical skills, special achievements</td>
-                        <td>Comprehensive analysis, innovative high-ROI solutions</td>
-                        <td>Perfect fit, shows well-thought career planning</td>
-                      </tr>
-                    </tbody>
-                  </table>
-                </div>
+def insert_evaluations(items):
+    """Insert evaluations for (applicant, judge role) pairs that have none yet.
 
-                <h6 class="mt-4">Position-Specific Assessment Focus</h6>
-                <div class="accordion" id="positionAccordion">
-                  <div class="accordion-item">
-                    <h2 class="accordion-header">
-                      <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#financeContent">
-                        Financial Analyst (Hard Skills 70%, Soft Skills 30%)
-                      </button>
-                    </h2>
-                    <div id="financeContent" class="accordion-collapse collapse show" data-bs-parent="#positionAccordion">
-                      <div class="accordion-body">
-                        <p><strong>Hard Skills Focus:</strong> Financial modeling and valuation skills, financial analysis, due diligence and risk assessment</p>
-                        <p><strong>Soft Skills Focus:</strong> Communication with portfolio companies, investment proposal presentation, networking and relationship building</p>
-                      </div>
-                    </div>
-                  </div>
-                  <div class="accordion-item">
-                    <h2 class="accordion-header">
-                      <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#researchContent">
-                        Research Analyst (Hard Skills 40%, Soft Skills 60%)
-                      </button>
-                    </h2>
-                    <div id="researchContent" class="accordion-collapse collapse" data-bs-parent="#positionAccordion">
-                      <div class="accordion-body">
-                        <p><strong>Hard Skills Focus:</strong> Market and industry trend analysis, data analysis, technology assessment and competitive landscape analysis</p>
-                        <p><strong>Soft Skills Focus:</strong> Critical thinking and insight, clear research findings presentation, learning agility for emerging trends</p>
-                      </div>
-                    </div>
-                  </div>
-                  <div class="accordion-item">
-                    <h2 class="accordion-header">
-                      <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#opsContent">
-                        Operations Analyst (Hard Skills 20%, Soft Skills 80%)
-                      </button>
-                    </h2>
-                    <div id="opsContent" class="accordion-collapse collapse" data-bs-parent="#positionAccordion">
-                      <div class="accordion-body">
-                        <p><strong>Hard Skills Focus:</strong> Business process analysis, KPI development and monitoring, project management and business operations</p>
-                        <p><strong>Soft Skills Focus:</strong> Cross-functional collaboration, stakeholder management, adaptability and problem-solving</p>
-                      </div>
-                    </div>
-                  </div>
-                </div>
-              </div>
-            </div>
-          </div>
-        </div>
-      `;
-
-      // Add to page
-      document.body.insertAdjacentHTML('beforeend', guideContent);
-
-      // Add guide button
-      const header = document.querySelector('.container h1');
-      if (header) {
-        const guideButton = document.createElement('button');
-        guideButton.className = 'btn btn-sm btn-outline-info ms-3';
-        guideButton.innerHTML = '<i class="bi bi-question-circle"></i> Scoring Guide';
-        guideButton.addEventListener('click', () => {
-          new bootstrap.Modal(document.getElementById('scoringGuideModal')).show();
-        });
-        header.insertAdjacentElement('afterend', guideButton);
-      }
-    }
-    
-    // Get position name
-    function getPositionName(position) {
-      switch(position) {
-        case 'financial-analyst': return 'Financial Analyst';
-        case 'research-analyst': return 'Research Analyst';
-        case 'operations-analyst': return 'Operations Analyst';
-        default: return 'Applicant';
-      }
-    }
-    
-    // Suggest decision based on score
-    function suggestDecision(score) {
-      const decisionSelect = document.getElementById('decision');
-      if (score >= 4.0) {
-        decisionSelect.value = 'advance';
-      } else if (score >= 3.0) {
-        decisionSelect.value = 'waitlist';
-      } else {
-        decisionSelect.value = 'reject';
-      }
-    }
-    
-    // Step navigation functions
-    function nextStep(step) {
-      // Form validation
-      if (step === 2) {
-        const applicantName = document.getElementById('applicant-name').value;
-        const applicantId = document.getElementById('applicant-id').value;
-        const applicantRole = document.getElementById('applying-role').value;
-    
-        if (!applicantName || !applicantId || !applicantRole) {
-          alert('Please complete all required applicant information before continuing.');
-          return;
-        }
-      }
-    
-      if (step === 3) {
-        const resumeScore = document.getElementById('resume-score').value;
-        if (!resumeScore) {
-          alert('Please provide a resume score before continuing.');
-          return;
-        }
-      }
-    
-      // Update progress bar
-      const progressBar = document.getElementById('progressBar');
-      progressBar.style.width = (step * 25) + '%';
-    
-      // Activate appropriate tab
-      const tabToActivate = document.getElementById('step' + step + '-tab');
-      bootstrap.Tab.getOrCreateInstance(tabToActivate).show();
-    }
-    
-    function prevStep(step) {
-      // Update progress bar
-      const progressBar = document.getElementById('progressBar');
-      progressBar.style.width = (step * 25) + '%';
-    
-      // Activate appropriate tab
-      const tabToActivate = document.getElementById('step' + step + '-tab');
-      bootstrap.Tab.getOrCreateInstance(tabToActivate).show();
-    }
-    
-    // Progress saving functions
-    function initProgressSaving() {
-      // Load saved progress if exists
-      loadSavedProgress();
-    
-      // Save progress every 30 seconds
-      setInterval(saveProgress, 30000);
-    
-      // Save progress when switching tabs
-      document.querySelectorAll('[data-bs-toggle="pill"]').forEach(tab => {
-        tab.addEventListener('shown.bs.tab', saveProgress);
-      });
-    
-      // Add save indicator
-      const container = document.querySelector('.container');
-      const saveIndicator = document.createElement('div');
-      saveIndicator.id = 'save-indicator';
-      saveIndicator.style = 'position: fixed; bottom: 20px; right: 20px; padding: 10px; background: #28a745; color: white; border-radius: 5px; opacity: 0; transition: opacity 0.3s;';
-      saveIndicator.innerHTML = '<i class="bi bi-check-circle"></i> Progress saved';
-      container.appendChild(saveIndicator);
-    }
-    
-    function saveProgress() {
-      const formData = {
-        step: getActiveStepIndex(),
-        applicantName: document.getElementById('applicant-name').value,
-        applicantId: document.getElementById('applicant-id').value,
-        applicantRole: document.getElementById('applying-role').value,
-        applicantUniversity: document.getElementById('applicant-university').value,
-        applicantEmail: document.getElementById('applicant-email').value,
-        resumeScore: document.getElementById('resume-score').value,
-        videoScores: collectScores('video-score'),
-        resumeScores: collectScores('resume-score'),
-        motivationScore: document.getElementById('motivation_enthusiasm')?.value,
-        decision: document.getElementById('decision').value,
-        notes: document.getElementById('notes').value
-      };
-    
-      sessionStorage.setItem('evaluation-progress', JSON.stringify(formData));
-      showSaveIndicator();
-    }
-    
-    function loadSavedProgress() {
-      const savedData = sessionStorage.getItem('evaluation-progress');
-      if (!savedData) return;
-    
-      const formData = JSON.parse(savedData);
-    
-      // Restore form values
-      setFieldValue('applicant-name', formData.applicantName);
-      setFieldValue('applicant-id', formData.applicantId);
-      setFieldValue('applying-role', formData.applicantRole);
-      setFieldValue('applicant-university', formData.applicantUniversity);
-      setFieldValue('applicant-email', formData.applicantEmail);
-      setFieldValue('resume-score', formData.resumeScore);
-      setFieldValue('decision', formData.decision);
-      setFieldValue('notes', formData.notes);
-    
-      // Restore scores
-      restoreScores(formData.videoScores, 'video-score');
-      restoreScores(formData.resumeScores, 'resume-score');
-      setFieldValue('motivation_enthusiasm', formData.motivationScore);
-    
-      // Add notification
-      const notice = document.createElement('div');
-      notice.className = 'alert alert-info alert-dismissible fade show';
-      notice.innerHTML = '<i class="bi bi-info-circle"></i> Previous progress has been restored <button type="button" class="btn-close" data-bs-dismiss="alert"></button>';
-      document.querySelector('.container').insertBefore(notice, document.querySelector('.container').firstChild);
-    
-      // Update scores and move to last active step
-      setTimeout(() => {
-        updateScores();
-        if (formData.step > 1) {
-          nextStep(formData.step);
-        }
-      }, 500);
-    }
-    
-    function showSaveIndicator() {
-      const indicator = document.getElementById('save-indicator');
-      indicator.style.opacity = '1';
-      setTimeout(() => { indicator.style.opacity = '0'; }, 2000);
-    }
-    
-    function collectScores(className) {
-      const scores = {};
-      document.querySelectorAll('.' + className).forEach(input => {
-        if (input.id) {
-          scores[input.id] = input.value;
-        }
-      });
-      return scores;
-    }
-    
-    function restoreScores(scores, className) {
-      if (!scores) return;
-    
-      Object.keys(scores).forEach(id => {
-        const input = document.getElementById(id);
-        if (input) {
-          input.value = scores[id];
-          if (input.className.includes(className)) {
-            const rating = input.closest('.sub-criteria')?.querySelector('.star-rating');
-            if (rating) {
-              const stars = rating.querySelectorAll('span');
-              highlightStars(stars, scores[id]);
-            }
-          }
-        }
-      });
-    }
-    
-    function getActiveStepIndex() {
-      const activeTab = document.querySelector('.nav-link.active');
-      return activeTab ? parseInt(activeTab.id.replace('step', '').replace('-tab', '')) : 1;
-    }
-    
-    function setFieldValue(id, value) {
-      const field = document.getElementById(id);
-      if (field && value) {
-        field.value = value;
-      }
-    }
-    
-    // Add skill type help explanation
-    function addSkillTypeHelp() {
-      // Create help button and add to page
-      const helpIcon = document.createElement('i');
-      helpIcon.className = 'bi bi-question-circle text-info ms-2';
-      helpIcon.style.cursor = 'pointer';
-      helpIcon.title = 'View explanation of Hard vs Soft Skills classification';
-      
-      // Help content
-      const helpContent = `
-        <div class="modal fade" id="skillHelpModal" tabindex="-1" aria-hidden="true">
-          <div class="modal-dialog">
-            <div class="modal-content">
-              <div class="modal-header">
-                <h5 class="modal-title">Hard Skills vs Soft Skills Classification</h5>
-                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
-              </div>
-              <div class="modal-body">
-                <h6>Hard Skills Assessment Items:</h6>
-                <ul>
-                  <li><strong>Financial Analyst:</strong> Financial modeling and valuation skills, due diligence and risk assessment, financial analysis and investment justification</li>
-                  <li><strong>Research Analyst:</strong> Market and industry trend analysis, technology assessment and competitive landscape analysis, data analysis and research methods</li>
-                  <li><strong>Operations Analyst:</strong> Business process analysis, KPI development and monitoring, project management and business operations</li>
-                </ul>
-                <h6>Soft Skills Assessment Items:</h6>
-                <ul>
-                  <li><strong>Financial Analyst:</strong> Communication with portfolio companies, investment proposal presentation, networking and relationship building</li>
-                  <li><strong>Research Analyst:</strong> Critical thinking and insight, clear research findings presentation, learning agility for emerging trends</li>
-                  <li><strong>Operations Analyst:</strong> Cross-functional collaboration, stakeholder management, adaptability and problem-solving</li>
-                </ul>
-              </div>
-            </div>
-          </div>
-        </div>
-      `;
-      
-      // Add to page
-      const evalSteps = document.getElementById('evaluationSteps');
-      if (evalSteps) {
-        document.body.insertAdjacentHTML('beforeend', helpContent);
-        const firstTab = evalSteps.querySelector('.nav-link');
-        if (firstTab) {
-          firstTab.insertAdjacentElement('beforeend', helpIcon);
-          helpIcon.addEventListener('click', function(e) {
-            e.preventDefault();
-            new bootstrap.Modal(document.getElementById('skillHelpModal')).show();
-          });
-        }
-      }
-    }
-  </script>
-</body>
-</html>
-"""
-
-    # Combine HTML parts
-    complete_html = head_html + video_html + tail_html
-
-    # Render HTML template with variables
-    return render_template_string(complete_html,
-                                  judge_role=judge_role,
-                                  judge_name=judge_name,
-                                  applicant=applicant)
+    Evaluations and their rating rows go in as two executemany INSERTs.
+    items are (parsed payload, idempotency key) pairs; returns the new ids in order.
+    """
+    now = datetime.utcnow()
+    evaluation_table = Evaluation.__table__
+    result = db.session.execute(
+        evaluation_table.insert().returning(evaluation_table.c.id, sort_by_parameter_order=True),
+        [dict(item['fields'], idempotency_key=key, created_at=now) for item, key in items])
+    ids = [row.id for row in result]
+
+    ratings = []
+    for evaluation_id, (item, _) in zip(ids, items):
+        for row in (rating_rows(evaluation_id, item['resume_ratings'], 'resume') +
+                    rating_rows(evaluation_id, item['video_ratings'], 'video')):
+            ratings.append({'evaluation_id': row.evaluation_id, 'criterion_id': row.criterion_id,
+                            'score': row.score, 'weight': row.weight, 'type': row.type})
+    if ratings:
+        db.session.execute(EvaluationRating.__table__.insert(), ratings)
+
+    for evaluation in Evaluation.query.filter(Evaluation.id.in_(ids)):
+        apply_evaluation_to_summary(evaluation)
+    return ids
 
-# ========== Save Rating API ==========
-# ========== Save Rating API ==========
 @app.route('/api/save-rating', methods=['POST'])
 def api_save_rating():
     data = request.get_json() or {}
     try:
-        # Extract data from request
-        judge_name = data.get('judge_name', '')
-        judge_role = data.get('judge_role', '')
-        evaluation_date_str = data.get('evaluation_date', '')
-        applicant_name = data['applicant_name']
-        applicant_id = data['applicant_id']
-        applicant_university = data.get('applicant_university', '')
-        applicant_email = data.get('applicant_email', '')
-        applicant_role = data['applicant_role']
-        resume_score = float(data['resume_score'])
-        video_score = float(data['video_score'])
-        final_score = float(data['final_score'])
-        decision = data['decision']
-        notes = data.get('notes', '')
-        video_ratings = data.get('video_ratings', {})
-        resume_ratings = data.get('resume_ratings', {})
-        resume_ratings_json = json.dumps(resume_ratings, ensure_ascii=False)
-        motivation_score = float(data.get('motivation_score', 0))
-
-        # Parse date
-        eval_date = None
-        if evaluation_date_str:
-            eval_date = datetime.strptime(evaluation_date_str, '%Y-%m-%d')
-        else:
-            eval_date = datetime.now()
+        idempotency_key = get_idempotency_key(data)
 
-        # JSON serialize video ratings
-        video_ratings_json = json.dumps(video_ratings, ensure_ascii=False)
+        # A retried submission returns the evaluation its first attempt saved
+        existing_id = find_idempotent_evaluation(idempotency_key)
+        if existing_id is not None:
+            return jsonify({"evaluation_id": existing_id, "replayed": True}), 200
+        db.session.rollback()
 
-        # Check if this applicant already exists
-        applicant = Applicant.query.filter_by(applicant_id=applicant_id).first()
-        if not applicant:
-            # Create new applicant
-            applicant = Applicant(
-                applicant_id=applicant_id,
-                name=applicant_name,
-                role=applicant_role,
-                university=applicant_university,
-                email=applicant_email,
-                status='evaluated'
-            )
-            db.session.add(applicant)
-
-        # Update applicant status based on decision
-        applicant.status = decision.lower()
-
-        # Create new evaluation
-        new_eval = Evaluation(
-            judge_name=judge_name,
-            judge_role=judge_role,
-            evaluation_date=eval_date,
-            applicant_name=applicant_name,
-            applicant_id=applicant_id,
-            applicant_role=applicant_role,
-            resume_score=resume_score,
-            resume_ratings=resume_ratings_json,
-            motivation_score=motivation_score,
-            video_ratings=video_ratings_json,
-            video_score=video_score,
-            final_score=final_score,
-            decision=decision,
-            notes=notes
-        )
+        item = parse_evaluation_payload(data)
+        fields = item['fields']
+
+        begin_write_transaction()
 
-        db.session.add(new_eval)
+        # Check again under the write lock: a retry may have waited on the lock
+        # while its first attempt committed, and a resubmission moves that
+        # attempt's key into evaluation_revision, out of the unique index's sight
+        existing_id = find_idempotent_evaluation(idempotency_key)
+        if existing_id is not None:
+            db.session.rollback()
+            return jsonify({"evaluation_id": existing_id, "replayed": True}), 200
+
+        # Create the applicant, or update its status based on the decision
+        upsert_applicants([item['applicant']])
+
+        # A judge role has one current evaluation per applicant; a resubmission
+        # archives the previous version and updates the row in place
+        current = Evaluation.query.filter_by(applicant_id=fields['applicant_id'],
+                                             judge_role=fields['judge_role']).first()
+        evaluation, is_new = write_evaluation(item, idempotency_key, current)
         db.session.commit()
 
-        return jsonify({"evaluation_id": new_eval.id}), 200
+        return jsonify({"evaluation_id": evaluation.id, "updated": not is_new}), 200
 
+    except IntegrityError as e:
+        # A concurrent request with the same idempotency key committed first
+        db.session.rollback()
+        existing_id = find_idempotent_evaluation(idempotency_key)
+        if existing_id is None:
+            return jsonify({"error": f"Save failed: {str(e)}"}), 500
+        return jsonify({"evaluation_id": existing_id, "replayed": True}), 200
     except KeyError as e:
         return jsonify({"error": f"Missing required field: {str(e)}"}), 400
     except ValueError as e:
@@ -2239,132 +2477,227 @@ def api_save_rating():
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": f"Save failed: {str(e)}"}), 500
-    
-# ========== View All Evaluation Records ==========
-@app.route('/evaluations')
-def view_evaluations():
-    # Get filter parameters
-    judge_role = request.args.get('judge_role', '')
-    decision = request.args.get('decision', '')
-    applicant_role = request.args.get('applicant_role', '')
-    search_query = request.args.get('q', '')
-
-    # Base query
-    query = Evaluation.query
 
-    # Apply filters
-    if judge_role:
-        query = query.filter_by(judge_role=judge_role)
+@app.route('/api/save-ratings/batch', methods=['POST'])
+def api_save_ratings_batch():
+    """Save many evaluations in one write transaction.
 
-    if decision:
-        query = query.filter_by(decision=decision)
+    Takes a JSON array of save-rating payloads (or {"evaluations": [...]}), each
+    with an optional idempotency_key. Invalid items are reported and skipped;
+    the valid ones are all committed together. Returns a status per item:
+    created, updated, replayed or invalid.
+    """
+    data = request.get_json(silent=True)
+    payloads = data.get('evaluations') if isinstance(data, dict) else data
+    if not isinstance(payloads, list):
+        return jsonify({"error": "Expected a JSON array of evaluations"}), 400
+    if len(payloads) > BATCH_SAVE_MAX_ITEMS:
+        return jsonify({"error": f"At most {BATCH_SAVE_MAX_ITEMS} evaluations per batch"}), 413
+
+    # Validate everything before taking the write lock
+    results = [None] * len(payloads)
+    parsed = []
+    for index, payload in enumerate(payloads):
+        try:
+            if not isinstance(payload, dict):
+                raise ValueError("evaluation must be an object")
+            key = get_idempotency_key(payload, use_header=False)
+            parsed.append((index, parse_evaluation_payload(payload), key))
+        except KeyError as e:
+            results[index] = {"index": index, "status": "invalid", "error": f"Missing required field: {str(e)}"}
+        except ValueError as e:
+            results[index] = {"index": index, "status": "invalid", "error": f"Value error: {str(e)}"}
+
+    # Retried items answer from their first save; repeated keys in the batch save once
+    replayed = find_idempotent_evaluations(key for _, _, key in parsed)
+    db.session.rollback()
+    pending = []
+    batch_keys = {}
+    for index, item, key in parsed:
+        if key in replayed:
+            results[index] = {"index": index, "status": "replayed", "evaluation_id": replayed[key]}
+        elif key and key in batch_keys:
+            results[index] = {"index": index, "status": "replayed", "duplicate_of": batch_keys[key]}
+        else:
+            if key:
+                batch_keys[key] = index
+            pending.append((index, item, key))
 
-    if applicant_role:
-        query = query.filter_by(applicant_role=applicant_role)
+    try:
+        if pending:
+            begin_write_transaction()
+
+            # Check again under the write lock, for retries whose first attempt
+            # committed while this request waited
+            replayed = find_idempotent_evaluations(key for _, _, key in pending)
+            for index, _, key in pending:
+                if key in replayed:
+                    results[index] = {"index": index, "status": "replayed", "evaluation_id": replayed[key]}
+            pending = [(index, item, key) for index, item, key in pending if key not in replayed]
+
+        if pending:
+            upsert_applicants([item['applicant'] for _, item, _ in pending])
+
+            pairs = {(item['fields']['applicant_id'], item['fields']['judge_role']) for _, item, _ in pending}
+            current = {(e.applicant_id, e.judge_role): e for e in
+                       Evaluation.query.filter(tuple_(Evaluation.applicant_id, Evaluation.judge_role).in_(pairs))}
+
+            # The first submission for a pair without an evaluation is bulk inserted;
+            # later ones for the same pair update it in order
+            inserts, updates, seen = [], [], set(current)
+            for index, item, key in pending:
+                pair = (item['fields']['applicant_id'], item['fields']['judge_role'])
+                (updates if pair in seen else inserts).append((index, item, key))
+                seen.add(pair)
+
+            if inserts:
+                ids = insert_evaluations([(item, key) for _, item, key in inserts])
+                for (index, item, _), evaluation_id in zip(inserts, ids):
+                    results[index] = {"index": index, "status": "created", "evaluation_id": evaluation_id}
+                    current.setdefault((item['fields']['applicant_id'], item['fields']['judge_role']), None)
+            for index, item, key in updates:
+                pair = (item['fields']['applicant_id'], item['fields']['judge_role'])
+                evaluation = current.get(pair) or Evaluation.query.filter_by(
+                    applicant_id=pair[0], judge_role=pair[1]).one()
+                evaluation, _ = write_evaluation(item, key, evaluation)
+                current[pair] = evaluation
+                results[index] = {"index": index, "status": "updated", "evaluation_id": evaluation.id}
 
-    if search_query:
-        query = query.filter(
-            (Evaluation.applicant_name.ilike(f'%{search_query}%')) |
-            (Evaluation.applicant_id.ilike(f'%{search_query}%')) |
-            (Evaluation.judge_name.ilike(f'%{search_query}%'))
-        )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Save failed: {str(e)}"}), 500
 
-    # Sort by most recent
-    evals = query.order_by(Evaluation.created_at.desc()).all()
+    # Point in-batch duplicates at the evaluation their first occurrence saved
+    for result in results:
+        if 'duplicate_of' in result:
+            result['evaluation_id'] = results[result.pop('duplicate_of')].get('evaluation_id')
+
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    status_code = 400 if results and counts.get('invalid') == len(results) else 200
+    return jsonify({"results": results, "counts": counts}), status_code
+
+# ========== Applicant Import ==========
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ERRORS = 200  # Errors listed in the report; all of them are counted
+IMPORT_REQUIRED_COLUMNS = ('applicant_id', 'name', 'role')
+IMPORT_OPTIONAL_COLUMNS = ('email', 'university', 'phone', 'resume_url', 'video_url')
+
+def import_row(row):
+    """Validate one roster row into Applicant column values; raises ValueError"""
+    values = {}
+    for name in IMPORT_REQUIRED_COLUMNS + IMPORT_OPTIONAL_COLUMNS:
+        if name not in row:
+            continue
+        value = (row[name] or '').strip() or None
+        max_length = Applicant.__table__.c[name].type.length
+        if value is not None and max_length and len(value) > max_length:
+            raise ValueError(f"{name} longer than {max_length} characters")
+        values[name] = value
+    for name in IMPORT_REQUIRED_COLUMNS:
+        if not values.get(name):
+            raise ValueError(f"missing {name}")
+    if values.get('email') and '@' not in values['email']:
+        raise ValueError(f"invalid email {values['email']!r}")
+    return values
+
+def import_applicants_csv(stream, chunk_size=IMPORT_CHUNK_SIZE):
+    """Upsert applicants from a roster CSV text stream.
+
+    Rows are parsed as they are read and upserted one chunk per write
+    transaction with a single executemany INSERT ... ON CONFLICT, which refreshes
+    the roster fields of existing applicants but leaves their status alone. A
+    blank optional cell keeps the stored value, so a partial roster does not
+    erase contact data. Invalid rows are reported and skipped. Returns a
+    summary dict.
+    """
+    reader = csv.DictReader(stream)
+    columns = [c for c in (reader.fieldnames or []) if c]
+    missing = [c for c in IMPORT_REQUIRED_COLUMNS if c not in columns]
+    if missing:
+        raise ValueError(f"CSV is missing columns: {', '.join(missing)}")
+    present = [c for c in IMPORT_REQUIRED_COLUMNS + IMPORT_OPTIONAL_COLUMNS if c in columns]
+
+    stmt = sqlite_insert(Applicant)
+    table = Applicant.__table__
+    upsert = stmt.on_conflict_do_update(
+        index_elements=[Applicant.applicant_id],
+        set_={c: stmt.excluded[c] if c in IMPORT_REQUIRED_COLUMNS else func.coalesce(stmt.excluded[c], table.c[c])
+              for c in present if c != 'applicant_id'})
+
+    report = {"imported": 0, "failed": 0, "errors": []}
+
+    def flush(chunk):
+        begin_write_transaction()
+        db.session.execute(upsert, chunk)
+        db.session.commit()
+        report["imported"] += len(chunk)
 
-    # Get unique values for filter dropdowns
-    judge_roles = db.session.query(Evaluation.judge_role).distinct().all()
-    decisions = db.session.query(Evaluation.decision).distinct().all()
-    applicant_roles = db.session.query(Evaluation.applicant_role).distinct().all()
-    
-    # Get applicant info for all evaluations
-    applicant_ids = [e.applicant_id for e in evals]
-    applicants = Applicant.query.filter(Applicant.applicant_id.in_(applicant_ids)).all()
-    applicant_info = {a.applicant_id: a for a in applicants}
+    chunk = []
+    for row in reader:
+        try:
+            values = import_row(row)
+        except ValueError as e:
+            report["failed"] += 1
+            if len(report["errors"]) < IMPORT_MAX_ERRORS:
+                # Line numbers count the header, as spreadsheet rows do
+                report["errors"].append({"line": reader.line_num, "applicant_id": row.get('applicant_id'),
+                                         "error": str(e)})
+            continue
+        chunk.append({c: values.get(c) for c in present})
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+    return report
+
+@app.route('/api/import-applicants', methods=['POST'])
+def api_import_applicants():
+    """Import a roster CSV sent as the 'file' form field or as the raw request body"""
+    upload = request.files.get('file')
+    raw = upload.stream if upload else request.stream
+    stream = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+    try:
+        report = import_applicants_csv(stream)
+    except (ValueError, UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        return jsonify({"error": f"Import failed: {str(e)}"}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": f"Import failed: {str(e)}"}), 500
+    return jsonify(report), 200
+
+@app.cli.command('import-applicants')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--chunk-size', default=IMPORT_CHUNK_SIZE, help='Rows per write transaction')
+def import_applicants_command(path, chunk_size):
+    """Import applicants from a roster CSV file"""
+    started = time.perf_counter()
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        try:
+            report = import_applicants_csv(f, chunk_size)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+    click.echo(f"Imported {report['imported']} applicants, {report['failed']} rows failed "
+               f"in {time.perf_counter() - started:.2f}s")
+    for error in report['errors']:
+        click.echo(f"  line {error['line']} ({error['applicant_id']}): {error['error']}")
 
-    html = render_template_string("""
+# ========== View All Evaluation Records ==========
+EVALUATIONS_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Evaluation Records - Sertie</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
-  <style>
-    body {
-      background-color: #B3FFFA;
-    }
-    .container {
-      max-width: 1200px;
-      margin: 30px auto;
-    }
-    .filter-section {
-      background-color: #fff;
-      border-radius: 10px;
-      padding: 20px;
-      margin-bottom: 20px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-    }
-    .table-container {
-      background-color: #fff;
-      border-radius: 10px;
-      padding: 20px;
-      box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-      overflow: auto;
-    }
-    .table th {
-      background-color: #f5f5f5;
-    }
-    .decision-badge {
-      display: inline-block;
-      padding: 5px 10px;
-      border-radius: 20px;
-      font-size: 0.75rem;
-      font-weight: bold;
-      text-transform: uppercase;
-    }
-    .decision-advance {
-      background-color: #d4edda;
-      color: #155724;
-    }
-    .decision-waitlist {
-      background-color: #fff3cd;
-      color: #856404;
-    }
-    .decision-reject {
-      background-color: #f8d7da;
-      color: #721c24;
-    }
-    .score-display {
-      font-weight: bold;
-      padding: 2px 8px;
-      border-radius: 4px;
-    }
-    .score-high {
-      background-color: #d4edda;
-      color: #155724;
-    }
-    .score-mid {
-      background-color: #fff3cd;
-      color: #856404;
-    }
-    .score-low {
-      background-color: #f8d7da;
-      color: #721c24;
-    }
-    .action-buttons a {
-      margin-right: 5px;
-    }
-    @media (max-width: 768px) {
-      .filter-section {
-        padding: 15px 10px;
-      }
-      .table-container {
-        padding: 10px;
-      }
-    }
-  </style>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Evaluation Records - Sertie</title>
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap/bootstrap.min.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap-icons/bootstrap-icons.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/base.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/evaluations.css') }}">
 </head>
 <body>
   <div class="container">
@@ -2524,8 +2857,20 @@ def view_evaluations():
           </tbody>
         </table>
       </div>
-      <div class="mt-3">
-        <p class="text-muted">Showing {{ evals|length }} records</p>
+      <div class="mt-3 d-flex justify-content-between align-items-center">
+        <p class="text-muted mb-0">Showing {{ evals|length }} records</p>
+        <div>
+          {% if cursor %}
+          <a href="{{ first_page_url }}" class="btn btn-sm btn-outline-secondary">
+            <i class="bi bi-chevron-double-left"></i> First Page
+          </a>
+          {% endif %}
+          {% if next_page_url %}
+          <a href="{{ next_page_url }}" class="btn btn-sm btn-outline-primary ms-2">
+            Next Page <i class="bi bi-chevron-right"></i>
+          </a>
+          {% endif %}
+        </div>
       </div>
       {% else %}
       <div class="text-center py-5">
@@ -2540,127 +2885,210 @@ def view_evaluations():
     </div>
   </div>
 
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
+  <script src="{{ asset_url('vendor/bootstrap/bootstrap.bundle.min.js') }}"></script>
+  <script src="{{ asset_url('js/evaluations.js') }}"></script>
 </body>
 </html>
+"""
+register_template('evaluations.html', EVALUATIONS_TEMPLATE)
 
-<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-  
-  <script>
-    document.addEventListener('DOMContentLoaded', function() {
-      // Find the export button
-      const exportBtn = document.getElementById('exportBtn');
-      
-      if (exportBtn) {
-        // Add click event handler
-        exportBtn.addEventListener('click', function() {
-          // Show loading state
-          exportBtn.disabled = true;
-          exportBtn.innerHTML = '<span class="spinner-border spinner-border-sm" role="status" aria-hidden="true"></span> Exporting...';
-          
-          // Make fetch request to export API
-          fetch('/api/export-evaluations')
-            .then(response => {
-              // Check if response is OK
-              if (!response.ok) {
-                throw new Error('Export failed, status code: ' + response.status);
-              }
-              
-              // Get filename from Content-Disposition header if available
-              let filename = 'evaluations.csv';
-              const contentDisposition = response.headers.get('Content-Disposition');
-              if (contentDisposition) {
-                const filenameMatch = contentDisposition.match(/filename="(.+?)"/);
-                if (filenameMatch && filenameMatch[1]) {
-                  filename = filenameMatch[1];
-                }
-              }
-              
-              // Convert response to blob
-              return response.blob().then(blob => {
-                // Create download link
-                const url = window.URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.style.display = 'none';
-                a.href = url;
-                a.download = filename;
-                
-                // Append to body, trigger click, then remove
-                document.body.appendChild(a);
-                a.click();
-                window.URL.revokeObjectURL(url);
-                
-                // Reset button state
-                exportBtn.disabled = false;
-                exportBtn.innerHTML = '<i class="bi bi-download"></i> Export Data';
-              });
-            })
-            .catch(error => {
-              // Reset button state
-              exportBtn.disabled = false;
-              exportBtn.innerHTML = '<i class="bi bi-download"></i> Export Data';
-              
-              // Show error
-              alert('Export failed: ' + error.message);
-              console.error('Export error:', error);
-            });
-        });
-      }
-    });
-  </script>
-</body>
-</html>
+@app.route('/evaluations')
+@conditional_on_data('evaluation', 'applicant_info')
+def view_evaluations():
+    # Get filter parameters
+    judge_role = request.args.get('judge_role', '')
+    decision = request.args.get('decision', '')
+    applicant_role = request.args.get('applicant_role', '')
+    search_query = request.args.get('q', '')
+    page_size = get_page_size()
 
-""", evals=evals, judge_roles=judge_roles, decisions=decisions, applicant_roles=applicant_roles, request=request, applicant_info=applicant_info)
+    # Apply filters (sorted by most recent)
+    query = filter_evaluations(Evaluation.query, {
+        'judge_role': judge_role,
+        'decision': decision,
+        'applicant_role': applicant_role
+    })
 
-    return html
+    if search_query:
+        query = search_evaluations(query, search_query)
+
+    # Keyset pagination on (created_at, id), newest first
+    cursor = decode_cursor(request.args.get('cursor', ''))
+    if cursor and len(cursor) == 2:
+        try:
+            after = (datetime.fromisoformat(cursor[0]), int(cursor[1]))
+            query = query.filter(tuple_(Evaluation.created_at, Evaluation.id) < after)
+        except (TypeError, ValueError):
+            cursor = None
 
+    evals, next_cursor = fetch_page(query, page_size, lambda e: (e.created_at, e.id))
 
-@app.route('/combined-score')
-def combined_score():
-    # 获取申请人ID
-    applicant_id = request.args.get('id', '')
+    # Unique values for filter dropdowns
+    options = get_filter_values()
 
-    if not applicant_id:
-        # 显示所有申请人
-        all_applicants = db.session.query(
-            Evaluation.applicant_name,
-            Evaluation.applicant_id,
-            Evaluation.applicant_role
-        ).distinct().all()
+    # Get applicant info for all evaluations
+    applicant_ids = [e.applicant_id for e in evals]
+    applicants = Applicant.query.filter(Applicant.applicant_id.in_(applicant_ids)).all()
+    applicant_info = {a.applicant_id: a for a in applicants}
+
+    html = render_page('evaluations.html', evals=evals, judge_roles=options['judge_role'], decisions=options['decision'],
+       applicant_roles=options['applicant_role'], request=request, applicant_info=applicant_info,
+       cursor=cursor, first_page_url=page_url(None),
+       next_page_url=page_url(next_cursor) if next_cursor else None)
+
+    return html
+
+# ========== Applicant Lookup ==========
+DEBUG_SAMPLE_SIZE = 20    # Rows shown by the per-request diagnostic mode
+FUZZY_SCAN_WINDOW = 50    # Ids read on each side of a missed id
+FUZZY_CUTOFF = 0.6
+
+def debug_requested():
+    """Per-request diagnostic mode, switched on with ?debug=1"""
+    return request.args.get('debug') == '1'
+
+def sample_evaluations(size=DEBUG_SAMPLE_SIZE):
+    """A bounded random sample of evaluations, picked by primary key instead of scanning"""
+    low, high = db.session.query(func.min(Evaluation.id), func.max(Evaluation.id)).one()
+    if low is None:
+        return []
+    ids = random.sample(range(low, high + 1), min(size * 2, high - low + 1))
+    return Evaluation.query.filter(Evaluation.id.in_(ids)).order_by(Evaluation.id).limit(size).all()
+
+TRIGRAM_CANDIDATES = 200     # Trigram hits re-ranked per lookup
+TRIGRAM_MAX_DOC_SHARE = 0.1  # Trigrams shared by more applicants than this are too common to probe
+TRIGRAM_MIN_TERMS = 4        # Rarest trigrams always probed, however common
+SUGGEST_LIMIT = 8
+
+def range_scan_candidates(text):
+    """Evaluated applicant ids near the text in the score summary's primary key order.
+
+    Reads bounded windows around the text (and its upper-case form) and around
+    its first half, which catches typos late and early in an id.
+    """
+    column = ApplicantScoreSummary.applicant_id
+    candidates = set()
+    for probe in {text, text.upper()}:
+        prefix = probe[:max(1, len(probe) // 2)]
+        scans = (
+            db.session.query(column).filter(column >= probe).order_by(column).limit(FUZZY_SCAN_WINDOW),
+            db.session.query(column).filter(column < probe).order_by(column.desc()).limit(FUZZY_SCAN_WINDOW),
+            db.session.query(column).filter(column >= prefix, column < prefix + '\uffff')
+                .order_by(column).limit(FUZZY_SCAN_WINDOW),
+        )
+        for scan in scans:
+            candidates.update(row[0] for row in scan)
+    return candidates
+
+def trigram_match_expression(text):
+    """FTS5 query matching applicants that share any selective trigram with the text.
 
-        html = render_template_string("""
+    Trigrams present in a large share of applicants (say "A00" in every id)
+    would make the match touch most of the index, so only the rarer ones are
+    probed, and at least the TRIGRAM_MIN_TERMS rarest.
+    """
+    text = text.strip().lower()
+    grams = sorted({text[i:i + 3] for i in range(len(text) - 2)})
+    if not grams:
+        return ''
+    counts = dict(db.session.execute(
+        db.select(applicant_trigram_vocab.c.term, applicant_trigram_vocab.c.doc)
+        .where(applicant_trigram_vocab.c.term.in_(grams))).all())
+    known = sorted((g for g in grams if g in counts), key=lambda g: counts[g])
+    if not known:
+        return ''
+    # The vocab counts documents of the index, i.e. applicant_info rows
+    limit = max(1, int(db.session.query(func.count(Applicant.id)).scalar() * TRIGRAM_MAX_DOC_SHARE))
+    selected = [g for g in known if counts[g] <= limit]
+    if len(selected) < TRIGRAM_MIN_TERMS:
+        selected = known[:TRIGRAM_MIN_TERMS]
+    return ' OR '.join('"' + g.replace('"', '""') + '"' for g in selected)
+
+def applicant_candidates(text):
+    """(applicant_id, name, role) of evaluated applicants that may match the text"""
+    rows = []
+    match = trigram_match_expression(text) if TRIGRAM_ENABLED else ''
+    if match:
+        ranked = (db.select(applicant_trigram.c.rowid.label('id'), applicant_trigram.c.rank.label('rank'))
+                  .where(applicant_trigram.c.applicant_trigram.op('MATCH')(match))
+                  .order_by(applicant_trigram.c.rank)
+                  .limit(TRIGRAM_CANDIDATES)
+                  .subquery())
+        rows = (db.session.query(Applicant.applicant_id, Applicant.name, Applicant.role)
+                .join(ranked, Applicant.id == ranked.c.id)
+                .join(ApplicantScoreSummary, ApplicantScoreSummary.applicant_id == Applicant.applicant_id)
+                .order_by(ranked.c.rank)
+                .all())
+    if not rows:
+        # Short text or no trigram index: fall back to primary key range scans
+        ids = range_scan_candidates(text.strip())
+        rows = (db.session.query(Applicant.applicant_id, Applicant.name, Applicant.role)
+                .filter(Applicant.applicant_id.in_(ids)).all()) if ids else []
+    return rows
+
+def match_ratio(text, value):
+    """Similarity of the typed text to an id or name, between 0 and 1.
+
+    A prefix beats a substring; otherwise the better of the difflib ratio of
+    the whole value and the mean per-word match, so "pryia pat" still finds
+    "Priya Patel".
+    """
+    value = (value or '').lower()
+    if not value:
+        return 0.0
+    if value.startswith(text):
+        return 1.0
+    if text in value:
+        return 0.9
+    words = value.split()
+
+    def word_ratio(token):
+        return max(1.0 if w.startswith(token) else difflib.SequenceMatcher(None, token, w).ratio() for w in words)
+
+    tokens = text.split()
+    per_word = sum(word_ratio(t) for t in tokens) / len(tokens) if tokens else 0.0
+    return max(difflib.SequenceMatcher(None, text, value).ratio(), 0.85 * per_word)
+
+def find_applicants(text, limit=5, cutoff=FUZZY_CUTOFF):
+    """Ranked (applicant_id, name, role) of evaluated applicants close to the text, best first"""
+    target = text.strip().lower()
+    if not target:
+        return []
+    scored = []
+    for applicant_id, name, role in applicant_candidates(text):
+        ratio = max(match_ratio(target, applicant_id), match_ratio(target, name))
+        if ratio >= cutoff:
+            scored.append((-ratio, applicant_id, name, role))
+    scored.sort()
+    return [(applicant_id, name, role) for _, applicant_id, name, role in scored[:limit]]
+
+def similar_applicant_ids(applicant_id, limit=5):
+    """Ranked "did you mean" ids for an applicant id that has no score summary"""
+    return [aid for aid, _, _ in find_applicants(applicant_id, limit + 1) if aid != applicant_id][:limit]
+
+@app.route('/api/applicant-suggest')
+def api_applicant_suggest():
+    """Typo-tolerant autocomplete over evaluated applicants' ids and names"""
+    text = request.args.get('q', '')
+    limit = max(1, min(request.args.get('limit', SUGGEST_LIMIT, type=int), 50))
+    return jsonify([{
+        "applicant_id": applicant_id,
+        "name": name,
+        "role": role,
+        "url": url_for('combined_score', id=applicant_id)
+    } for applicant_id, name, role in find_applicants(text, limit, cutoff=0.5)])
+
+APPLICANT_LIST_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>Combined Score Query</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
-  <style>
-    body {
-      background-color: #B3FFFA;
-    }
-    .container {
-      max-width: 900px;
-      margin: 30px auto;
-    }
-    .list-container {
-      background-color: #fff;
-      border-radius: 10px;
-      padding: 20px;
-      box-shadow: 0 2px 15px rgba(0,0,0,0.1);
-    }
-    .list-group-item {
-      transition: transform 0.2s, box-shadow 0.2s;
-      border-left: 3px solid #009688;
-    }
-    .list-group-item:hover {
-      transform: translateY(-2px);
-      box-shadow: 0 5px 10px rgba(0,0,0,0.1);
-    }
-  </style>
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap/bootstrap.min.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap-icons/bootstrap-icons.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/base.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/applicant_list.css') }}">
 </head>
 <body>
   <div class="container">
@@ -2671,15 +3099,16 @@ def combined_score():
       </a>
     </div>
 
-    <div class="mb-4">
+    <form class="mb-4 position-relative" method="get" action="/combined-score">
       <div class="input-group">
-        <input type="text" class="form-control" id="searchInput"
-               placeholder="Search applicant name or ID...">
-        <button class="btn btn-outline-secondary" type="button">
+        <input type="text" class="form-control" id="searchInput" name="q" autocomplete="off"
+               placeholder="Search applicant name or ID..." value="{{ search_query }}">
+        <button class="btn btn-outline-secondary" type="submit">
           <i class="bi bi-search"></i>
         </button>
       </div>
-    </div>
+      <div class="list-group position-absolute w-100 shadow-sm d-none" id="suggestions" style="z-index: 10;"></div>
+    </form>
 
     <div class="list-container">
       <h4 class="mb-4">Select Applicant to View Combined Score</h4>
@@ -2701,182 +3130,40 @@ def combined_score():
         </div>
         {% endfor %}
       </div>
+
+      <div class="mt-3 d-flex justify-content-end">
+        {% if cursor %}
+        <a href="{{ first_page_url }}" class="btn btn-sm btn-outline-secondary">
+          <i class="bi bi-chevron-double-left"></i> First Page
+        </a>
+        {% endif %}
+        {% if next_page_url %}
+        <a href="{{ next_page_url }}" class="btn btn-sm btn-outline-primary ms-2">
+          Next Page <i class="bi bi-chevron-right"></i>
+        </a>
+        {% endif %}
+      </div>
     </div>
   </div>
 
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-  <script>
-    // Search functionality
-    document.getElementById('searchInput').addEventListener('keyup', function() {
-      const searchText = this.value.toLowerCase();
-      const items = document.querySelectorAll('#applicantListGroup .list-group-item');
-
-      items.forEach(item => {
-        const text = item.textContent.toLowerCase();
-        if (text.includes(searchText)) {
-          item.style.display = '';
-        } else {
-          item.style.display = 'none';
-        }
-      });
-    });
-  </script>
+  <script src="{{ asset_url('vendor/bootstrap/bootstrap.bundle.min.js') }}"></script>
+  <script src="{{ asset_url('js/applicant_suggest.js') }}"></script>
 </body>
 </html>
-""", apps=all_applicants)
-
-        return html
-
-    # 调试信息
-    print(f"Looking for applicant ID: '{applicant_id}'")
-    all_evals = Evaluation.query.all()
-    print(f"Total evaluations in system: {len(all_evals)}")
-    print(f"All applicant IDs: {[e.applicant_id for e in all_evals]}")
-
-    # 根据指定ID获取所有评价记录
-    records = Evaluation.query.filter(
-        (Evaluation.applicant_id == applicant_id) | 
-        (Evaluation.applicant_id == str(applicant_id))
-    ).all()
-    
-    if not records:
-        # 尝试查找可能相关的记录
-        possible_matches = Evaluation.query.filter(
-            Evaluation.applicant_id.like(f"%{applicant_id}%")
-        ).all()
-        
-        if possible_matches:
-            potential_ids = set([e.applicant_id for e in possible_matches])
-            return f"""<h3>No exact records found for ID={applicant_id}</h3>
-                    <p>Similar IDs found: {', '.join(potential_ids)}</p>
-                    <p><a href="/evaluations">Return to evaluations list</a></p>"""
-        else:
-            return f"""<h3>No records found for ID={applicant_id}</h3>
-                    <p>Please verify the applicant ID is correct.</p>
-                    <p><a href="/evaluations">Return to evaluations list</a></p>"""
-
-    # 按评委角色分组（这里对 judge_role 做小写处理）
-    ceo_eval = None
-    intern1_eval = None
-    intern2_eval = None
-
-    for r in records:
-        role = r.judge_role.lower() if r.judge_role else ''
-        if role == 'ceo':
-            ceo_eval = r
-        elif role == 'intern1':
-            intern1_eval = r
-        elif role == 'intern2':
-            intern2_eval = r
-
-    # 根据可用评价计算加权和
-    available_evaluations = 0
-    weighted_sum = 0
-    
-    if ceo_eval:
-        weighted_sum += ceo_eval.final_score * 0.5
-        available_evaluations += 0.5
-        
-    if intern1_eval:
-        weighted_sum += intern1_eval.final_score * 0.25
-        available_evaluations += 0.25
-        
-    if intern2_eval:
-        weighted_sum += intern2_eval.final_score * 0.25
-        available_evaluations += 0.25
-    
-    # 归一化计算 combined score
-    combined_score = weighted_sum / available_evaluations if available_evaluations > 0 else 0
-
-    # 获取申请人信息
-    applicant_name = records[0].applicant_name
-    applicant_role = records[0].applicant_role
+"""
+register_template('applicant_list.html', APPLICANT_LIST_TEMPLATE)
 
-    html = render_template_string("""
+COMBINED_SCORE_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>Combined Score - {{ applicant_name }}</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
-  <style>
-    body {
-      background-color: #B3FFFA;
-      font-family: Arial, sans-serif;
-    }
-    .container {
-      max-width: 900px;
-      margin: 30px auto;
-      background-color: #fff;
-      border-radius: 10px;
-      box-shadow: 0 0 20px rgba(0,0,0,0.1);
-      padding: 25px;
-    }
-    .score-card {
-      margin-bottom: 20px;
-      border-radius: 8px;
-      background-color: #f8f9fa;
-      padding: 15px;
-    }
-    .score-value {
-      font-size: 2.5rem;
-      font-weight: bold;
-      color: #198754;
-      text-align: center;
-    }
-    .score-label {
-      text-align: center;
-      color: #6c757d;
-      margin-bottom: 15px;
-    }
-    .score-item {
-      padding: 10px;
-      margin-bottom: 10px;
-      border-radius: 5px;
-      background-color: #fff;
-    }
-    .score-item .label {
-      font-weight: bold;
-    }
-    .score-item .value {
-      float: right;
-      font-weight: bold;
-    }
-    .high {
-      color: #198754;
-    }
-    .medium {
-      color: #fd7e14;
-    }
-    .low {
-      color: #dc3545;
-    }
-    .weight-bar {
-      height: 8px;
-      background-color: #e9ecef;
-      margin-top: 5px;
-      border-radius: 4px;
-      overflow: hidden;
-      display: flex;
-    }
-    .weight-segment {
-      height: 100%;
-    }
-    .weight-ceo {
-      background-color: #0d6efd;
-      width: 50%;
-    }
-    .weight-intern1 {
-      background-color: #6610f2;
-      width: 25%;
-    }
-    .weight-intern2 {
-      background-color: #d63384;
-      width: 25%;
-    }
-  </style>
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap/bootstrap.min.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap-icons/bootstrap-icons.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/base.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/combined_score.css') }}">
 </head>
 <body>
   <div class="container">
@@ -2888,6 +3175,10 @@ def combined_score():
       <a href="/" class="btn btn-outline-primary">Back to Home</a>
     </div>
 
+    {% if debug_evaluation_count is not none %}
+    <div class="alert alert-secondary small">Debug: {{ debug_evaluation_count }} evaluations stored for ID {{ applicant_id }}</div>
+    {% endif %}
+
     <!-- Combined Score Display -->
     <div class="score-card">
       <div class="score-label">Combined Score (Weighted)</div>
@@ -3093,267 +3384,479 @@ def combined_score():
   </div>
 </body>
 </html>
-""", applicant_id=applicant_id, applicant_name=applicant_name, applicant_role=applicant_role,
+"""
+register_template('combined_score.html', COMBINED_SCORE_TEMPLATE)
+
+@app.route('/combined-score')
+@conditional_on_data('evaluation', 'applicant_info')
+def combined_score():
+    # 获取申请人ID
+    applicant_id = request.args.get('id', '')
+
+    if not applicant_id:
+        # 显示所有申请人（按申请人ID分页，服务端搜索）
+        search_query = request.args.get('q', '')
+        query = db.session.query(
+            func.min(Evaluation.applicant_name),
+            Evaluation.applicant_id,
+            func.min(Evaluation.applicant_role)
+        )
+        if search_query:
+            query = search_evaluations(query, search_query)
+
+        cursor = decode_cursor(request.args.get('cursor', ''))
+        if cursor and len(cursor) == 1:
+            query = query.filter(Evaluation.applicant_id > str(cursor[0]))
+
+        query = query.group_by(Evaluation.applicant_id).order_by(Evaluation.applicant_id)
+        all_applicants, next_cursor = fetch_page(query, get_page_size(), lambda row: (row[1],))
+
+        html = render_page('applicant_list.html', apps=all_applicants, search_query=search_query, cursor=cursor,
+       first_page_url=page_url(None), next_page_url=page_url(next_cursor) if next_cursor else None)
+
+        return html
+
+    # 调试信息（?debug=1 时按请求开启，只做索引查询，显示在页面上）
+    debug_evaluation_count = None
+    if debug_requested():
+        debug_evaluation_count = db.session.query(func.count(Evaluation.id)).filter_by(applicant_id=applicant_id).scalar()
+    debug_note = (f"<p><small>Debug: {debug_evaluation_count} evaluations stored for this ID</small></p>"
+                  if debug_evaluation_count is not None else "")
+
+    # 从汇总表读取综合得分（主键查询）
+    summary = db.session.get(ApplicantScoreSummary, applicant_id)
+
+    if not summary:
+        # 尝试查找可能相关的记录（索引范围扫描 + 相似度排序）
+        potential_ids = similar_applicant_ids(applicant_id)
+
+        if potential_ids:
+            links = ', '.join(f'<a href="{url_for("combined_score", id=pid)}">{escape(pid)}</a>' for pid in potential_ids)
+            return f"""<h3>No exact records found for ID={escape(applicant_id)}</h3>
+                    <p>Did you mean: {links}</p>{debug_note}
+                    <p><a href="/evaluations">Return to evaluations list</a></p>"""
+        else:
+            return f"""<h3>No records found for ID={escape(applicant_id)}</h3>
+                    <p>Please verify the applicant ID is correct.</p>{debug_note}
+                    <p><a href="/evaluations">Return to evaluations list</a></p>"""
+
+    # 按评委角色加载计入综合得分的评价记录（主键查询）
+    role_evals = summary.role_evaluations()
+    ceo_eval = role_evals.get('ceo')
+    intern1_eval = role_evals.get('intern1')
+    intern2_eval = role_evals.get('intern2')
+
+    # 归一化后的 combined score 已在保存时计算
+    available_evaluations = summary.weight_total
+    combined_score = summary.combined_score
+
+    # 获取申请人信息
+    record = next(iter(role_evals.values()), None) or Evaluation.query.filter_by(applicant_id=applicant_id).first()
+    applicant_name = record.applicant_name
+    applicant_role = record.applicant_role
+
+    html = render_page('combined_score.html', applicant_id=applicant_id, applicant_name=applicant_name, applicant_role=applicant_role,
        combined_score=combined_score, ceo_eval=ceo_eval, intern1_eval=intern1_eval, intern2_eval=intern2_eval,
-       available_evaluations=available_evaluations)
+       available_evaluations=available_evaluations, debug_evaluation_count=debug_evaluation_count)
 
     return html
 
+# ========== Leaderboard API ==========
+def leaderboard_query(applicant_role=''):
+    """Combined scores of all applicants in one grouped query.
+
+    Each judge role has one current evaluation per applicant, and the weighted
+    sum is normalized by the weights of the roles present.
+    """
+    judge_role = Evaluation.judge_role
+    weight = case(*[(judge_role == role, get_role_weight(role)) for role in JUDGE_ROLES], else_=0)
+
+    role_scores = [func.max(case((judge_role == role, Evaluation.final_score))).label(f'{role}_score')
+                   for role in JUDGE_ROLES]
+    scores = (db.select(
+                Evaluation.applicant_id,
+                func.min(Evaluation.applicant_name).label('applicant_name'),
+                func.min(Evaluation.applicant_role).label('applicant_role'),
+                func.round(func.sum(Evaluation.final_score * weight) / func.sum(weight), 4).label('combined_score'),
+                func.sum(weight).label('weight_total'),
+                *role_scores)
+              .where(judge_role.in_(JUDGE_ROLES))
+              .group_by(Evaluation.applicant_id))
+    if applicant_role:
+        scores = scores.where(Evaluation.applicant_role == applicant_role)
+    scores = scores.subquery()
+
+    # Ties share a rank, both overall and within each position
+    return db.select(
+        scores,
+        func.rank().over(order_by=scores.c.combined_score.desc()).label('rank'),
+        func.rank().over(partition_by=scores.c.applicant_role,
+                         order_by=scores.c.combined_score.desc()).label('role_rank')
+    ).subquery()
+
+@app.route('/api/leaderboard')
+def api_leaderboard():
+    """Ranked combined scores, with optional top-k per position and keyset pagination"""
+    ranked = leaderboard_query(request.args.get('applicant_role', ''))
+    query = db.select(ranked)
+
+    # top=k keeps the best k applicants of each position, including ties at rank k
+    top = request.args.get('top', type=int)
+    if top:
+        query = query.where(ranked.c.role_rank <= top)
+
+    # Pages ordered by score, then applicant ID
+    cursor = decode_cursor(request.args.get('cursor', ''))
+    if cursor and len(cursor) == 2 and isinstance(cursor[1], str):
+        try:
+            score, after_id = float(cursor[0]), cursor[1]
+            query = query.where(or_(ranked.c.combined_score < score,
+                                    and_(ranked.c.combined_score == score, ranked.c.applicant_id > after_id)))
+        except (TypeError, ValueError):
+            pass
+    query = query.order_by(ranked.c.combined_score.desc(), ranked.c.applicant_id)
+
+    page_size = get_page_size()
+    rows = db.session.execute(query.limit(page_size + 1)).mappings().all()
+    next_cursor = None
+    if len(rows) > page_size:
+        last = rows[page_size - 1]
+        next_cursor = encode_cursor(last['combined_score'], last['applicant_id'])
+
+    return jsonify({
+        "items": [{
+            "rank": row['rank'],
+            "role_rank": row['role_rank'],
+            "applicant_id": row['applicant_id'],
+            "applicant_name": row['applicant_name'],
+            "applicant_role": row['applicant_role'],
+            "combined_score": row['combined_score'],
+            "weight_total": row['weight_total'],
+            "scores": {role: row[f'{role}_score'] for role in JUDGE_ROLES}
+        } for row in rows[:page_size]],
+        "next_cursor": next_cursor
+    })
+
 @app.route('/debug-applicant/<applicant_id>')
 def debug_applicant(applicant_id):
-    # Check database for all evaluation records
-    all_evals = Evaluation.query.all()
-    
-    # Query with multiple approaches
-    exact_matches = Evaluation.query.filter_by(applicant_id=applicant_id).all()
-    string_matches = Evaluation.query.filter_by(applicant_id=str(applicant_id)).all()
-    like_matches = Evaluation.query.filter(Evaluation.applicant_id.like(f"%{applicant_id}%")).all()
-    
+    # Indexed counts only; the full record list is replaced by a bounded sample
+    total = db.session.query(func.count(Evaluation.id)).scalar()
+    exact_matches = (Evaluation.query.filter_by(applicant_id=applicant_id)
+                     .order_by(Evaluation.id).limit(DEBUG_SAMPLE_SIZE).all())
+    exact_count = db.session.query(func.count(Evaluation.id)).filter_by(applicant_id=applicant_id).scalar()
+    revision_count = (db.session.query(func.count(EvaluationRevision.id))
+                      .join(Evaluation, Evaluation.id == EvaluationRevision.evaluation_id)
+                      .filter(Evaluation.applicant_id == applicant_id).scalar())
+    summary = db.session.get(ApplicantScoreSummary, applicant_id)
+    similar_ids = similar_applicant_ids(applicant_id)
+
     output = f"""
-    <h2>Debug Information for Applicant ID: {applicant_id}</h2>
-    <p>Total evaluations in database: {len(all_evals)}</p>
-    <p>Exact matches found: {len(exact_matches)}</p>
-    <p>String matches found: {len(string_matches)}</p>
-    <p>Partial matches found: {len(like_matches)}</p>
-    
-    <h3>All Applicant IDs in System:</h3>
-    <ul>
+    <h2>Debug Information for Applicant ID: {escape(applicant_id)}</h2>
+    <p>Total evaluations in database: {total}</p>
+    <p>Exact matches found: {exact_count}</p>
+    <p>Superseded revisions: {revision_count}</p>
+    <p>Score summary: {"combined " + format_float(summary.combined_score) + f", {summary.evaluation_count} evaluations" if summary else "none"}</p>
     """
-    
-    for eval in all_evals:
-        output += f"<li>ID: '{eval.applicant_id}' (Type: {type(eval.applicant_id).__name__}) - Judge: {eval.judge_role}, Score: {eval.final_score}</li>"
-    
-    output += "</ul>"
-    
-    if exact_matches or string_matches or like_matches:
+
+    if exact_matches:
         output += "<h3>Matching Records:</h3><ul>"
-        
-        for e in (exact_matches + string_matches + like_matches):
-            if e not in exact_matches:
-                output += f"<li>ID: '{e.applicant_id}' - Judge: {e.judge_role} (NON-EXACT MATCH)</li>"
-            else:
-                output += f"<li>ID: '{e.applicant_id}' - Judge: {e.judge_role}</li>"
-                
+        for e in exact_matches:
+            output += f"<li>ID: '{escape(e.applicant_id)}' - Judge: {escape(e.judge_role)}, Score: {e.final_score}</li>"
         output += "</ul>"
-    
+
+    if similar_ids:
+        output += "<h3>Similar Applicant IDs:</h3><ul>"
+        for pid in similar_ids:
+            output += f'<li><a href="{url_for("debug_applicant", applicant_id=pid)}">{escape(pid)}</a></li>'
+        output += "</ul>"
+
+    # Sampled rows from the whole table, on request
+    if debug_requested():
+        output += f"<h3>Sample of Evaluations (up to {DEBUG_SAMPLE_SIZE}):</h3><ul>"
+        for e in sample_evaluations():
+            output += f"<li>ID: '{escape(e.applicant_id)}' - Judge: {escape(e.judge_role)}, Score: {e.final_score}</li>"
+        output += "</ul>"
+    else:
+        output += f'<p><a href="{url_for("debug_applicant", applicant_id=applicant_id, debug=1)}">Show a sample of all evaluations</a></p>'
+
     return output
 
 
 # API Route: Export Evaluations as CSV
-@app.route('/api/export-evaluations')
-def export_evaluations():
-    try:
-        # Get all evaluation records
-        evals = Evaluation.query.order_by(Evaluation.created_at.desc()).all()
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_HEADERS_ROW = [
+    "ID", "Judge Name", "Judge Role", "Evaluation Date",
+    "Applicant Name", "Applicant ID", "Position", "University", "Email",
+    "Resume Score", "Video Score", "Motivation Score", "Final Score",
+    "Decision", "Position Weight (Hard/Soft Skills)", "Notes"
+]
+
+def export_row(e, applicant):
+    """Build one CSV row for an evaluation record"""
+    university = getattr(applicant, 'university', '') if applicant else ''
+    email = getattr(applicant, 'email', '') if applicant else ''
+
+    # Format date
+    eval_date = e.evaluation_date.strftime('%Y-%m-%d') if e.evaluation_date else ""
+
+    # Get position weights
+    weights = get_rubric().for_position(e.applicant_role).split
+    weight_distribution = f"Hard {int(weights['hard'] * 100)}% / Soft {int(weights['soft'] * 100)}%"
+
+    # Clean notes
+    notes = e.notes or ""
+    notes = notes.replace('\n', ' ').replace('\r', ' ')
+
+    return [
+        e.id,
+        e.judge_name or "",
+        e.judge_role or "",
+        eval_date,
+        e.applicant_name or "",
+        e.applicant_id or "",
+        get_position_name_english(e.applicant_role),
+        university or "",
+        email or "",
+        format_float(e.resume_score),
+        format_float(e.video_score),
+        format_float(e.motivation_score),
+        format_float(e.final_score),
+        e.decision or "",
+        weight_distribution,
+        notes
+    ]
 
-        # Get applicant information for each evaluation record
-        applicant_ids = [e.applicant_id for e in evals]
+def generate_evaluations_csv(batch_size=EXPORT_BATCH_SIZE):
+    """Yield the evaluations export as CSV chunks, one batch of rows at a time"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
+
+    # Add BOM for Excel compatibility with UTF-8
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_HEADERS_ROW)
+    yield flush()
+
+    stmt = db.select(Evaluation).order_by(Evaluation.created_at.desc())
+    result = db.session.execute(stmt.execution_options(yield_per=batch_size)).scalars()
+    for partition in result.partitions():
+        # Get applicant information for this batch only
+        applicant_ids = {e.applicant_id for e in partition}
         applicants = {}
         try:
-            applicant_records = Applicant.query.filter(Applicant.applicant_id.in_(applicant_ids)).all()
-            for app in applicant_records:
-                applicants[app.applicant_id] = app
+            for a in Applicant.query.filter(Applicant.applicant_id.in_(applicant_ids)):
+                applicants[a.applicant_id] = a
         except:
             # Handle gracefully if Applicant table doesn't exist or query fails
             pass
 
-        # Set response headers for proper encoding and file download
+        for e in partition:
+            writer.writerow(export_row(e, applicants.get(e.applicant_id)))
+        yield flush()
+
+@app.route('/api/export-evaluations')
+@conditional_on_data('evaluation', 'applicant_info')
+def export_evaluations():
+    # Rows are queried while the body streams, so a failure can only cut the
+    # download short and is logged by the WSGI server
+    headers = {
+        'Content-Disposition': f'attachment; filename="sertie_evaluations_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    }
+    return Response(stream_with_context(generate_evaluations_csv()),
+                    content_type='text/csv; charset=utf-8',
+                    headers=headers)
+
+# API Route: Per-criterion statistics
+@app.route('/api/criteria-stats')
+def criteria_stats():
+    """Per-criterion score aggregates, optionally filtered, as JSON or CSV"""
+    query = db.session.query(
+        EvaluationRating.criterion_id,
+        EvaluationRating.type,
+        func.count(EvaluationRating.score),
+        func.avg(EvaluationRating.score),
+        func.min(EvaluationRating.score),
+        func.max(EvaluationRating.score)
+    )
+
+    rating_type = request.args.get('type', '')
+    if rating_type:
+        query = query.filter(EvaluationRating.type == rating_type)
+    min_score = request.args.get('min_score', type=float)
+    if min_score is not None:
+        query = query.filter(EvaluationRating.score >= min_score)
+
+    # Filters on the evaluation itself need the join
+    evaluation_filters = {field: request.args.get(field, '') for field in EVALUATION_FILTER_FIELDS}
+    if any(evaluation_filters.values()):
+        query = query.join(Evaluation, Evaluation.id == EvaluationRating.evaluation_id)
+        for field, value in evaluation_filters.items():
+            if value:
+                query = query.filter(getattr(Evaluation, field) == value)
+
+    rows = query.group_by(EvaluationRating.criterion_id, EvaluationRating.type).order_by(
+        EvaluationRating.type, EvaluationRating.criterion_id).all()
+    rubric = get_rubric()
+
+    if request.args.get('format') == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        buffer.write("\ufeff")
+        writer.writerow(["Criterion", "Label", "Type", "Ratings", "Average Score", "Min Score", "Max Score"])
+        for criterion_id, section, count, avg, low, high in rows:
+            writer.writerow([criterion_id, rubric.label(criterion_id), section, count,
+                             format_float(avg), format_float(low), format_float(high)])
         headers = {
-            'Content-Type': 'text/csv; charset=utf-8',
-            'Content-Disposition': f'attachment; filename="sertie_evaluations_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+            'Content-Disposition': f'attachment; filename="sertie_criteria_stats_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
         }
-        
-        # Add BOM for Excel compatibility with UTF-8
-        csv_data = "\ufeff"
-        
-        # Define headers
-        headers_row = [
-            "ID", "Judge Name", "Judge Role", "Evaluation Date", 
-            "Applicant Name", "Applicant ID", "Position", "University", "Email",
-            "Resume Score", "Video Score", "Motivation Score", "Final Score", 
-            "Decision", "Position Weight (Hard/Soft Skills)", "Notes"
-        ]
-        
-        csv_data += ",".join(headers_row) + "\n"
-        
-        # Process each evaluation record
-        for e in evals:
-            # Get applicant information
-            applicant = applicants.get(e.applicant_id, None)
-            university = getattr(applicant, 'university', '') if applicant else ''
-            email = getattr(applicant, 'email', '') if applicant else ''
-            
-            # Format date
-            eval_date = e.evaluation_date.strftime('%Y-%m-%d') if e.evaluation_date else ""
-            
-            # Get position weights
-            position = e.applicant_role
-            weights = get_role_weights_for_export(position)
-            weight_distribution = f"Hard {int(weights['hard'] * 100)}% / Soft {int(weights['soft'] * 100)}%"
-            
-            # Clean and escape notes
-            notes = e.notes or ""
-            notes = notes.replace('\n', ' ').replace('\r', ' ')
-            
-            # Prepare row data with proper CSV escaping
-            row_data = [
-                escape_csv_field(str(e.id)),
-                escape_csv_field(e.judge_name),
-                escape_csv_field(e.judge_role),
-                escape_csv_field(eval_date),
-                escape_csv_field(e.applicant_name),
-                escape_csv_field(e.applicant_id),
-                escape_csv_field(get_position_name_english(e.applicant_role)),
-                escape_csv_field(university),
-                escape_csv_field(email),
-                format_float(e.resume_score),
-                format_float(e.video_score),
-                format_float(e.motivation_score),
-                format_float(e.final_score),
-                escape_csv_field(e.decision),
-                escape_csv_field(weight_distribution),
-                escape_csv_field(notes)
-            ]
-            
-            csv_data += ",".join(row_data) + "\n"
-            
-        return csv_data, 200, headers
-        
-    except Exception as e:
-        import traceback
-        error_traceback = traceback.format_exc()
-        return jsonify({
-            "error": f"Export failed: {str(e)}",
-            "details": error_traceback
-        }), 500
-
-# Helper function for CSV field escaping
-def escape_csv_field(value):
-    """Properly escape a value for CSV inclusion"""
-    if value is None:
-        return '""'
-    
-    value = str(value)
-    if ',' in value or '"' in value or '\n' in value or '\r' in value:
-        # Escape quotes by doubling them and wrap in quotes
-        return '"' + value.replace('"', '""') + '"'
-    return value
+        return Response(buffer.getvalue(), content_type='text/csv; charset=utf-8', headers=headers)
+
+    return jsonify([{
+        "criterion_id": criterion_id,
+        "label": rubric.label(criterion_id),
+        "type": section,
+        "count": count,
+        "avg_score": round(avg, 2) if avg is not None else None,
+        "min_score": low,
+        "max_score": high
+    } for criterion_id, section, count, avg, low, high in rows])
+
+# ========== Concurrency Stress Check ==========
+@app.cli.command('stress-test')
+@click.option('--writers', default=3, help='Concurrent threads posting to /api/save-rating')
+@click.option('--readers', default=3, help='Concurrent threads reading /evaluations')
+@click.option('--requests', 'per_thread', default=20, help='Requests per thread')
+def stress_test_command(writers, readers, per_thread):
+    """Post ratings and read /evaluations concurrently and report lock errors.
+
+    Writes STRESS-* applicants and removes them afterwards; point
+    SERTIE_DATABASE_URI at a scratch copy when running against live data.
+    """
+    errors = []
+    lock = threading.Lock()
+
+    def writer(n):
+        client = app.test_client()
+        for i in range(per_thread):
+            response = client.post('/api/save-rating', json={
+                'judge_name': 'Stress Test',
+                'judge_role': JUDGE_ROLES[i % len(JUDGE_ROLES)],
+                'applicant_name': f'Stress {n}-{i}',
+                'applicant_id': f'STRESS-{n}-{i % 5}',
+                'applicant_role': 'research-analyst',
+                'resume_score': 3, 'video_score': 3, 'motivation_score': 3, 'final_score': 3,
+                'decision': 'waitlist',
+                'resume_ratings': {'resume_technical': {'score': 3, 'weight': 10}},
+                'video_ratings': {'content_understanding': {'score': 3, 'weight': 12.5}},
+            })
+            if response.status_code != 200:
+                with lock:
+                    errors.append(f"save-rating {response.status_code}: {response.get_data(as_text=True)[:200]}")
+
+    def reader(n):
+        client = app.test_client()
+        for i in range(per_thread):
+            response = client.get('/evaluations')
+            if response.status_code != 200:
+                with lock:
+                    errors.append(f"evaluations {response.status_code}")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    threads += [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    # Remove the stress test records
+    with app.app_context():
+        stress_ids = db.select(Evaluation.id).where(Evaluation.applicant_id.like('STRESS-%'))
+        EvaluationRating.query.filter(EvaluationRating.evaluation_id.in_(stress_ids)).delete(synchronize_session=False)
+        EvaluationRevision.query.filter(EvaluationRevision.evaluation_id.in_(stress_ids)).delete(synchronize_session=False)
+        Evaluation.query.filter(Evaluation.applicant_id.like('STRESS-%')).delete(synchronize_session=False)
+        ApplicantScoreSummary.query.filter(ApplicantScoreSummary.applicant_id.like('STRESS-%')).delete(synchronize_session=False)
+        Applicant.query.filter(Applicant.applicant_id.like('STRESS-%')).delete(synchronize_session=False)
+        db.session.commit()
+
+    lock_errors = [e for e in errors if 'locked' in e]
+    click.echo(f"{(writers + readers) * per_thread} requests in {elapsed:.2f}s, "
+               f"{len(errors)} errors, {len(lock_errors)} 'database is locked'")
+    for e in errors[:10]:
+        click.echo(f"  {e}")
+    if errors:
+        raise SystemExit(1)
+
+# ========== Template Benchmark ==========
+def template_bench_contexts():
+    """Representative render contexts for each registered page template"""
+    now = datetime.now()
+    sample = Evaluation(
+        id=1, judge_name="Irene Veng", judge_role="ceo", evaluation_date=now,
+        applicant_name="Sample Applicant", applicant_id="S-001", applicant_role="research-analyst",
+        resume_score=3.8, video_score=4.1, motivation_score=4.0, final_score=4.0,
+        decision="advance", notes="Strong research background.\nClear video.", created_at=now
+    )
+    ratings = {"resume_technical": {"score": 4, "weight": 6.4}, "resume_experience": {"score": 3, "weight": 4.3}}
+    return {
+        'index.html': dict(applicant_count=120, evaluation_count=300, avg_score="3.7", acceptance_rate=35),
+        'rating.html': dict(judge_role="ceo", judge_name="Irene Veng", applicant=None, rubric_url="/api/rubric?v=1",
+                            sections=get_rubric().sections),
+        'evaluations.html': dict(evals=[sample] * 50, judge_roles=[("ceo",)], decisions=[("advance",)],
+                                 applicant_roles=[("research-analyst",)], request=request, applicant_info={},
+                                 cursor=None, first_page_url="/evaluations", next_page_url=None),
+        'applicant_list.html': dict(apps=[("Sample Applicant", "S-001", "research-analyst")] * 50, search_query="",
+                                    cursor=None, first_page_url="/combined-score", next_page_url=None),
+        'combined_score.html': dict(applicant_id="S-001", applicant_name="Sample Applicant",
+                                    applicant_role="research-analyst", combined_score=4.0, ceo_eval=sample,
+                                    intern1_eval=sample, intern2_eval=None, available_evaluations=0.75,
+                                    debug_evaluation_count=None),
+        'evaluation.html': dict(evaluation=sample, applicant=None, resume_ratings=ratings, video_ratings=ratings,
+                                labels=get_rubric().default.labels, revisions=[], sections=get_rubric().sections),
+    }
+
+@app.cli.command('bench-templates')
+@click.option('--iterations', default=50, help='Renders per template and mode')
+def bench_templates_command(iterations):
+    """Compare per-request render time of render_template_string against the compiled registry"""
+    sources = {
+        'index.html': INDEX_TEMPLATE,
+        'rating.html': RATING_TEMPLATE,
+        'evaluations.html': EVALUATIONS_TEMPLATE,
+        'applicant_list.html': APPLICANT_LIST_TEMPLATE,
+        'combined_score.html': COMBINED_SCORE_TEMPLATE,
+        'evaluation.html': EVALUATION_TEMPLATE,
+    }
+    with app.test_request_context('/'):
+        contexts = template_bench_contexts()
+        click.echo(f"{'Template':<22}{'string (ms)':>14}{'compiled (ms)':>16}{'speed-up':>10}")
+        for name, source in sources.items():
+            context = contexts[name]
+            before = timeit.timeit(lambda: render_template_string(source, **context), number=iterations)
+            after = timeit.timeit(lambda: render_page(name, **context), number=iterations)
+            before_ms = before / iterations * 1000
+            after_ms = after / iterations * 1000
+            click.echo(f"{name:<22}{before_ms:>14.2f}{after_ms:>16.2f}{before_ms / after_ms:>9.1f}x")
 
 # ========== View Individual Evaluation ==========
-@app.route('/evaluation/<int:eval_id>')
-def view_evaluation(eval_id):
-    # Get the evaluation record
-    evaluation = Evaluation.query.get_or_404(eval_id)
-    
-    # Try to get applicant info
-    applicant = None
-    try:
-        applicant = Applicant.query.filter_by(applicant_id=evaluation.applicant_id).first()
-    except:
-        pass
-    
-    # Parse ratings JSON
-    resume_ratings = {}
-    video_ratings = {}
-    
-    try:
-        if evaluation.resume_ratings:
-            resume_ratings = json.loads(evaluation.resume_ratings)
-    except:
-        pass
-        
-    try:
-        if evaluation.video_ratings:
-            video_ratings = json.loads(evaluation.video_ratings)
-    except:
-        pass
-    
-    html = render_template_string("""
+EVALUATION_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>Evaluation Details - {{ evaluation.id }}</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
-  <style>
-    body {
-      background-color: #B3FFFA;
-    }
-    .container {
-      max-width: 900px;
-      margin: 30px auto;
-      background-color: #fff;
-      border-radius: 10px;
-      box-shadow: 0 0 20px rgba(0,0,0,0.1);
-      padding: 25px;
-    }
-    .section-title {
-      border-bottom: 2px solid #eee;
-      padding-bottom: 10px;
-      margin-bottom: 20px;
-      color: #009688;
-    }
-    .info-card {
-      background-color: #f8f9fa;
-      border-radius: 8px;
-      padding: 15px;
-      margin-bottom: 20px;
-    }
-    .info-item {
-      margin-bottom: 10px;
-    }
-    .info-label {
-      font-weight: bold;
-      color: #555;
-    }
-    .score-card {
-      background-color: #f8f9fa;
-      border-radius: 8px;
-      padding: 15px;
-      margin-bottom: 20px;
-    }
-    .score-item {
-      display: flex;
-      justify-content: space-between;
-      margin-bottom: 10px;
-      padding: 8px 0;
-      border-bottom: 1px dashed #ddd;
-    }
-    .score-item:last-child {
-      border-bottom: none;
-    }
-    .star-display {
-      color: #FFC107;
-    }
-    .decision {
-      display: inline-block;
-      padding: 5px 15px;
-      border-radius: 20px;
-      font-weight: bold;
-      text-transform: uppercase;
-    }
-    .decision-advance {
-      background-color: #d4edda;
-      color: #155724;
-    }
-    .decision-waitlist {
-      background-color: #fff3cd;
-      color: #856404;
-    }
-    .decision-reject {
-      background-color: #f8d7da;
-      color: #721c24;
-    }
-    .final-score {
-      font-size: 2.5rem;
-      font-weight: bold;
-      text-align: center;
-      color: #009688;
-      margin: 20px 0;
-    }
-  </style>
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap/bootstrap.min.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('vendor/bootstrap-icons/bootstrap-icons.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/base.css') }}">
+  <link rel="stylesheet" href="{{ asset_url('css/evaluation.css') }}">
 </head>
 <body>
   <div class="container">
@@ -3422,7 +3925,7 @@ def view_evaluation(eval_id):
     <h3 class="section-title">Scores Overview</h3>
     <div class="final-score">
       <i class="bi bi-award"></i> Final Score: {{ "%.1f"|format(evaluation.final_score) }}
-      <div class="text-muted fs-6">Resume (40%) + Video (50%) + Motivation (10%)</div>
+      <div class="text-muted fs-6">Resume ({{ sections.resume|percent }}) + Video ({{ sections.video|percent }}) + Motivation ({{ sections.motivation|percent }})</div>
     </div>
 
     <div class="row mb-4">
@@ -3461,7 +3964,7 @@ def view_evaluation(eval_id):
           {% if resume_ratings %}
             {% for key, value in resume_ratings.items() %}
             <div class="score-item">
-              <span>{{ key|replace('_', ' ')|capitalize }}</span>
+              <span>{{ labels.get(key) or key|replace('_', ' ')|capitalize }}</span>
               <span class="star-display">
                 {% set score = value.score if value is mapping else value %}
                 {% for i in range(score|int) %}★{% endfor %}
@@ -3483,7 +3986,7 @@ def view_evaluation(eval_id):
           {% if video_ratings %}
             {% for key, value in video_ratings.items() %}
             <div class="score-item">
-              <span>{{ key|replace('_', ' ')|capitalize }}</span>
+              <span>{{ labels.get(key) or key|replace('_', ' ')|capitalize }}</span>
               <span class="star-display">
                 {% set score = value.score if value is mapping else value %}
                 {% for i in range(score|int) %}★{% endfor %}
@@ -3509,12 +4012,65 @@ def view_evaluation(eval_id):
     </div>
     {% endif %}
 
+    <!-- Earlier versions of this evaluation -->
+    {% if revisions %}
+    <h3 class="section-title">Revision History</h3>
+    <div class="card mb-4">
+      <div class="card-body p-0">
+        <table class="table table-sm mb-0">
+          <thead>
+            <tr><th>Submitted</th><th>Judge</th><th>Resume</th><th>Video</th><th>Final</th><th>Decision</th></tr>
+          </thead>
+          <tbody>
+            {% for r in revisions %}
+            <tr>
+              <td>{{ r.created_at.strftime('%Y-%m-%d %H:%M') if r.created_at else '' }}</td>
+              <td>{{ r.judge_name or '' }}</td>
+              <td>{{ "%.1f"|format(r.resume_score) }}</td>
+              <td>{{ "%.1f"|format(r.video_score) }}</td>
+              <td>{{ "%.1f"|format(r.final_score) }}</td>
+              <td>{{ r.decision }}</td>
+            </tr>
+            {% endfor %}
+          </tbody>
+        </table>
+      </div>
+    </div>
+    {% endif %}
+
   </div>
 
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
+  <script src="{{ asset_url('vendor/bootstrap/bootstrap.bundle.min.js') }}"></script>
 </body>
 </html>
-""", evaluation=evaluation, applicant=applicant, resume_ratings=resume_ratings, video_ratings=video_ratings)
+"""
+register_template('evaluation.html', EVALUATION_TEMPLATE)
+
+@app.route('/evaluation/<int:eval_id>')
+@conditional_on_data('evaluation', 'applicant_info')
+def view_evaluation(eval_id):
+    # Get the evaluation record
+    evaluation = Evaluation.query.get_or_404(eval_id)
+    
+    # Try to get applicant info
+    applicant = None
+    try:
+        applicant = Applicant.query.filter_by(applicant_id=evaluation.applicant_id).first()
+    except:
+        pass
+    
+    # Load per-criterion ratings
+    resume_ratings, video_ratings = get_evaluation_ratings(evaluation.id)
+    
+    # Superseded versions, newest first
+    revisions = (EvaluationRevision.query.filter_by(evaluation_id=evaluation.id)
+                 .order_by(EvaluationRevision.id.desc()).all())
+
+    # Client-scored evaluations (no rubric version) used the current blend
+    rubric = get_rubric(evaluation.rubric_version or CURRENT_RUBRIC_VERSION)
+    labels = rubric.for_position(evaluation.applicant_role).labels
+    html = render_page('evaluation.html', evaluation=evaluation, applicant=applicant, resume_ratings=resume_ratings, video_ratings=video_ratings, labels=labels, revisions=revisions,
+                       sections=rubric.sections)
 
     return html
 
@@ -3527,6 +4083,8 @@ def update_applicant_status(applicant_id, action):
         return "Invalid action", 400
         
     try:
+        begin_write_transaction()
+
         # Find the applicant
         applicant = Applicant.query.filter_by(applicant_id=applicant_id).first()
         
@@ -3535,7 +4093,6 @@ def update_applicant_status(applicant_id, action):
             
         # Update status
         applicant.status = action
-        db.session.commit()
         
         # Create a new evaluation for CEO (if not exists)
         existing_ceo_eval = Evaluation.query.filter_by(
@@ -3565,7 +4122,11 @@ def update_applicant_status(applicant_id, action):
             )
             
             db.session.add(new_eval)
-            db.session.commit()
+            db.session.flush()
+            apply_evaluation_to_summary(new_eval)
+
+        # Status change and consensus evaluation commit together
+        db.session.commit()
         
         # Redirect to combined score page
         return redirect(f"/combined-score?id={applicant_id}")
@@ -3574,6 +4135,30 @@ def update_applicant_status(applicant_id, action):
         db.session.rollback()
         return f"Error updating applicant status: {str(e)}", 500
     
+# Initialize database
+with app.app_context():
+    # db.drop_all()  # Commented out to prevent data loss on restart
+    db.create_all()
+    ensure_columns()
+    # Move rating blobs saved before the evaluation_rating table existed
+    migrate_rating_blobs()
+    # Older databases may hold several evaluations per judge role; merge them before the unique index
+    merged = merge_duplicate_evaluations()
+    ensure_indexes()
+    ensure_dashboard_stats()
+    ensure_evaluation_filter_values()
+    ensure_data_change_triggers()
+    FTS_ENABLED = ensure_evaluation_fts()
+    TRIGRAM_ENABLED = ensure_applicant_trigram_index()
+    vendor_mismatches = [name for name, reason in unverified_vendor_assets().items() if reason == 'hash mismatch']
+    if vendor_mismatches:
+        app.logger.warning("Vendored assets do not match their pinned hashes and are served from the CDN: %s; "
+                           "re-run `flask vendor-assets`", ', '.join(vendor_mismatches))
+    # Backfill the score summary for evaluations saved before it existed
+    if merged or (not db.session.query(ApplicantScoreSummary.applicant_id).first()
+                  and db.session.query(Evaluation.id).first()):
+        rebuild_applicant_score_summaries()
+
 # ========== Main Execution ==========
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
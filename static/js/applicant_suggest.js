@@ -0,0 +1,36 @@
+// Suggest applicants while typing; tolerant of typos in ids and names
+const searchInput = document.getElementById('searchInput');
+const suggestions = document.getElementById('suggestions');
+let suggestTimer = null;
+let suggestRequest = 0;
+
+searchInput.addEventListener('input', () => {
+  clearTimeout(suggestTimer);
+  const text = searchInput.value.trim();
+  if (!text) {
+    suggestions.classList.add('d-none');
+    return;
+  }
+  suggestTimer = setTimeout(() => {
+    const requestId = ++suggestRequest;
+    fetch('/api/applicant-suggest?q=' + encodeURIComponent(text))
+      .then(res => res.json())
+      .then(items => {
+        if (requestId !== suggestRequest) return;  // A newer keystroke won
+        suggestions.replaceChildren(...items.map(item => {
+          const link = document.createElement('a');
+          link.href = item.url;
+          link.className = 'list-group-item list-group-item-action';
+          link.textContent = `${item.name} (${item.applicant_id})`;
+          return link;
+        }));
+        suggestions.classList.toggle('d-none', items.length === 0);
+      });
+  }, 150);
+});
+
+document.addEventListener('click', e => {
+  if (!suggestions.contains(e.target) && e.target !== searchInput) {
+    suggestions.classList.add('d-none');
+  }
+});
@@ -0,0 +1,60 @@
+document.addEventListener('DOMContentLoaded', function() {
+  // Find the export button
+  const exportBtn = document.getElementById('exportBtn');
+
+  if (exportBtn) {
+    // Add click event handler
+    exportBtn.addEventListener('click', function() {
+      // Show loading state
+      exportBtn.disabled = true;
+      exportBtn.innerHTML = '<span class="spinner-border spinner-border-sm" role="status" aria-hidden="true"></span> Exporting...';
+
+      // Make fetch request to export API
+      fetch('/api/export-evaluations')
+        .then(response => {
+          // Check if response is OK
+          if (!response.ok) {
+            throw new Error('Export failed, status code: ' + response.status);
+          }
+
+          // Get filename from Content-Disposition header if available
+          let filename = 'evaluations.csv';
+          const contentDisposition = response.headers.get('Content-Disposition');
+          if (contentDisposition) {
+            const filenameMatch = contentDisposition.match(/filename="(.+?)"/);
+            if (filenameMatch && filenameMatch[1]) {
+              filename = filenameMatch[1];
+            }
+          }
+
+          // Convert response to blob
+          return response.blob().then(blob => {
+            // Create download link
+            const url = window.URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.style.display = 'none';
+            a.href = url;
+            a.download = filename;
+
+            // Append to body, trigger click, then remove
+            document.body.appendChild(a);
+            a.click();
+            window.URL.revokeObjectURL(url);
+
+            // Reset button state
+            exportBtn.disabled = false;
+            exportBtn.innerHTML = '<i class="bi bi-download"></i> Export Data';
+          });
+        })
+        .catch(error => {
+          // Reset button state
+          exportBtn.disabled = false;
+          exportBtn.innerHTML = '<i class="bi bi-download"></i> Export Data';
+
+          // Show error
+          alert('Export failed: ' + error.message);
+          console.error('Export error:', error);
+        });
+    });
+  }
+});
@@ -0,0 +1,1193 @@
+  // Idempotency key for this form's submission; a new evaluation gets a new key
+  function newSaveKey() {
+    return window.crypto && crypto.randomUUID ? crypto.randomUUID()
+      : Date.now().toString(36) + Math.random().toString(36).slice(2);
+  }
+  let saveKey = newSaveKey();
+
+  // Criteria and weights come from the server's rubric registry
+  let RUBRIC = null;
+  const rubricReady = fetch(document.currentScript.dataset.rubricUrl)
+    .then(response => response.json())
+    .then(data => { RUBRIC = data; });
+
+  document.addEventListener('DOMContentLoaded', () => {
+    // Set default date
+    document.getElementById('evaluation-date').valueAsDate = new Date();
+
+    // Fill in applicant details passed with the page
+    applyApplicantPrefill();
+
+    // Check if a position is already selected, apply scoring framework immediately if so
+    rubricReady.then(() => {
+      const position = document.getElementById('applying-role').value;
+      if (position) {
+        buildResumeCriteria();
+        buildVideoCriteria();
+        applyRoleWeights();
+        updateScores();
+      }
+    });
+
+    // Update assessment criteria when position changes
+    document.getElementById('applying-role').addEventListener('change', function() {
+      rubricReady.then(() => {
+        updateResumeCriteria();      // Update resume criteria
+        rebuildVideoCriteria();      // Rebuild video criteria
+        applyRoleWeights();          // Apply position-specific weights
+        updateScores();              // Update scores
+      });
+    });
+
+    // Initialize star ratings
+    initializeStarRatings();
+
+    // Initialize progress saving
+    initProgressSaving();
+
+    // Reset button
+    document.getElementById('resetBtn').addEventListener('click', () => {
+      if(!confirm('Are you sure you want to reset all evaluation data?')) return;
+
+      document.getElementById('applicant-name').value = '';
+      document.getElementById('applicant-id').value = '';
+      document.getElementById('applying-role').selectedIndex = 0;
+      document.getElementById('resume-score').value = '';
+      document.getElementById('applicant-university').value = '';
+      document.getElementById('applicant-email').value = '';
+
+      document.querySelectorAll('.video-score, .resume-score, .motivation-score').forEach(inp => {
+        inp.value = '0';
+      });
+
+      document.querySelectorAll('.star-rating span').forEach(star => {
+        star.classList.remove('selected');
+        star.style.color = '#ccc';
+      });
+
+      document.getElementById('decision').selectedIndex = 0;
+      document.getElementById('notes').value = '';
+      saveKey = newSaveKey();
+
+      updateScores();
+    });
+
+    // Save evaluation
+    document.getElementById('saveBtn').addEventListener('click', () => {
+      const saveBtn = document.getElementById('saveBtn');
+      if (saveBtn.disabled) return;
+
+      // Input validation
+      const requiredFields = [
+        { id: 'applicant-name', name: 'Applicant Name' },
+        { id: 'applicant-id', name: 'Applicant ID' },
+        { id: 'applying-role', name: 'Position Applied' },
+        { id: 'resume-score', name: 'Resume Score' },
+        { id: 'decision', name: 'Decision' }
+      ];
+
+      let missingFields = [];
+      requiredFields.forEach(field => {
+        const value = document.getElementById(field.id).value;
+        if (!value) missingFields.push(field.name);
+      });
+
+      if (missingFields.length > 0) {
+        alert('Please complete the following required fields: ' + missingFields.join(', '));
+        return;
+      }
+
+      // Collect data
+      const judgeName = document.getElementById('judge-name').value || '';
+      const judgeRole = document.getElementById('judge-role').value || '';
+      const dateVal = document.getElementById('evaluation-date').value;
+      const applicantName = document.getElementById('applicant-name').value || '';
+      const applicantId = document.getElementById('applicant-id').value || '';
+      const applicantRole = document.getElementById('applying-role').value || '';
+      const applicantUniversity = document.getElementById('applicant-university').value || '';
+      const applicantEmail = document.getElementById('applicant-email').value || '';
+      const resumeScore = parseFloat(document.getElementById('resume-score').value) || 0;
+      const videoScore = parseFloat(document.getElementById('video-display').textContent) || 0;
+      const motivationScore = parseFloat(document.getElementById('motivation-display').textContent) || 0;
+      const finalScore = parseFloat(document.getElementById('final-score').textContent) || 0;
+      const decision = document.getElementById('decision').value || '';
+      const notes = document.getElementById('notes').value || '';
+
+      if (applicantEmail && !applicantEmail.includes('@')) {
+      　alert('Please enter a valid email address');
+      　return;
+      }
+
+      // Collect video ratings
+      const videoRatings = {};
+      document.querySelectorAll('.video-score').forEach(inp => {
+        if(inp.id){
+          videoRatings[inp.id] = {
+            score: parseFloat(inp.value) || 0,
+            weight: parseFloat(inp.dataset.weight) || 0
+          };
+        }
+      });
+
+      // Collect resume ratings
+      const resumeRatings = {};
+      document.querySelectorAll('.resume-score').forEach(inp => {
+        if(inp.id){
+          resumeRatings[inp.id] = {
+            score: parseFloat(inp.value) || 0,
+            weight: parseFloat(inp.dataset.weight) || 0
+          };
+        }
+      });
+
+      // Collect motivation rating (ensure it's only collected once); its weight comes from the rubric
+      const motivationInput = document.querySelector('.motivation-score');
+      if (motivationInput) {
+        videoRatings[motivationInput.id] = {
+          score: parseFloat(motivationInput.value) || 0,
+          weight: parseFloat(motivationInput.dataset.weight) || 0
+        };
+      }
+
+      const payload = {
+        judge_name: judgeName,
+        judge_role: judgeRole,
+        evaluation_date: dateVal,
+        applicant_name: applicantName,
+        applicant_id: applicantId,
+        applicant_role: applicantRole,
+        applicant_university: applicantUniversity,
+        applicant_email: applicantEmail,
+        resume_score: resumeScore.toFixed(1),
+        resume_ratings: resumeRatings,
+        video_score: videoScore.toFixed(1),
+        video_ratings: videoRatings,
+        motivation_score: motivationScore.toFixed(1),
+        final_score: finalScore.toFixed(1),
+        decision: decision,
+        notes: notes
+      };
+
+      // Submit data; retries of this form reuse its key, so the server saves it only once
+      saveBtn.disabled = true;
+      fetch('/api/save-rating', {
+        method: 'POST',
+        headers: {'Content-Type':'application/json', 'Idempotency-Key': saveKey},
+        body: JSON.stringify(payload)
+      })
+      .then(res => res.json())
+      .then(data => {
+        if(data.error){
+          saveBtn.disabled = false;
+          alert('Save failed: ' + data.error);
+        } else {
+          alert('Evaluation saved successfully! Record ID: ' + data.evaluation_id);
+
+          // Redirect or clear form
+          if (confirm('Would you like to evaluate another applicant?')) {
+            // Reset form data directly without additional confirmation
+            document.getElementById('applicant-name').value = '';
+            document.getElementById('applicant-id').value = '';
+            document.getElementById('applicant-university').value = '';
+            document.getElementById('applicant-email').value = '';
+            document.getElementById('applying-role').selectedIndex = 0;
+            document.getElementById('resume-score').value = '';
+
+            document.querySelectorAll('.video-score, .resume-score, .motivation-score').forEach(inp => {
+              inp.value = '0';
+            });
+
+            document.querySelectorAll('.star-rating span').forEach(star => {
+              star.classList.remove('selected');
+              star.style.color = '#ccc';
+            });
+
+            document.getElementById('decision').selectedIndex = 0;
+            document.getElementById('notes').value = '';
+
+            // Clear saved progress
+            sessionStorage.removeItem('evaluation-progress');
+
+            // Redirect to home page
+            window.location.href = '/';
+          } else {
+            window.location.href = '/evaluations';
+          }
+        }
+      })
+      .catch(error => {
+        saveBtn.disabled = false;
+        alert('An error occurred during save: ' + error);
+      });
+    });
+
+    // Set default weights
+    setTimeout(() => {
+      document.querySelectorAll('.video-score').forEach(input => {
+        if (!input.hasAttribute('data-base-weight')) {
+          input.setAttribute('data-base-weight', input.dataset.weight);
+        }
+      });
+
+      // If position is selected, create video evaluation section
+      const position = document.getElementById('applying-role').value;
+      if (position && RUBRIC) {
+        buildResumeCriteria();
+        buildVideoCriteria();
+        applyRoleWeights();
+      }
+    }, 500);
+
+    // Add skill type explanations
+    setTimeout(addSkillTypeHelp, 1000);
+  });    
+
+
+
+
+  // --- Helper Functions ---
+// Applicant details are sent as a JSON island so the page markup stays the same for every applicant
+function applyApplicantPrefill() {
+  const island = document.getElementById('applicant-prefill');
+  if (!island) return;
+  const applicant = JSON.parse(island.textContent || '{}');
+  setFieldValue('applicant-name', applicant.name);
+  setFieldValue('applicant-university', applicant.university);
+  setFieldValue('applicant-email', applicant.email);
+  setFieldValue('applicant-id', applicant.applicant_id);
+}
+// If more complex logic is needed later, expand these functions
+function updateResumeCriteria() {
+  buildResumeCriteria();
+}
+function buildResumeCriteria() {
+  applyRoleWeights();
+}
+
+
+
+
+
+  // Star rating functionality
+  function initializeStarRatings() {
+    const starGroups = document.querySelectorAll('.star-rating');
+    starGroups.forEach(group => {
+      let currentScore = 0;
+      const stars = group.querySelectorAll('span');
+      const targetId = group.dataset.target;
+      const hiddenInput = document.getElementById(targetId);
+
+      group.addEventListener('mouseover', e => {
+        if(e.target.dataset.value){
+          highlightStars(stars, e.target.dataset.value);
+        }
+      });
+
+      group.addEventListener('mouseout', () => {
+        highlightStars(stars, currentScore);
+      });
+
+      group.addEventListener('click', e => {
+        if(e.target.dataset.value){
+          currentScore = parseInt(e.target.dataset.value);
+          hiddenInput.value = currentScore;
+          highlightStars(stars, currentScore);
+          updateScores();
+        }
+      });
+    });
+  }
+
+  function highlightStars(stars, score){
+    stars.forEach(star => {
+      const val = parseInt(star.dataset.value);
+      star.style.color = (val <= score) ? '#FFC107' : '#ccc';
+      if(val <= score){
+        star.classList.add('selected');
+      } else {
+        star.classList.remove('selected');
+      }
+    });
+  }
+
+  // Rubric entry for a position, falling back to the balanced default
+  function getPositionRubric(position) {
+    return RUBRIC.positions[position] || RUBRIC.default;
+  }
+
+  // Share of the final score for a section ('resume', 'video' or 'motivation'), as a percentage label
+  function sectionPercent(section) {
+    return `${Math.round(RUBRIC.sections[section] * 100)}%`;
+  }
+
+  // Get resume evaluation criteria (a copy, callers may adjust it)
+  function getResumeVCCriteria(position) {
+    return structuredClone(getPositionRubric(position).resume);
+  }
+
+  // Get video evaluation criteria
+  function getVideoVCCriteria(position) {
+    return structuredClone(getPositionRubric(position).video);
+  }
+
+  // Get weight factors for each position
+  function getRoleWeights(position) {
+    return getPositionRubric(position).split;
+  }
+
+  // Build resume evaluation section
+  function buildResumeCriteria() {
+    const position = document.getElementById('applying-role').value;
+    const container = document.getElementById('resume-criteria-container');
+
+    if (!position) {
+      container.innerHTML = '<p class="text-muted">Please select a position first to display relevant criteria</p>';
+      return;
+    }
+
+    // Get position weights
+    const weights = getRoleWeights(position);
+    const hardWeight = weights.hard * 100;
+    const softWeight = weights.soft * 100;
+
+    // Get evaluation criteria
+    const criteria = getResumeVCCriteria(position);
+
+    // Build HTML
+    let html = `
+      <div class="alert alert-info">
+        <i class="bi bi-info-circle"></i> <strong>${getPositionName(position)}</strong>
+        Weight Distribution: Hard Skills ${hardWeight}% / Soft Skills ${softWeight}%
+      </div>
+    `;
+
+    // Scoring reference
+    html += `
+      <div class="mb-3 small text-muted">
+        <strong>Scoring Reference:</strong>
+        <span class="badge bg-danger">1★</span> Does not meet requirements
+        <span class="badge bg-warning text-dark">2★</span> Meets basic requirements
+        <span class="badge bg-primary">3★</span> Meets expectations
+        <span class="badge bg-info">4★</span> Exceeds expectations
+        <span class="badge bg-success">5★</span> Outstanding performance
+      </div>
+    `;
+
+    // Build each evaluation item
+    criteria.forEach(group => {
+      html += `<div class="criteria-section"><div class="criteria-title">${group.title}</div>`;
+
+      group.items.forEach(item => {
+        const itemType = item.type === "hard" ? "Hard Skill" : "Soft Skill";
+        const typeClass = item.type === "hard" ? "badge bg-danger" : "badge bg-success";
+
+        html += `
+          <div class="sub-criteria">
+            <div>
+              <label>${item.label} <span class="weight">${item.weight}%</span></label>
+              <span class="${typeClass} ms-2">${itemType}</span>
+              <div class="small text-muted">${item.description}</div>
+            </div>
+            <div class="star-rating" data-target="${item.id}">
+              <span data-value="1" title="Does not meet requirements">&#9733;</span>
+              <span data-value="2" title="Meets basic requirements">&#9733;</span>
+              <span data-value="3" title="Meets expectations">&#9733;</span>
+              <span data-value="4" title="Exceeds expectations">&#9733;</span>
+              <span data-value="5" title="Outstanding performance">&#9733;</span>
+            </div>
+            <input type="hidden" class="resume-score"
+                   data-weight="${item.weight}"
+                   data-type="${item.type}"
+                   id="${item.id}" value="0">
+          </div>
+        `;
+      });
+
+      html += '</div>';
+    });
+
+    container.innerHTML = html;
+    initializeStarRatings();
+  }
+
+  // Build video evaluation section
+  function buildVideoCriteria() {
+    const position = document.getElementById('applying-role').value;
+    if (!position) return;
+
+    // Get video evaluation section container
+    const videoSection = document.querySelector('#step3 .form-section');
+    if (!videoSection) return;
+
+    // Get position weights
+    const weights = getRoleWeights(position);
+    const hardWeight = weights.hard * 100;
+    const softWeight = weights.soft * 100;
+
+    // Video evaluation criteria
+    const criteria = getVideoVCCriteria(position);
+
+    // Build HTML
+    let html = `
+      <h4><i class="bi bi-camera-video"></i> Video Evaluation</h4>
+      <p class="text-muted mb-3">Rate the applicant's video performance on the following criteria (1-5 stars).</p>
+
+      <div class="alert alert-info">
+        <i class="bi bi-info-circle"></i> <strong>${getPositionName(position)}</strong>
+        Weight Distribution: Hard Skills ${hardWeight}% / Soft Skills ${softWeight}%
+      </div>
+
+      <div class="mb-3 small text-muted">
+        <strong>Scoring Reference:</strong>
+        <span class="badge bg-danger">1★</span> Does not meet requirements
+        <span class="badge bg-warning text-dark">2★</span> Meets basic requirements
+        <span class="badge bg-primary">3★</span> Meets expectations
+        <span class="badge bg-info">4★</span> Exceeds expectations
+        <span class="badge bg-success">5★</span> Outstanding performance
+      </div>
+    `;
+
+    // Build evaluation items
+    criteria.forEach(group => {
+      html += `<div class="criteria-section"><div class="criteria-title">${group.title}</div>`;
+
+      group.items.forEach(item => {
+        const itemType = item.type === "hard" ? "Hard Skill" : "Soft Skill";
+        const typeClass = item.type === "hard" ? "badge bg-danger" : "badge bg-success";
+
+        html += `
+          <div class="sub-criteria">
+            <div>
+              <label>${item.label} <span class="weight">${item.weight}%</span></label>
+              <span class="${typeClass} ms-2">${itemType}</span>
+              <div class="small text-muted">${item.description}</div>
+            </div>
+            <div class="star-rating" data-target="${item.id}">
+              <span data-value="1" title="Does not meet requirements">&#9733;</span>
+              <span data-value="2" title="Meets basic requirements">&#9733;</span>
+              <span data-value="3" title="Meets expectations">&#9733;</span>
+              <span data-value="4" title="Exceeds expectations">&#9733;</span>
+              <span data-value="5" title="Outstanding performance">&#9733;</span>
+            </div>
+            <input type="hidden" class="video-score"
+                   data-weight="${item.weight}"
+                   data-type="${item.type}"
+                   id="${item.id}" value="0">
+          </div>
+        `;
+      });
+
+      html += '</div>';
+    });
+
+    // Add detailed score display section
+    html += `
+      <div class="row mb-4">
+        <div class="col-md-4">
+          <div class="score-display">
+            <div class="fw-bold">Hard Skills Score</div>
+            <div id="hard-skills-display" class="fs-4">0.0</div>
+          </div>
+        </div>
+        <div class="col-md-4">
+          <div class="score-display">
+            <div class="fw-bold">Soft Skills Score</div>
+            <div id="soft-skills-display" class="fs-4">0.0</div>
+          </div>
+        </div>
+        <div class="col-md-4">
+          <div class="score-display">
+            <div class="fw-bold">Video Total</div>
+            <div id="video-total-display" class="fs-4">0.0</div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    // Set container content
+    videoSection.innerHTML = html;
+
+    // Remove existing motivation section (if any)
+    const existingMotivationSection = document.getElementById('motivation-section');
+    if (existingMotivationSection) {
+      existingMotivationSection.remove();
+    }
+
+    // Add motivation assessment section
+    const motivation = getPositionRubric(position).motivation;
+    const motivationHtml = `
+      <div class="form-section" id="motivation-section">
+        <h4><i class="bi bi-heart"></i> Motivation Assessment (${sectionPercent('motivation')})</h4>
+        <p class="text-muted mb-3">
+          Please assess the applicant's enthusiasm and fit for the position (1-5 stars).
+        </p>
+
+        <div class="sub-criteria">
+          <div>
+            <label>${motivation.label} <span class="weight">${motivation.weight}%</span></label>
+            <div class="small text-muted">${motivation.description}</div>
+          </div>
+          <div class="star-rating" data-target="${motivation.id}">
+            <span data-value="1" title="Does not meet requirements">&#9733;</span>
+            <span data-value="2" title="Meets basic requirements">&#9733;</span>
+            <span data-value="3" title="Meets expectations">&#9733;</span>
+            <span data-value="4" title="Exceeds expectations">&#9733;</span>
+            <span data-value="5" title="Outstanding performance">&#9733;</span>
+          </div>
+          <input type="hidden" id="${motivation.id}" class="motivation-score" data-weight="${motivation.weight}" value="0">
+        </div>
+
+        <!-- Add motivation score display -->
+        <div class="row mt-4">
+          <div class="col-md-6 mx-auto">
+            <div class="score-display text-center">
+              <div class="fw-bold">Motivation Score</div>
+              <div id="motivation-total-display" class="fs-4">0.0</div>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    // Add motivation assessment section
+    videoSection.insertAdjacentHTML('afterend', motivationHtml);
+
+    // Initialize star ratings
+    initializeStarRatings();
+  }
+
+
+
+  // New function: Rebuild video evaluation section when position changes
+  function rebuildVideoCriteria() {
+    // Clear current video evaluation section
+    const videoSection = document.querySelector('#step3 .form-section');
+    if (videoSection) {
+      videoSection.innerHTML = '';
+    }
+
+    // Remove current motivation assessment section (if exists)
+    const motivationSection = document.getElementById('motivation-section');
+    if (motivationSection) {
+      motivationSection.remove();
+    }
+
+    // Rebuild video evaluation section
+    buildVideoCriteria();
+
+    // Reinitialize star ratings
+    initializeStarRatings();
+  }
+
+  // Apply position-specific weights
+  function applyRoleWeights() {
+    const position = document.getElementById('applying-role').value;
+    if (!position) return;
+
+    // Get position-specific weights
+    const weights = getRoleWeights(position);
+
+    // Apply to resume evaluation
+    applyWeightsToType('.resume-score', weights);
+
+    // Apply to video evaluation
+    applyWeightsToType('.video-score', weights);
+  }
+
+  // Apply weights by type
+  function applyWeightsToType(selector, weights) {
+    // Store original weights (if not already stored)
+    document.querySelectorAll(selector).forEach(input => {
+      if (!input.hasAttribute('data-base-weight')) {
+        input.setAttribute('data-base-weight', input.dataset.weight);
+      }
+    });
+
+    // Section share of the final score, from the rubric
+    const sectionWeight = RUBRIC.sections[selector.includes('resume') ? 'resume' : 'video'];
+
+    // Calculate hard skills original total weight
+    let hardTotalBaseWeight = 0;
+    document.querySelectorAll(`${selector}[data-type="hard"]`).forEach(input => {
+      hardTotalBaseWeight += parseFloat(input.getAttribute('data-base-weight') || 0);
+    });
+
+    // Calculate soft skills original total weight
+    let softTotalBaseWeight = 0;
+    document.querySelectorAll(`${selector}[data-type="soft"]`).forEach(input => {
+      softTotalBaseWeight += parseFloat(input.getAttribute('data-base-weight') || 0);
+    });
+
+    // Apply hard skills weight
+    if (hardTotalBaseWeight > 0) {
+      const hardMultiplier = sectionWeight * weights.hard / hardTotalBaseWeight;
+      document.querySelectorAll(`${selector}[data-type="hard"]`).forEach(input => {
+        const baseWeight = parseFloat(input.getAttribute('data-base-weight') || 0);
+        const adjustedWeight = baseWeight * hardMultiplier;
+        input.dataset.weight = adjustedWeight.toFixed(2);
+
+        // Update UI display
+        const weightSpan = input.closest('.sub-criteria')?.querySelector('.weight');
+        if (weightSpan) {
+          weightSpan.textContent = `${adjustedWeight.toFixed(2)}%`;
+        }
+      });
+    }
+
+    // Apply soft skills weight
+    if (softTotalBaseWeight > 0) {
+      const softMultiplier = sectionWeight * weights.soft / softTotalBaseWeight;
+      document.querySelectorAll(`${selector}[data-type="soft"]`).forEach(input => {
+        const baseWeight = parseFloat(input.getAttribute('data-base-weight') || 0);
+        const adjustedWeight = baseWeight * softMultiplier;
+        input.dataset.weight = adjustedWeight.toFixed(2);
+
+        // Update UI display
+        const weightSpan = input.closest('.sub-criteria')?.querySelector('.weight');
+        if (weightSpan) {
+          weightSpan.textContent = `${adjustedWeight.toFixed(2)}%`;
+        }
+      });
+    }
+  }
+
+  // Calculate scores
+  function updateScores() {
+    // Section weights come from the rubric; score once it has loaded
+    if (!RUBRIC) {
+      rubricReady.then(updateScores);
+      return;
+    }
+
+    // Calculate resume hard skills score
+    let resumeHardWeightedSum = 0;
+    let resumeHardTotalWeight = 0;
+    document.querySelectorAll('.resume-score[data-type="hard"]').forEach(input => {
+      const score = parseFloat(input.value) || 0;
+      const weight = parseFloat(input.dataset.weight) || 0;
+      resumeHardWeightedSum += score * weight;
+      resumeHardTotalWeight += weight;
+    });
+
+    // Calculate resume soft skills score
+    let resumeSoftWeightedSum = 0;
+    let resumeSoftTotalWeight = 0;
+    document.querySelectorAll('.resume-score[data-type="soft"]').forEach(input => {
+      const score = parseFloat(input.value) || 0;
+      const weight = parseFloat(input.dataset.weight) || 0;
+      resumeSoftWeightedSum += score * weight;
+      resumeSoftTotalWeight += weight;
+    });
+
+    // Calculate video hard skills score
+    let videoHardWeightedSum = 0;
+    let videoHardTotalWeight = 0;
+    document.querySelectorAll('.video-score[data-type="hard"]').forEach(input => {
+      const score = parseFloat(input.value) || 0;
+      const weight = parseFloat(input.dataset.weight) || 0;
+      videoHardWeightedSum += score * weight;
+      videoHardTotalWeight += weight;
+    });
+
+    // Calculate video soft skills score
+    let videoSoftWeightedSum = 0;
+    let videoSoftTotalWeight = 0;
+    document.querySelectorAll('.video-score[data-type="soft"]').forEach(input => {
+      const score = parseFloat(input.value) || 0;
+      const weight = parseFloat(input.dataset.weight) || 0;
+      videoSoftWeightedSum += score * weight;
+      videoSoftTotalWeight += weight;
+    });
+
+    // Calculate totals
+    const resumeTotalWeight = resumeHardTotalWeight + resumeSoftTotalWeight;
+    const resumeAvg = resumeTotalWeight > 0 ?
+      (resumeHardWeightedSum + resumeSoftWeightedSum) / resumeTotalWeight * 10 : 0;
+
+    const videoTotalWeight = videoHardTotalWeight + videoSoftTotalWeight;
+    const videoAvg = videoTotalWeight > 0 ?
+      (videoHardWeightedSum + videoSoftWeightedSum) / videoTotalWeight * 10 : 0;
+
+    // Calculate hard and soft skills averages
+    const hardSkillsAvg = (videoHardTotalWeight > 0) ?
+      (videoHardWeightedSum / videoHardTotalWeight * 5) : 0; // 0-5 scale
+    const softSkillsAvg = (videoSoftTotalWeight > 0) ?
+      (videoSoftWeightedSum / videoSoftTotalWeight * 5) : 0; // 0-5 scale
+
+    // Calculate content quality and presentation skills
+    // Find all content quality related ratings
+    let contentQualitySum = 0;
+    let contentQualityCount = 0;
+    document.querySelectorAll('.video-score[id^="content_"]').forEach(input => {
+      const score = parseFloat(input.value) || 0;
+      if (score > 0) {
+        contentQualitySum += score;
+        contentQualityCount++;
+      }
+    });
+
+    // Find all presentation skills related ratings
+    let presentationSkillsSum = 0;
+    let presentationSkillsCount = 0;
+    document.querySelectorAll('.video-score[id^="presentation_"]').forEach(input => {
+      const score = parseFloat(input.value) || 0;
+      if (score > 0) {
+        presentationSkillsSum += score;
+        presentationSkillsCount++;
+      }
+    });
+
+    // Calculate averages
+    const contentQualityAvg = contentQualityCount > 0 ? contentQualitySum / contentQualityCount : 0;
+    const presentationSkillsAvg = presentationSkillsCount > 0 ? presentationSkillsSum / presentationSkillsCount : 0;
+
+    // Update resume score display
+    document.getElementById('resume-display').textContent = (resumeAvg / 10).toFixed(1);
+    document.getElementById('resume-score').value = (resumeAvg / 10).toFixed(1);
+
+    // Update hard/soft skills score display
+    const hardSkillsDisplay = document.getElementById('hard-skills-display');
+    const softSkillsDisplay = document.getElementById('soft-skills-display');
+    const videoTotalDisplay = document.getElementById('video-total-display');
+
+    if (hardSkillsDisplay) {
+      hardSkillsDisplay.textContent = hardSkillsAvg.toFixed(1);
+    }
+
+    if (softSkillsDisplay) {
+      softSkillsDisplay.textContent = softSkillsAvg.toFixed(1);
+    }
+
+    if (videoTotalDisplay) {
+      videoTotalDisplay.textContent = (videoAvg / 10).toFixed(1);
+    }
+
+    // Update content quality and presentation skills display
+    const contentScoreDisplay = document.getElementById('content-score-display');
+    const presentationScoreDisplay = document.getElementById('presentation-score-display');
+
+    if (contentScoreDisplay) {
+      contentScoreDisplay.textContent = contentQualityAvg.toFixed(1);
+    }
+
+    if (presentationScoreDisplay) {
+      presentationScoreDisplay.textContent = presentationSkillsAvg.toFixed(1);
+    }
+
+    // Update video score in final page display
+    document.getElementById('video-display').textContent = (videoAvg / 10).toFixed(1);
+
+    // Calculate motivation score - ensure it's only collected once
+    const motivationInput = document.querySelector('.motivation-score');
+    const motivationScore = motivationInput ? (parseFloat(motivationInput.value) || 0) : 0;
+
+    // Update motivation score display
+    document.getElementById('motivation-display').textContent = motivationScore.toFixed(1);
+
+    // Update motivation total display (if exists)
+    const motivationTotalDisplay = document.getElementById('motivation-total-display');
+    if (motivationTotalDisplay) {
+      motivationTotalDisplay.textContent = motivationScore.toFixed(1);
+    }
+
+    // Calculate final weighted score with the rubric's section blend
+    const sections = RUBRIC.sections;
+    const finalScore = ((resumeAvg * sections.resume) + (videoAvg * sections.video) +
+                        (motivationScore * 10 * sections.motivation)) / 10;
+
+    // Update final score
+    const fsElem = document.getElementById('final-score');
+    fsElem.textContent = finalScore.toFixed(1);
+
+    // Update weight description
+    const position = document.getElementById('applying-role').value;
+    if (position) {
+      const weights = getRoleWeights(position);
+
+      // Remove old weight info
+      const oldWeightInfo = document.querySelector('.weight-info');
+      if (oldWeightInfo) {
+        oldWeightInfo.remove();
+      }
+
+      // Add new weight info
+      const weightInfo = document.createElement('div');
+      weightInfo.className = 'text-center text-muted mt-2 mb-3 weight-info';
+      weightInfo.innerHTML = `Based on ${getPositionName(position)} role weights: Hard Skills ${weights.hard*100}% / Soft Skills ${weights.soft*100}%, with Resume(${sectionPercent('resume')}), Video(${sectionPercent('video')}), Motivation(${sectionPercent('motivation')})`;
+
+      if (fsElem.parentNode) {
+        fsElem.parentNode.after(weightInfo);
+      }
+    } 
+
+    // Set color based on score
+    const fsVal = parseFloat(finalScore.toFixed(1));
+    if (fsVal >= 4.5) fsElem.style.color = '#1E8449';
+    else if (fsVal >= 4.0) fsElem.style.color = '#27AE60';
+    else if (fsVal >= 3.5) fsElem.style.color = '#2E86C1';
+    else if (fsVal >= 3.0) fsElem.style.color = '#F39C12';
+    else fsElem.style.color = '#E74C3C';
+
+    // Suggest decision based on score
+    suggestDecision(fsVal);
+  }
+
+
+  // Add scoring guide
+  function addScoringGuide() {
+    const guideContent = `
+      <div class="modal fade" id="scoringGuideModal" tabindex="-1">
+        <div class="modal-dialog modal-lg">
+          <div class="modal-content">
+            <div class="modal-header bg-primary text-white">
+              <h5 class="modal-title">Scoring Guide</h5>
+              <button type="button" class="btn-close" data-bs-dismiss="modal"></button>
+            </div>
+            <div class="modal-body">
+              <h6>Scoring Criteria Explanation</h6>
+              <div class="table-responsive">
+                <table class="table table-bordered">
+                  <thead>
+                    <tr>
+                      <th>Score</th>
+                      <th>Resume Evaluation</th>
+                      <th>Video Evaluation</th>
+                      <th>Motivation Evaluation</th>
+                    </tr>
+                  </thead>
+                  <tbody>
+                    <tr>
+                      <td><span class="badge bg-danger">1★</span> Does not meet requirements</td>
+                      <td>Almost no relevant skills or experience</td>
+                      <td>Shallow product understanding, inadequate analysis</td>
+                      <td>Unclear motivation, lacks position understanding</td>
+                    </tr>
+                    <tr>
+                      <td><span class="badge bg-warning text-dark">2★</span> Meets basic requirements</td>
+                      <td>Basic relevant experience, limited responsibilities</td>
+                      <td>Basic product understanding, somewhat limited analysis</td>
+                      <td>Basic interest, limited position understanding</td>
+                    </tr>
+                    <tr>
+                      <td><span class="badge bg-primary">3★</span> Meets expectations</td>
+                      <td>Relevant academic background, team role experience</td>
+                      <td>Understands core value, offers effective suggestions</td>
+                      <td>Shows clear interest, reasonable position understanding</td>
+                    </tr>
+                    <tr>
+                      <td><span class="badge bg-info">4★</span> Exceeds expectations</td>
+                      <td>Multiple high-quality relevant experiences, clear achievements</td>
+                      <td>Deep product understanding, creative and viable proposals</td>
+                      <td>High alignment, clearly articulates personal fit</td>
+                    </tr>
+                    <tr>
+                      <td><span class="badge bg-success">5★</span> Outstanding performance</td>
+                      <td>Exceptional technical skills, special achievements</td>
+                      <td>Comprehensive analysis, innovative high-ROI solutions</td>
+                      <td>Perfect fit, shows well-thought career planning</td>
+                    </tr>
+                  </tbody>
+                </table>
+              </div>
+
+              <h6 class="mt-4">Position-Specific Assessment Focus</h6>
+              <div class="accordion" id="positionAccordion">
+                <div class="accordion-item">
+                  <h2 class="accordion-header">
+                    <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#financeContent">
+                      Financial Analyst (Hard Skills 70%, Soft Skills 30%)
+                    </button>
+                  </h2>
+                  <div id="financeContent" class="accordion-collapse collapse show" data-bs-parent="#positionAccordion">
+                    <div class="accordion-body">
+                      <p><strong>Hard Skills Focus:</strong> Financial modeling and valuation skills, financial analysis, due diligence and risk assessment</p>
+                      <p><strong>Soft Skills Focus:</strong> Communication with portfolio companies, investment proposal presentation, networking and relationship building</p>
+                    </div>
+                  </div>
+                </div>
+                <div class="accordion-item">
+                  <h2 class="accordion-header">
+                    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#researchContent">
+                      Research Analyst (Hard Skills 40%, Soft Skills 60%)
+                    </button>
+                  </h2>
+                  <div id="researchContent" class="accordion-collapse collapse" data-bs-parent="#positionAccordion">
+                    <div class="accordion-body">
+                      <p><strong>Hard Skills Focus:</strong> Market and industry trend analysis, data analysis, technology assessment and competitive landscape analysis</p>
+                      <p><strong>Soft Skills Focus:</strong> Critical thinking and insight, clear research findings presentation, learning agility for emerging trends</p>
+                    </div>
+                  </div>
+                </div>
+                <div class="accordion-item">
+                  <h2 class="accordion-header">
+                    <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#opsContent">
+                      Operations Analyst (Hard Skills 20%, Soft Skills 80%)
+                    </button>
+                  </h2>
+                  <div id="opsContent" class="accordion-collapse collapse" data-bs-parent="#positionAccordion">
+                    <div class="accordion-body">
+                      <p><strong>Hard Skills Focus:</strong> Business process analysis, KPI development and monitoring, project management and business operations</p>
+                      <p><strong>Soft Skills Focus:</strong> Cross-functional collaboration, stakeholder management, adaptability and problem-solving</p>
+                    </div>
+                  </div>
+                </div>
+              </div>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    // Add to page
+    document.body.insertAdjacentHTML('beforeend', guideContent);
+
+    // Add guide button
+    const header = document.querySelector('.container h1');
+    if (header) {
+      const guideButton = document.createElement('button');
+      guideButton.className = 'btn btn-sm btn-outline-info ms-3';
+      guideButton.innerHTML = '<i class="bi bi-question-circle"></i> Scoring Guide';
+      guideButton.addEventListener('click', () => {
+        new bootstrap.Modal(document.getElementById('scoringGuideModal')).show();
+      });
+      header.insertAdjacentElement('afterend', guideButton);
+    }
+  }
+
+  // Get position name
+  function getPositionName(position) {
+    switch(position) {
+      case 'financial-analyst': return 'Financial Analyst';
+      case 'research-analyst': return 'Research Analyst';
+      case 'operations-analyst': return 'Operations Analyst';
+      default: return 'Applicant';
+    }
+  }
+
+  // Suggest decision based on score
+  function suggestDecision(score) {
+    const decisionSelect = document.getElementById('decision');
+    if (score >= 4.0) {
+      decisionSelect.value = 'advance';
+    } else if (score >= 3.0) {
+      decisionSelect.value = 'waitlist';
+    } else {
+      decisionSelect.value = 'reject';
+    }
+  }
+
+  // Step navigation functions
+  function nextStep(step) {
+    // Form validation
+    if (step === 2) {
+      const applicantName = document.getElementById('applicant-name').value;
+      const applicantId = document.getElementById('applicant-id').value;
+      const applicantRole = document.getElementById('applying-role').value;
+
+      if (!applicantName || !applicantId || !applicantRole) {
+        alert('Please complete all required applicant information before continuing.');
+        return;
+      }
+    }
+
+    if (step === 3) {
+      const resumeScore = document.getElementById('resume-score').value;
+      if (!resumeScore) {
+        alert('Please provide a resume score before continuing.');
+        return;
+      }
+    }
+
+    // Update progress bar
+    const progressBar = document.getElementById('progressBar');
+    progressBar.style.width = (step * 25) + '%';
+
+    // Activate appropriate tab
+    const tabToActivate = document.getElementById('step' + step + '-tab');
+    bootstrap.Tab.getOrCreateInstance(tabToActivate).show();
+  }
+
+  function prevStep(step) {
+    // Update progress bar
+    const progressBar = document.getElementById('progressBar');
+    progressBar.style.width = (step * 25) + '%';
+
+    // Activate appropriate tab
+    const tabToActivate = document.getElementById('step' + step + '-tab');
+    bootstrap.Tab.getOrCreateInstance(tabToActivate).show();
+  }
+
+  // Progress saving functions
+  function initProgressSaving() {
+    // Load saved progress if exists
+    loadSavedProgress();
+
+    // Save progress every 30 seconds
+    setInterval(saveProgress, 30000);
+
+    // Save progress when switching tabs
+    document.querySelectorAll('[data-bs-toggle="pill"]').forEach(tab => {
+      tab.addEventListener('shown.bs.tab', saveProgress);
+    });
+
+    // Add save indicator
+    const container = document.querySelector('.container');
+    const saveIndicator = document.createElement('div');
+    saveIndicator.id = 'save-indicator';
+    saveIndicator.style = 'position: fixed; bottom: 20px; right: 20px; padding: 10px; background: #28a745; color: white; border-radius: 5px; opacity: 0; transition: opacity 0.3s;';
+    saveIndicator.innerHTML = '<i class="bi bi-check-circle"></i> Progress saved';
+    container.appendChild(saveIndicator);
+  }
+
+  function saveProgress() {
+    const formData = {
+      step: getActiveStepIndex(),
+      applicantName: document.getElementById('applicant-name').value,
+      applicantId: document.getElementById('applicant-id').value,
+      applicantRole: document.getElementById('applying-role').value,
+      applicantUniversity: document.getElementById('applicant-university').value,
+      applicantEmail: document.getElementById('applicant-email').value,
+      resumeScore: document.getElementById('resume-score').value,
+      videoScores: collectScores('video-score'),
+      resumeScores: collectScores('resume-score'),
+      motivationScore: document.getElementById('motivation_enthusiasm')?.value,
+      decision: document.getElementById('decision').value,
+      notes: document.getElementById('notes').value
+    };
+
+    sessionStorage.setItem('evaluation-progress', JSON.stringify(formData));
+    showSaveIndicator();
+  }
+
+  function loadSavedProgress() {
+    const savedData = sessionStorage.getItem('evaluation-progress');
+    if (!savedData) return;
+
+    const formData = JSON.parse(savedData);
+
+    // Restore form values
+    setFieldValue('applicant-name', formData.applicantName);
+    setFieldValue('applicant-id', formData.applicantId);
+    setFieldValue('applying-role', formData.applicantRole);
+    setFieldValue('applicant-university', formData.applicantUniversity);
+    setFieldValue('applicant-email', formData.applicantEmail);
+    setFieldValue('resume-score', formData.resumeScore);
+    setFieldValue('decision', formData.decision);
+    setFieldValue('notes', formData.notes);
+
+    // Restore scores
+    restoreScores(formData.videoScores, 'video-score');
+    restoreScores(formData.resumeScores, 'resume-score');
+    setFieldValue('motivation_enthusiasm', formData.motivationScore);
+
+    // Add notification
+    const notice = document.createElement('div');
+    notice.className = 'alert alert-info alert-dismissible fade show';
+    notice.innerHTML = '<i class="bi bi-info-circle"></i> Previous progress has been restored <button type="button" class="btn-close" data-bs-dismiss="alert"></button>';
+    document.querySelector('.container').insertBefore(notice, document.querySelector('.container').firstChild);
+
+    // Update scores and move to last active step
+    setTimeout(() => {
+      updateScores();
+      if (formData.step > 1) {
+        nextStep(formData.step);
+      }
+    }, 500);
+  }
+
+  function showSaveIndicator() {
+    const indicator = document.getElementById('save-indicator');
+    indicator.style.opacity = '1';
+    setTimeout(() => { indicator.style.opacity = '0'; }, 2000);
+  }
+
+  function collectScores(className) {
+    const scores = {};
+    document.querySelectorAll('.' + className).forEach(input => {
+      if (input.id) {
+        scores[input.id] = input.value;
+      }
+    });
+    return scores;
+  }
+
+  function restoreScores(scores, className) {
+    if (!scores) return;
+
+    Object.keys(scores).forEach(id => {
+      const input = document.getElementById(id);
+      if (input) {
+        input.value = scores[id];
+        if (input.className.includes(className)) {
+          const rating = input.closest('.sub-criteria')?.querySelector('.star-rating');
+          if (rating) {
+            const stars = rating.querySelectorAll('span');
+            highlightStars(stars, scores[id]);
+          }
+        }
+      }
+    });
+  }
+
+  function getActiveStepIndex() {
+    const activeTab = document.querySelector('.nav-link.active');
+    return activeTab ? parseInt(activeTab.id.replace('step', '').replace('-tab', '')) : 1;
+  }
+
+  function setFieldValue(id, value) {
+    const field = document.getElementById(id);
+    if (field && value) {
+      field.value = value;
+    }
+  }
+
+  // Add skill type help explanation
+  function addSkillTypeHelp() {
+    // Create help button and add to page
+    const helpIcon = document.createElement('i');
+    helpIcon.className = 'bi bi-question-circle text-info ms-2';
+    helpIcon.style.cursor = 'pointer';
+    helpIcon.title = 'View explanation of Hard vs Soft Skills classification';
+
+    // Help content
+    const helpContent = `
+      <div class="modal fade" id="skillHelpModal" tabindex="-1" aria-hidden="true">
+        <div class="modal-dialog">
+          <div class="modal-content">
+            <div class="modal-header">
+              <h5 class="modal-title">Hard Skills vs Soft Skills Classification</h5>
+              <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+            </div>
+            <div class="modal-body">
+              <h6>Hard Skills Assessment Items:</h6>
+              <ul>
+                <li><strong>Financial Analyst:</strong> Financial modeling and valuation skills, due diligence and risk assessment, financial analysis and investment justification</li>
+                <li><strong>Research Analyst:</strong> Market and industry trend analysis, technology assessment and competitive landscape analysis, data analysis and research methods</li>
+                <li><strong>Operations Analyst:</strong> Business process analysis, KPI development and monitoring, project management and business operations</li>
+              </ul>
+              <h6>Soft Skills Assessment Items:</h6>
+              <ul>
+                <li><strong>Financial Analyst:</strong> Communication with portfolio companies, investment proposal presentation, networking and relationship building</li>
+                <li><strong>Research Analyst:</strong> Critical thinking and insight, clear research findings presentation, learning agility for emerging trends</li>
+                <li><strong>Operations Analyst:</strong> Cross-functional collaboration, stakeholder management, adaptability and problem-solving</li>
+              </ul>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    // Add to page
+    const evalSteps = document.getElementById('evaluationSteps');
+    if (evalSteps) {
+      document.body.insertAdjacentHTML('beforeend', helpContent);
+      const firstTab = evalSteps.querySelector('.nav-link');
+      if (firstTab) {
+        firstTab.insertAdjacentElement('beforeend', helpIcon);
+        helpIcon.addEventListener('click', function(e) {
+          e.preventDefault();
+          new bootstrap.Modal(document.getElementById('skillHelpModal')).show();
+        });
+      }
+    }
+  }
@@ -0,0 +1,161 @@
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+DB_DIR = tempfile.mkdtemp()
+os.environ['SERTIE_DATABASE_URI'] = f"sqlite:///{os.path.join(DB_DIR, 'test.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sertie_enhanced_system as ses  # noqa: E402
+
+# The arithmetic of applyWeightsToType() and updateScores() in static/js/rating.js
+RATING_JS = """
+const {rubric, cases} = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+function sectionAvg(criteria, scores, sectionWeight, split) {
+  const base = {hard: 0, soft: 0};
+  criteria.forEach(c => { base[c.type] += parseFloat(c.weight); });
+  const weights = criteria.map(c =>
+    parseFloat((parseFloat(c.weight) * (sectionWeight * split[c.type] / base[c.type])).toFixed(2)));
+  const sum = {hard: 0, soft: 0}, total = {hard: 0, soft: 0};
+  for (const type of ['hard', 'soft']) {
+    criteria.forEach((c, i) => {
+      if (c.type !== type) return;
+      sum[type] += scores[i] * weights[i];
+      total[type] += weights[i];
+    });
+  }
+  const totalWeight = total.hard + total.soft;
+  return totalWeight > 0 ? (sum.hard + sum.soft) / totalWeight * 10 : 0;
+}
+const out = cases.map(({position, resume, video, motivation}) => {
+  const split = rubric.splits[position];
+  const resumeAvg = sectionAvg(rubric.resume, resume, rubric.sections.resume, split);
+  const videoAvg = sectionAvg(rubric.video, video, rubric.sections.video, split);
+  const s = rubric.sections;
+  const finalScore = ((resumeAvg * s.resume) + (videoAvg * s.video) + (motivation * 10 * s.motivation)) / 10;
+  return [(resumeAvg / 10).toFixed(1), (videoAvg / 10).toFixed(1), motivation.toFixed(1), finalScore.toFixed(1)];
+});
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+@pytest.fixture(scope='module')
+def client():
+    yield ses.app.test_client()
+    shutil.rmtree(DB_DIR, ignore_errors=True)
+
+
+def evaluation_payload(applicant_id, **overrides):
+    payload = {
+        'judge_name': 'ceo', 'judge_role': 'ceo', 'evaluation_date': '2025-03-01',
+        'applicant_name': f'Person {applicant_id}', 'applicant_id': applicant_id,
+        'applicant_role': 'financial-analyst', 'decision': 'advance', 'notes': 'ok',
+        'resume_score': '3.0', 'video_score': '4.0', 'motivation_score': '3', 'final_score': '3.5',
+        'resume_ratings': {'resume_technical': {'score': 4, 'weight': 7}},
+        'video_ratings': {'content_understanding': {'score': 3, 'weight': 8}},
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_to_fixed_rounds_like_javascript():
+    assert ses.to_fixed(0.25) == 0.3
+    assert ses.to_fixed(2.5, 0) == 3.0
+    assert ses.to_fixed(1.005, 2) == 1.0
+    assert ses.to_fixed(-0.25) == -0.3
+
+
+def test_score_batch_numpy_fallback_and_page_agree(monkeypatch):
+    if ses.np is None:
+        pytest.skip('numpy is not installed')
+    rubric = ses.get_rubric(ses.CURRENT_RUBRIC_VERSION)
+    criteria = rubric.default.criteria()
+    split = rubric.resume_count
+    positions = sorted(rubric.positions) + ['']
+    random.seed(11)
+    cases = []
+    for _ in range(2000):
+        cases.append({
+            'position': random.choice(positions),
+            'scores': [random.choice([0, 1, 2, 3, 4, 5, 2.5, 3.5]) for _ in criteria],
+            'motivation': random.choice([0, 1, 2, 3, 4, 5, 2.5, 3.25, 4.75]),
+        })
+    args = ([c['position'] for c in cases], [c['scores'] for c in cases], [c['motivation'] for c in cases])
+
+    vectorized = ses.score_batch(*args)
+    monkeypatch.setattr(ses, 'np', None)
+    looped = ses.score_batch(*args)
+    assert vectorized == looped
+    assert all(isinstance(v, float) for row in looped for v in row)
+
+    if shutil.which('node') is None:
+        pytest.skip('node is not installed')
+    spec = {
+        'sections': dict(rubric.sections),
+        'splits': {p: dict(rubric.for_position(p).split) for p in positions},
+        'resume': [{'weight': c.weight, 'type': c.skill_type} for c in criteria[:split]],
+        'video': [{'weight': c.weight, 'type': c.skill_type} for c in criteria[split:]],
+    }
+    js_cases = [{'position': c['position'], 'resume': c['scores'][:split],
+                 'video': c['scores'][split:], 'motivation': c['motivation']} for c in cases]
+    result = subprocess.run(['node', '-e', RATING_JS], input=json.dumps({'rubric': spec, 'cases': js_cases}),
+                            capture_output=True, text=True, check=True)
+    page = [tuple(float(v) for v in row) for row in json.loads(result.stdout)]
+    assert looped == page
+
+
+def test_save_rating_accepts_null_optional_fields(client):
+    optional = ('notes', 'judge_name', 'applicant_university', 'applicant_email', 'evaluation_date',
+                'motivation_score')
+    response = client.post('/api/save-rating', json=evaluation_payload('N0001', **dict.fromkeys(optional)))
+    assert response.status_code == 200, response.get_json()
+    with ses.app.app_context():
+        evaluation = ses.Evaluation.query.filter_by(applicant_id='N0001').one()
+        assert evaluation.notes == ''
+        assert evaluation.judge_name == ''
+        assert evaluation.motivation_score == 0
+
+
+def test_save_rating_rejects_null_required_fields(client):
+    response = client.post('/api/save-rating', json=evaluation_payload('N0002', applicant_name=None))
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('cursor', ['W1tdLFtdXQ', 'WzEsMl0', 'bm90LWpzb24'])
+def test_leaderboard_ignores_malformed_cursor(client, cursor):
+    first_page = client.get('/api/leaderboard').get_json()
+    response = client.get(f'/api/leaderboard?cursor={cursor}')
+    assert response.status_code == 200
+    assert response.get_json()['items'] == first_page['items']
+
+
+def test_rebuilding_score_summaries_changes_combined_score_etag(client):
+    assert client.post('/api/save-rating', json=evaluation_payload('S0001')).status_code == 200
+    etag = client.get('/combined-score').headers['ETag']
+    assert client.get('/combined-score', headers={'If-None-Match': etag}).status_code == 304
+
+    with ses.app.app_context():
+        ses.rebuild_applicant_score_summaries()
+    assert client.get('/combined-score', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_trigram_share_cutoff_counts_all_applicants(client):
+    if not ses.TRIGRAM_ENABLED:
+        pytest.skip('SQLite has no trigram tokenizer')
+    with ses.app.app_context():
+        # Applicants imported without evaluations have no score summary
+        role = 'financial-analyst'
+        ses.db.session.add_all([ses.Applicant(applicant_id=f'T{i:04d}', name=f'Name {i}', role=role)
+                                for i in range(40)] +
+                               [ses.Applicant(applicant_id=f'ZQ{i}', name='Zephyr Quill', role=role)
+                                for i in range(2)])
+        ses.db.session.commit()
+        grams = ses.trigram_match_expression('zephyr quill').split(' OR ')
+    # Each trigram is in 2 of 40+ applicants, well under the share cutoff
+    assert len(grams) == len('zephyr quill') - 2